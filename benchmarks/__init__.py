@@ -0,0 +1,8 @@
+"""
+Package initialization file. This package contains the performance benchmark suite of the rubiks cube architecture.
+It only depends on the standard library & numpy, so it runs offline:
+
+    python -m benchmarks run --output results.json
+    python -m benchmarks compare baseline.json results.json
+
+"""
@@ -0,0 +1,70 @@
+"""
+This module launches the benchmark suite (see suite.py) from the command line:
+
+    python -m benchmarks run [--backend NAME ...] [--shuffle-sizes N ...] [--output FILE]
+    python -m benchmarks compare BASELINE CURRENT [--threshold FRACTION]
+
+The compare command exits with status 1 if any metric regressed by more than the threshold.
+
+"""
+import argparse
+import json
+import sys
+from benchmarks.suite import SHUFFLE_SIZES, run_suite, compare
+from rubiks_cube.models import get_backend
+
+
+def run(args: argparse.Namespace) -> None:
+    for backend in args.backend:
+        get_backend(backend)
+
+    results = run_suite(tuple(args.backend), tuple(args.shuffle_sizes), lambda name: print(f'Running {name}...', file=sys.stderr))
+    output = json.dumps(results, indent=2)
+    if args.output is None:
+        print(output)
+    else:
+        with open(args.output, 'w') as sink:
+            sink.write(output + '\n')
+
+
+def compare_runs(args: argparse.Namespace) -> None:
+    with open(args.baseline) as source:
+        baseline = json.load(source)
+    with open(args.current) as source:
+        current = json.load(source)
+
+    rows = compare(baseline, current, args.threshold)
+    width = max((len(row[0]) for row in rows), default=0)
+    for name, before, after, change, regressed in rows:
+        flag = 'REGRESSION' if regressed else ''
+        print(f'{name:<{width}}  {before:>14.6g}  {after:>14.6g}  {change:>+8.1%}  {flag}')
+
+    regressions = sum(row[4] for row in rows)
+    threshold = 'per metric' if args.threshold is None else f'{args.threshold:.0%}'
+    print(f'\n{len(rows)} metrics compared, {regressions} regressions (threshold {threshold})')
+    if regressions:
+        sys.exit(1)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='Performance benchmark suite of the rubiks cube architecture.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='Run the benchmarks and print (or save) their results as JSON.')
+    run_parser.add_argument('--backend', nargs='+', default=['object'], help='Cube backends to benchmark (default: object).')
+    run_parser.add_argument('--shuffle-sizes', nargs='+', type=int, default=list(SHUFFLE_SIZES), help='Numbers of operations of the shuffle benchmarks.')
+    run_parser.add_argument('--output', metavar='FILE', help='File the JSON results are written to (default: stdout).')
+    run_parser.set_defaults(func=run)
+
+    compare_parser = commands.add_parser('compare', help='Compare two JSON results and flag regressions.')
+    compare_parser.add_argument('baseline', help='JSON results of the baseline run.')
+    compare_parser.add_argument('current', help='JSON results of the current run.')
+    compare_parser.add_argument('--threshold', type=float, help='Relative slowdown flagged as a regression, for every metric (default: per metric, see suite.METRIC_THRESHOLDS).')
+    compare_parser.set_defaults(func=compare_runs)
+
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    args.func(args)
@@ -0,0 +1,336 @@
+"""
+This module contains the benchmarks of the rubiks cube architecture & the comparison of their results against a stored
+baseline. Every benchmark is run on each requested backend (see backends.py) and produces named metrics:
+
+1. ops_per_sec.<OPERATION>: Operations performed per second, for each of the 16 operations
+2. shuffle.<n> / unshuffle.<n>: Seconds taken to shuffle the cube with n operations & to unshuffle it
+3. reset_perspective: Seconds taken to reset the cube's perspective, averaged over its 24 perspectives
+4. construction: Seconds taken to create a cube
+5. peak_memory: Peak bytes allocated per cube, while creating a batch of cubes
+6. import.<module>: Seconds taken to import a module in a fresh interpreter (not backend specific)
+
+Timings are the median, over several batches, of the best of several repeats (see best_time), to keep the noise of the
+machine out of the results.
+
+"""
+from __future__ import annotations
+import gc
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Callable, NamedTuple, Optional
+from rubiks_cube.constants import Operations as ops
+from rubiks_cube.models import RubiksCube, PERSPECTIVE_ROTATIONS
+
+import numpy as np
+
+SHUFFLE_SIZES = (100, 1000, 100000)
+
+IMPORTED_MODULES = ('rubiks_cube', 'rubiks_cube.models')
+
+# Minimum duration (in seconds) of a timed call of the operations' throughput benchmark
+MIN_CALL_TIME = 0.05
+
+# Relative change in the worse direction above which a metric is flagged as a regression. Identical runs on a shared
+# machine differ by up to ~20% on the timings, so smaller changes can't be told apart from noise.
+REGRESSION_THRESHOLD = 0.25
+
+# Thresholds of the metrics noisier or steadier than the rest, keyed by the end of the metric's name
+METRIC_THRESHOLDS = {
+    'shuffle.100': 0.4,
+    'unshuffle.100': 0.4,
+    'peak_memory': 0.05
+}
+
+
+class Metric(NamedTuple):
+
+    """
+    This is a class representing the result of a benchmark.
+
+    ATTRIBUTES:
+        value: Measured value
+        unit: Unit of the value
+        higher_is_better: Flag indicating if higher values are improvements (e.g. throughputs)
+
+    """
+
+    value: float
+    unit: str
+    higher_is_better: bool = False
+
+
+def best_time(func: Callable[[], object], repeats: int = 5, batches: int = 5, setup: Optional[Callable[[], object]] = None) -> float:
+    """
+    This function times a function over several batches of calls, and returns the median of the shortest time taken in
+    each batch. The shortest time filters out calls slowed down by the machine, and the median filters out batches run
+    while the machine was slower as a whole. The garbage collector is disabled while timing.
+
+    Args:
+        func (Callable[[], object]): Function to be timed
+        repeats (int, optional): Number of calls per batch. Defaults to 5.
+        batches (int, optional): Number of batches. Defaults to 5.
+        setup (Callable[[], object], optional): Function called (untimed) before every call. Defaults to None.
+
+    Returns:
+        float: Median of the shortest time taken per batch (seconds)
+
+    """
+    bests = []
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(batches):
+            best = float('inf')
+            for _ in range(repeats):
+                if setup is not None:
+                    setup()
+                start = time.perf_counter()
+                func()
+                best = min(best, time.perf_counter() - start)
+            bests.append(best)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    return statistics.median(bests)
+
+
+def bench_operations(backend: str, min_call_time: float = MIN_CALL_TIME) -> dict[str, Metric]:
+    """
+    This function measures the throughput of every operation. Each timed call performs the operation as many times as
+    it takes to run for at least min_call_time, so that fast backends aren't timed over calls too short to be stable.
+
+    Args:
+        backend (str): Name of the backend
+        min_call_time (float, optional): Minimum duration of a timed call (seconds). Defaults to MIN_CALL_TIME.
+
+    Returns:
+        dict: Operations per second, keyed by 'ops_per_sec.<OPERATION>'
+
+    """
+    results = {}
+    for op in ops:
+        cube = RubiksCube(backend=backend)
+        num_ops = 100
+
+        def perform() -> None:
+            for _ in range(num_ops):
+                cube.perform(op, unshuffling=True)
+
+        while best_time(perform, repeats=1, batches=1) < min_call_time:
+            num_ops *= 2
+
+        results[f'ops_per_sec.{op.name}'] = Metric(num_ops / best_time(perform, repeats=3), 'ops/s', True)
+
+    return results
+
+
+def bench_shuffle(backend: str, sizes: tuple[int, ...] = SHUFFLE_SIZES) -> dict[str, Metric]:
+    """
+    This function measures the latency of shuffling a cube with a given number of operations & unshuffling it again.
+    Shuffles with more than 10k operations are only timed once.
+
+    Args:
+        backend (str): Name of the backend
+        sizes (tuple[int, ...], optional): Numbers of operations. Defaults to SHUFFLE_SIZES.
+
+    Returns:
+        dict: Seconds taken, keyed by 'shuffle.<n>' & 'unshuffle.<n>'
+
+    """
+    results = {}
+    for size in sizes:
+        cube = RubiksCube(backend=backend)
+        repeats, batches = (5, 5) if size <= 10000 else (1, 1)
+
+        def unshuffle() -> None:
+            if cube.op_stack:
+                cube.unshuffle()
+
+        def shuffle() -> None:
+            cube.shuffle(num_ops=size, seed=size)
+
+        def reshuffle() -> None:
+            unshuffle()
+            shuffle()
+
+        results[f'shuffle.{size}'] = Metric(best_time(shuffle, repeats, batches, setup=unshuffle), 's')
+        results[f'unshuffle.{size}'] = Metric(best_time(unshuffle, repeats, batches, setup=reshuffle), 's')
+
+    return results
+
+
+def bench_reset_perspective(backend: str) -> dict[str, Metric]:
+    """
+    This function measures the average time taken to reset the cube's perspective from each of its 24 perspectives.
+
+    Args:
+        backend (str): Name of the backend
+
+    Returns:
+        dict: Seconds taken, keyed by 'reset_perspective'
+
+    """
+    cube = RubiksCube(backend=backend)
+    total = 0.0
+    for rotations in PERSPECTIVE_ROTATIONS.values():
+
+        def turn(rotations: list[ops] = rotations) -> None:
+            cube.op_stack.clear()
+            for op in rotations:
+                cube.perform(op, unshuffling=True)
+
+        total += best_time(cube.reset_perspective, setup=turn)
+    cube.op_stack.clear()
+
+    return {'reset_perspective': Metric(total / len(PERSPECTIVE_ROTATIONS), 's')}
+
+
+def bench_construction(backend: str, num_cubes: int = 200) -> dict[str, Metric]:
+    """
+    This function measures the time taken to create a cube & the peak memory allocated per cube.
+
+    Args:
+        backend (str): Name of the backend
+        num_cubes (int, optional): Number of cubes created per repeat. Defaults to 200.
+
+    Returns:
+        dict: Seconds taken & bytes allocated per cube, keyed by 'construction' & 'peak_memory'
+
+    """
+    elapsed = best_time(lambda: [RubiksCube(backend=backend) for _ in range(num_cubes)])
+
+    RubiksCube(backend=backend)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        cubes = [RubiksCube(backend=backend) for _ in range(num_cubes)]
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del cubes
+
+    return {
+        'construction': Metric(elapsed / num_cubes, 's'),
+        'peak_memory': Metric(peak / num_cubes, 'bytes')
+    }
+
+
+def bench_imports(modules: tuple[str, ...] = IMPORTED_MODULES, repeats: int = 5) -> dict[str, Metric]:
+    """
+    This function measures the time taken to import each module in a fresh interpreter.
+
+    Args:
+        modules (tuple[str, ...], optional): Names of the modules. Defaults to IMPORTED_MODULES.
+        repeats (int, optional): Number of interpreters started per module. Defaults to 5.
+
+    Returns:
+        dict: Seconds taken, keyed by 'import.<module>'
+
+    """
+    results = {}
+    for module in modules:
+        code = f'import time; start = time.perf_counter(); import {module}; print(time.perf_counter() - start)'
+        timings = [
+            float(subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout)
+            for _ in range(repeats)
+        ]
+        results[f'import.{module}'] = Metric(min(timings), 's')
+
+    return results
+
+
+def run_suite(backends: tuple[str, ...] = ('object',), shuffle_sizes: tuple[int, ...] = SHUFFLE_SIZES, progress: Optional[Callable[[str], None]] = None) -> dict:
+    """
+    This function runs every benchmark on each backend.
+
+    Args:
+        backends (tuple[str, ...], optional): Names of the backends. Defaults to ('object',).
+        shuffle_sizes (tuple[int, ...], optional): Numbers of operations of the shuffle benchmarks. Defaults to SHUFFLE_SIZES.
+        progress (Callable[[str], None], optional): Callable notified with the name of each benchmark before it runs. Defaults to None.
+
+    Returns:
+        dict: JSON serializable results, with the environment they were measured in ('meta') & every metric ('metrics'),
+              keyed by '<backend>.<metric>' (or 'import.<module>')
+
+    """
+    benchmarks: list[tuple[str, Callable[[], dict[str, Metric]]]] = [('import', bench_imports)]
+    for backend in backends:
+        benchmarks += [
+            (f'{backend}.operations', lambda backend=backend: bench_operations(backend)),
+            (f'{backend}.shuffle', lambda backend=backend: bench_shuffle(backend, shuffle_sizes)),
+            (f'{backend}.reset_perspective', lambda backend=backend: bench_reset_perspective(backend)),
+            (f'{backend}.construction', lambda backend=backend: bench_construction(backend))
+        ]
+
+    metrics = {}
+    for name, benchmark in benchmarks:
+        if progress is not None:
+            progress(name)
+        prefix = '' if name == 'import' else f'{name.split(".")[0]}.'
+        for metric, result in benchmark().items():
+            metrics[prefix + metric] = result._asdict()
+
+    return {
+        'meta': {
+            'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'backends': list(backends)
+        },
+        'metrics': metrics
+    }
+
+
+def metric_threshold(name: str) -> float:
+    """
+    This function returns the regression threshold of a metric: its entry of METRIC_THRESHOLDS, or REGRESSION_THRESHOLD.
+
+    Args:
+        name (str): Name of the metric (e.g. 'object.shuffle.100')
+
+    Returns:
+        float: Relative change in the worse direction above which the metric is flagged as a regression
+
+    """
+    for suffix, threshold in METRIC_THRESHOLDS.items():
+        if name == suffix or name.endswith(f'.{suffix}'):
+            return threshold
+
+    return REGRESSION_THRESHOLD
+
+
+def compare(baseline: dict, current: dict, threshold: Optional[float] = None) -> list[tuple[str, float, float, float, bool]]:
+    """
+    This function compares the metrics of two runs of the suite. Metrics missing from either run are skipped.
+
+    Args:
+        baseline (dict): Results of the baseline run (see run_suite)
+        current (dict): Results of the current run
+        threshold (float, optional): Relative change in the worse direction above which a metric is flagged as a
+                                     regression. Defaults to None (each metric's own threshold, see metric_threshold).
+
+    Returns:
+        list[tuple]: Name, baseline value, current value, relative change (positive is better) & regression flag of
+                     every metric found in both runs
+
+    """
+    rows = []
+    for name, before in baseline['metrics'].items():
+        after = current['metrics'].get(name)
+        if after is None or not before['value']:
+            continue
+
+        change = (after['value'] - before['value']) / before['value']
+        if not before['higher_is_better']:
+            change = -change
+        limit = metric_threshold(name) if threshold is None else threshold
+        rows.append((name, before['value'], after['value'], change, change < -limit))
+
+    return rows
@@ -1,11 +1,11 @@
 """
-Package initialization file. This module creates a rubiks-cube object and all the menu options.
+Package initialization file. This module defines the menu options of the command line app. The app's rubiks-cube
+object & the functions behind the main menu options are only created the first time they are accessed (e.g.
+rubiks_cube.cube), so importing the package (or any of its light modules, like constants) doesn't build a cube or
+import numpy.
 """
-from rubiks_cube.models import RubiksCube
 from rubiks_cube.constants import Operations
 
-cube = RubiksCube()
-
 menu_options= [
     'Rotate Cube',
     'Invert Cube',
@@ -15,8 +15,6 @@ menu_options= [
     'Unshuffle Cube'
     ]
 
-menu_options_funcs = [cube.rotate,cube.invert,cube.shift,cube.reset_perspective,cube.shuffle,cube.unshuffle]
-
 rotate_options = [
     'Rotate Down',
     'Rotate Up',
@@ -50,5 +48,28 @@ shift_options_params = [Operations.SHIFT_RIGHT_COL_UP,Operations.SHIFT_RIGHT_COL
 
 shuffle_options = [
     'Random Number of Operations',
-    'Enter Number of Operations'
-    ]
\ No newline at end of file
+    'Enter Number of Operations',
+    'Random State'
+    ]
+
+
+def __getattr__(name: str):
+    """
+    This function lazily creates the command line app's rubiks-cube object (cube) & the functions behind the main menu
+    options (menu_options_funcs) the first time either of them is accessed.
+
+    """
+    if name not in ('cube', 'menu_options_funcs'):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from rubiks_cube.models import RubiksCube
+    from rubiks_cube.events import print_move
+
+    cube = RubiksCube()
+    cube.subscribe(print_move)
+
+    globals().update(
+        cube=cube,
+        menu_options_funcs=[cube.rotate,cube.invert,cube.shift,cube.reset_perspective,cube.shuffle,cube.unshuffle]
+    )
+    return globals()[name]
@@ -0,0 +1,259 @@
+"""
+This module contains the allocation profiler of the rubiks cube architecture. Each operation is performed on a cube
+while tracemalloc traces every memory block allocated, and the blocks are attributed to the innermost function of the
+package that allocated them (e.g. Face.copy or a transformation of transformations.py).
+
+Most of an operation's allocations are temporaries (copied faces, grids...) that are freed before it returns, so they
+wouldn't show in a snapshot taken afterwards. While an operation is profiled, a profile hook keeps the locals & return
+value of every function alive until the snapshot is taken. Since the objects kept alive would themselves trigger garbage
+collections, the collections triggered by the operations are counted with a gc callback in a separate pass, without
+the profile hook.
+
+The report can be printed from the command line:
+
+    python run.py --profile-allocations [BACKEND]
+
+"""
+from __future__ import annotations
+import ast
+import gc
+import os
+import sys
+import tracemalloc
+from functools import lru_cache
+from typing import Iterable, NamedTuple, Optional
+from rubiks_cube.constants import Operations as ops
+from rubiks_cube.models import RubiksCube
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Number of frames stored for each traced block, enough to find the package function behind numpy & copy internals
+TRACEBACK_FRAMES = 32
+
+# Blocks allocated by the profiler itself & by tracemalloc's snapshots, which are left out of the report
+IGNORED_FILES = (os.path.abspath(__file__), tracemalloc.__file__)
+
+UNKNOWN_FUNCTION = '<outside rubiks_cube>'
+
+
+class FunctionAllocations(NamedTuple):
+
+    """
+    This is a class representing the memory allocated by a function during an operation.
+
+    ATTRIBUTES:
+        function: Module & qualified name of the function (e.g. models.Face.copy)
+        blocks: Number of memory blocks allocated
+        size: Number of bytes allocated
+
+    """
+
+    function: str
+    blocks: float
+    size: float
+
+
+class OperationAllocations(NamedTuple):
+
+    """
+    This is a class representing the memory allocated by an operation, averaged over the times it was performed.
+
+    ATTRIBUTES:
+        op: Operation
+        blocks: Number of memory blocks allocated
+        size: Number of bytes allocated
+        collections: Number of garbage collections triggered
+        functions: Allocations of each function, largest first
+
+    """
+
+    op: ops
+    blocks: float
+    size: float
+    collections: float
+    functions: list[FunctionAllocations]
+
+
+@lru_cache(maxsize=None)
+def _function_ranges(filename: str) -> list[tuple[int, int, str]]:
+    """
+    This function returns the line range & qualified name of every function defined in a source file.
+
+    """
+    with open(filename) as source:
+        tree = ast.parse(source.read(), filename)
+
+    ranges = []
+
+    def visit(node: ast.AST, prefix: str) -> None:
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                name = f'{prefix}{child.name}'
+                if not isinstance(child, ast.ClassDef):
+                    start = min([child.lineno] + [decorator.lineno for decorator in child.decorator_list])
+                    ranges.append((start, child.end_lineno or child.lineno, name))
+                visit(child, f'{name}.')
+
+    visit(tree, '')
+    return ranges
+
+
+def function_name(filename: str, lineno: int) -> str:
+    """
+    This function returns the name of the innermost function of the package containing a line of source code.
+
+    Args:
+        filename (str): Path of the source file
+        lineno (int): Line number
+
+    Returns:
+        str: Module & qualified name of the function (e.g. models.Face.copy)
+
+    """
+    module = os.path.splitext(os.path.relpath(filename, PACKAGE_DIR))[0].replace(os.sep, '.')
+    best: Optional[tuple[int, int, str]] = None
+    for start, end, name in _function_ranges(filename):
+        if start <= lineno <= end and (best is None or start >= best[0]):
+            best = (start, end, name)
+
+    return f'{module}.{best[2]}' if best is not None else f'{module}:{lineno}'
+
+
+def _allocating_function(traceback: tracemalloc.Traceback) -> Optional[str]:
+    """
+    This function returns the name of the innermost function of the package in a block's traceback, or None if the
+    block was allocated by the profiler itself.
+
+    """
+    for frame in reversed(traceback):
+        filename = os.path.abspath(frame.filename)
+        if filename in IGNORED_FILES:
+            return None
+        if os.path.dirname(filename) == PACKAGE_DIR:
+            return function_name(filename, frame.lineno)
+
+    return UNKNOWN_FUNCTION
+
+
+def profile_operation(cube: RubiksCube, op: ops, repeats: int = 10) -> OperationAllocations:
+    """
+    This function profiles the memory allocated by an operation (tracemalloc must be tracing). The operation is
+    performed as part of unshuffling, so the cube's operation stack isn't changed. It is performed repeats times to count
+    garbage collections, then repeats more times under the profile hook to trace allocations.
+
+    Args:
+        cube (RubiksCube): Cube instance the operation is performed on
+        op (Operations): Operation to be profiled
+        repeats (int, optional): Number of times the operation is performed. Defaults to 10.
+
+    Returns:
+        OperationAllocations: Allocations of the operation, averaged over the repeats
+
+    """
+    retained: list[object] = []
+    collections = [0]
+
+    def retain(frame, event: str, arg: object) -> None:
+        if event == 'return':
+            retained.append((frame.f_locals, arg))
+
+    def count_collections(phase: str, info: dict) -> None:
+        if phase == 'start':
+            collections[0] += 1
+
+    ignored = [tracemalloc.Filter(False, filename) for filename in IGNORED_FILES]
+
+    gc.collect()
+    gc.callbacks.append(count_collections)
+    try:
+        for _ in range(repeats):
+            cube.perform(op, unshuffling=True)
+    finally:
+        gc.callbacks.remove(count_collections)
+
+    gc.collect()
+    before = tracemalloc.take_snapshot().filter_traces(ignored)
+    sys.setprofile(retain)
+    try:
+        for _ in range(repeats):
+            cube.perform(op, unshuffling=True)
+    finally:
+        sys.setprofile(None)
+    after = tracemalloc.take_snapshot().filter_traces(ignored)
+    retained.clear()
+
+    functions: dict[str, list[int]] = {}
+    for stat in after.compare_to(before, 'traceback'):
+        function = _allocating_function(stat.traceback)
+        if stat.size_diff <= 0 or function is None:
+            continue
+        totals = functions.setdefault(function, [0, 0])
+        totals[0] += stat.count_diff
+        totals[1] += stat.size_diff
+
+    rows = sorted(
+        (FunctionAllocations(name, blocks / repeats, size / repeats) for name, (blocks, size) in functions.items()),
+        key=lambda row: row.size,
+        reverse=True
+    )
+
+    return OperationAllocations(
+        op,
+        sum(row.blocks for row in rows),
+        sum(row.size for row in rows),
+        collections[0] / repeats,
+        rows
+    )
+
+
+def profile_allocations(backend: str = 'object', operations: Optional[Iterable[ops]] = None, repeats: int = 10) -> list[OperationAllocations]:
+    """
+    This function profiles the memory allocated by each operation, on a new cube of the given backend. Every operation
+    is performed once before profiling starts, so that one-off allocations (caches, imports...) aren't reported.
+
+    Args:
+        backend (str, optional): Name of the cube's backend (see RubiksCube.__new__). Defaults to 'object'.
+        operations (Iterable[Operations], optional): Operations to be profiled. Defaults to None (all 16 operations).
+        repeats (int, optional): Number of times each operation is performed. Defaults to 10.
+
+    Returns:
+        list[OperationAllocations]: Allocations of each operation
+
+    """
+    operations = list(ops) if operations is None else list(operations)
+    cube = RubiksCube(backend=backend)
+    for op in operations:
+        cube.perform(op, unshuffling=True)
+
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start(TRACEBACK_FRAMES)
+    try:
+        return [profile_operation(cube, op, repeats) for op in operations]
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+
+
+def format_report(report: list[OperationAllocations], top: int = 5) -> str:
+    """
+    This function formats an allocation report, listing the functions that allocated the most under each operation.
+
+    Args:
+        report (list[OperationAllocations]): Allocations of each operation (see profile_allocations)
+        top (int, optional): Number of functions listed per operation. Defaults to 5.
+
+    Returns:
+        str: Formatted report
+
+    """
+    lines = []
+    for allocations in report:
+        lines.append(
+            f'{allocations.op.name}: {allocations.blocks:.0f} blocks, {allocations.size / 1024:.1f} KiB, '
+            f'{allocations.collections:.2f} gc collections per operation'
+        )
+        for row in allocations.functions[:top]:
+            lines.append(f'    {row.size / 1024:>8.1f} KiB  {row.blocks:>6.0f} blocks  {row.function}')
+
+    return '\n'.join(lines)
@@ -0,0 +1,198 @@
+"""
+This module contains the cube backends other than the object model (see RubiksCube.__new__). They keep the cube's
+state as plain colour codes instead of faces & pieces, and perform the same operations with the same API (rotate,
+invert, shift, perform, shuffle, unshuffle, reset_perspective, as_array, render...), so the same code can run on any
+of them:
+
+    cube = RubiksCube(backend='array')
+
+1. array: Colour code of every sticker in a uint8 array, permuted by every operation (see stickers.OP_PERMUTATIONS)
+2. bitboard: Colour code of every sticker packed into 3 bits of a single int, permuted by masked shifts (see bitboard.py).
+   as_array returns a read-only snapshot of the stickers, not a live view
+
+The faces & pieces of the object model (faces, pieces, place_pieces...) aren't available on these backends.
+
+"""
+from __future__ import annotations
+from typing import NoReturn, Optional
+from rubiks_cube.bitboard import SOLVED_STATE, OP_SHIFTS, apply_shifts, compile_permutation, unpack
+from rubiks_cube.constants import Operations as ops
+from rubiks_cube.errors import BackendError
+from rubiks_cube.events import Subscriber
+from rubiks_cube.models import RubiksCube, ARRAY_SHAPES, STICKER_PERMUTATIONS, register_backend
+from rubiks_cube.render import render_stickers
+from rubiks_cube.stickers import NUM_STICKERS, SOLVED_STICKERS
+
+import numpy as np
+
+
+class StickerBackend(RubiksCube):
+
+    """
+    This is the base class of the backends that don't model faces & pieces. Accessing the object model's features
+    raises a BackendError.
+
+    """
+
+    @property
+    def faces(self) -> NoReturn:
+        raise BackendError(f"Faces aren't available on the '{self.backend}' backend")
+
+    @property
+    def pieces(self) -> NoReturn:
+        raise BackendError(f"Pieces aren't available on the '{self.backend}' backend")
+
+    def place_pieces(self, pieces: list) -> NoReturn:
+        raise BackendError(f"Pieces aren't available on the '{self.backend}' backend")
+
+    def define_cube(self) -> NoReturn:
+        raise BackendError(f"Faces aren't available on the '{self.backend}' backend")
+
+    def assign_complements(self) -> NoReturn:
+        raise BackendError(f"Pieces aren't available on the '{self.backend}' backend")
+
+    def print_face_ids(self) -> NoReturn:
+        raise BackendError(f"Faces aren't available on the '{self.backend}' backend")
+
+    def sync_stickers(self) -> None:
+        """
+        This method does nothing, since the backend's stickers are its state.
+
+        """
+
+    def _render(self, ansi: bool) -> str:
+        return render_stickers(self.as_array().tolist(), ansi)
+
+
+@register_backend('array')
+class ArrayCube(StickerBackend):
+
+    """
+    This is a class representing a rubiks cube held as the colour code of each of its stickers (see as_array), in a
+    single uint8 array. Every operation is a single gather with the operation's sticker permutation.
+
+    """
+
+    def __init__(self, backend: str = 'array') -> None:
+        """
+        Constructor method for the ArrayCube class. The cube is solved & in the default perspective.
+
+        Args:
+            backend (str, optional): Name of the backend (see RubiksCube.__new__). Defaults to 'array'.
+
+        """
+        self.op_stack: list[ops] = []
+        self.subscribers: list[Subscriber] = []
+        self.version = 0
+        self._renders: dict[bool, tuple[int, str]] = {}
+        self._unshuffled: Optional[np.ndarray] = None
+
+        self._stickers = np.array(SOLVED_STICKERS, dtype=np.uint8)
+        self._stickers_view = self._stickers.view()
+        self._stickers_view.flags.writeable = False
+
+    def _transform(self, op: ops) -> None:
+        self._stickers[:] = self._stickers[STICKER_PERMUTATIONS[op]]
+
+    def _snapshot(self) -> np.ndarray:
+        return self._stickers.copy()
+
+    def _restore(self, snapshot: np.ndarray) -> None:
+        self._stickers[:] = snapshot
+        self.version += 1
+
+    def _snapshot_stickers(self, snapshot: np.ndarray) -> list[int]:
+        return snapshot.tolist()
+
+    def _permute(self, permutation: list[int]) -> None:
+        self._stickers[:] = self._stickers[permutation]
+        self.version += 1
+
+
+@register_backend('bitboard')
+class BitboardCube(StickerBackend):
+
+    """
+    This is a class representing a rubiks cube held as a single bit-packed int (see bitboard.py). Operations are
+    compiled masked shifts, and the state can be copied, hashed & compared in constant time (see state). The array of
+    colour codes (see as_array) is only unpacked when it is requested, into a snapshot rather than a live view.
+
+    """
+
+    def __init__(self, backend: str = 'bitboard') -> None:
+        """
+        Constructor method for the BitboardCube class. The cube is solved & in the default perspective.
+
+        Args:
+            backend (str, optional): Name of the backend (see RubiksCube.__new__). Defaults to 'bitboard'.
+
+        """
+        self.op_stack: list[ops] = []
+        self.subscribers: list[Subscriber] = []
+        self.version = 0
+        self._renders: dict[bool, tuple[int, str]] = {}
+        self._unshuffled: Optional[int] = None
+
+        self._state = SOLVED_STATE
+
+        # Last snapshot of the colour codes (see as_array) & the version it was unpacked at
+        self._snapshot_array: Optional[np.ndarray] = None
+        self._snapshot_version = -1
+
+    @property
+    def state(self) -> int:
+        """
+        This property returns the cube's packed state, e.g. to be used as a key of a transposition table.
+
+        Returns:
+            int: Packed state (see bitboard.pack)
+
+        """
+        return self._state
+
+    def as_array(self, shape: tuple[int, ...] = (NUM_STICKERS,)) -> np.ndarray:
+        """
+        This method returns the colour code of every sticker (see RubiksCube.as_array). Unlike the other backends, the
+        array is NOT a live view: the packed state is unpacked into a new read-only array, a snapshot that doesn't
+        reflect operations performed afterwards (call as_array again to see them, or use state for a cheap key). The
+        snapshot is reused until the next operation, and is never changed once returned.
+
+        Args:
+            shape (tuple[int, ...], optional): Shape of the view, (54,) or (6, 3, 3). Defaults to (54,).
+
+        Raises:
+            ValueError: Raised if the shape isn't valid.
+
+        Returns:
+            np.ndarray: Read-only uint8 snapshot of the stickers' colour codes
+
+        """
+        if tuple(shape) not in ARRAY_SHAPES:
+            raise ValueError(f'Array shape must be one of {", ".join(map(str, ARRAY_SHAPES))}')
+
+        if self._snapshot_version != self.version:
+            self._snapshot_array = np.array(unpack(self._state), dtype=np.uint8)
+            self._snapshot_array.flags.writeable = False
+            self._snapshot_version = self.version
+
+        return self._snapshot_array.reshape(shape)
+
+    def _transform(self, op: ops) -> None:
+        self._state = apply_shifts(self._state, OP_SHIFTS[op])
+
+    def _snapshot(self) -> int:
+        return self._state
+
+    def _restore(self, snapshot: int) -> None:
+        self._state = snapshot
+        self.version += 1
+
+    def _snapshot_stickers(self, snapshot: int) -> list[int]:
+        return unpack(snapshot)
+
+    def _permute(self, permutation: list[int]) -> None:
+        self._state = apply_shifts(self._state, compile_permutation(permutation))
+        self.version += 1
+
+    def _render(self, ansi: bool) -> str:
+        return render_stickers(unpack(self._state), ansi)
@@ -0,0 +1,124 @@
+"""
+This module contains the non-interactive batch mode of the command line app. A move script holds one session per line:
+an algorithm in standard cube notation and/or as operation names (see notation.py), applied to a fresh cube in the
+default perspective. Blank lines and anything after a '#' or '//' are ignored.
+
+Sessions are run on the stickers' permutation tables (see stickers.OP_PERMUTATIONS) rather than on a rubiks cube
+instance, unless the net is requested, and nothing is rendered between operations. Only the requested outputs are
+written for each session, on a single tab separated line:
+
+1. state: Colour initial of every sticker, in sticker order (see stickers.py)
+2. hash: SHA-256 digest of the final state's colour codes (same bytes as helper.state_key)
+3. time: Seconds spent performing the session's operations
+4. net: Rendered net of the final state (see RubiksCube.__repr__), on the lines following the others
+
+"""
+from __future__ import annotations
+import hashlib
+import time
+from typing import Iterable, TextIO
+from rubiks_cube.constants import Colours, Operations as ops, BATCH_OUTPUTS
+from rubiks_cube.errors import InvalidOperationError
+from rubiks_cube.models import RubiksCube
+from rubiks_cube.notation import COMMENT_PATTERN, parse, to_operations
+from rubiks_cube.stickers import SOLVED_STICKERS, apply_operations
+
+# Colour initial of each colour code (see COLOUR_CODES)
+COLOUR_INITIALS = [colour.value[0] for colour in Colours]
+
+
+def parse_script_line(line: str) -> list[ops]:
+    """
+    This function parses a line of a move script into the operations of its session.
+
+    Args:
+        line (str): Line of the move script
+
+    Raises:
+        InvalidOperationError: Raised if the line contains an unknown move.
+
+    Returns:
+        list[Operations]: Operations of the session (empty for blank & comment lines)
+
+    """
+    return to_operations(parse(line))
+
+
+def run_session(operations: list[ops], outputs: Iterable[str]) -> str:
+    """
+    This function performs a session's operations on a fresh cube and formats the requested outputs.
+
+    Args:
+        operations (list[Operations]): Operations to be performed
+        outputs (Iterable[str]): Requested outputs (see BATCH_OUTPUTS)
+
+    Returns:
+        str: Formatted outputs of the session
+
+    """
+    outputs = list(outputs)
+    net = None
+
+    start = time.perf_counter()
+    if 'net' in outputs:
+        cube = RubiksCube()
+        for op in operations:
+            cube.perform(op)
+        net = repr(cube)
+        stickers = cube.as_array().tolist()
+    else:
+        stickers = apply_operations(SOLVED_STICKERS, operations)
+    elapsed = time.perf_counter() - start
+
+    fields = []
+    for output in outputs:
+        if output == 'state':
+            fields.append(''.join(COLOUR_INITIALS[code] for code in stickers))
+        elif output == 'hash':
+            fields.append(hashlib.sha256(bytes(stickers)).hexdigest())
+        elif output == 'time':
+            fields.append(f'{elapsed:.6f}')
+
+    line = '\t'.join(fields)
+    if net is None:
+        return line
+
+    return f'{line}\n{net}' if fields else net
+
+
+def run_batch(script: TextIO, outputs: Iterable[str], sink: TextIO) -> int:
+    """
+    This function runs every session of a move script and writes their outputs to a sink, one session at a time.
+
+    Args:
+        script (TextIO): Move script (file or stdin)
+        outputs (Iterable[str]): Requested outputs (see BATCH_OUTPUTS)
+        sink (TextIO): Sink that the outputs are written to (file or stdout)
+
+    Raises:
+        InvalidOperationError: Raised if a line of the script contains an unknown move (the line number is
+                               included in the message).
+        ValueError: Raised if one of the requested outputs isn't valid.
+
+    Returns:
+        int: Number of sessions run
+
+    """
+    outputs = list(outputs)
+    for output in outputs:
+        if output not in BATCH_OUTPUTS:
+            raise ValueError(f'Batch output must be one of {", ".join(BATCH_OUTPUTS)}')
+
+    sessions = 0
+    for line_number, line in enumerate(script, start=1):
+        try:
+            operations = parse_script_line(line)
+        except InvalidOperationError as error:
+            raise InvalidOperationError(f'Line {line_number}: {error}')
+        if not operations and not COMMENT_PATTERN.sub('', line).strip():
+            continue
+
+        sink.write(run_session(operations, outputs) + '\n')
+        sessions += 1
+
+    return sessions
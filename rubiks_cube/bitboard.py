@@ -0,0 +1,131 @@
+"""
+This module contains the bit-packed state representation of a rubiks cube (see backends.BitboardCube). The colour code
+(see COLOUR_CODES) of every sticker is packed into 3 bits of a single Python int, in sticker order (see stickers.py),
+so each face's nine colours sit in a 27-bit field:
+
+    state = sum(code << (3 * index) for index, code in enumerate(stickers))
+
+Every operation's sticker permutation (see stickers.OP_PERMUTATIONS, derived from the same moves as the
+transformations module's RightColUp, TopRowLeft...) is compiled into masked shifts: the stickers that move by the same
+distance are selected by a single mask and shifted together. Side strips moved along a layer all travel by a few
+distances, so a turn only takes 10 to 45 mask & shift steps, with no per-sticker work. States are plain ints, so they
+are immutable, hashable & compared or copied in constant time, which makes them cheap keys for search.
+
+"""
+from __future__ import annotations
+from typing import Iterable, Sequence
+from rubiks_cube.constants import Operations as ops
+from rubiks_cube.stickers import NUM_STICKERS, SOLVED_STICKERS, OP_PERMUTATIONS
+
+BITS_PER_STICKER = 3
+STICKER_MASK = (1 << BITS_PER_STICKER) - 1
+
+# Bit offset of every sticker in a packed state
+STICKER_OFFSETS = tuple(index * BITS_PER_STICKER for index in range(NUM_STICKERS))
+
+# Number of bytes that hold a packed state (see helper.state_key)
+STATE_BYTES = (NUM_STICKERS * BITS_PER_STICKER + 7) // 8
+
+# Masked shifts of a permutation: (mask, shift) pairs shifting left & (mask, shift) pairs shifting right
+Shifts = tuple[tuple[tuple[int, int], ...], tuple[tuple[int, int], ...]]
+
+
+def pack(stickers: Iterable[int]) -> int:
+    """
+    This function packs the colour code of every sticker into a bitboard state.
+
+    Args:
+        stickers (Iterable[int]): Colour code of every sticker, in sticker order
+
+    Returns:
+        int: Packed state
+
+    """
+    state = 0
+    for offset, code in zip(STICKER_OFFSETS, stickers):
+        state |= int(code) << offset
+
+    return state
+
+
+def unpack(state: int) -> list[int]:
+    """
+    This function unpacks a bitboard state into the colour code of every sticker.
+
+    Args:
+        state (int): Packed state
+
+    Returns:
+        list[int]: Colour code of every sticker, in sticker order
+
+    """
+    return [(state >> offset) & STICKER_MASK for offset in STICKER_OFFSETS]
+
+
+def compile_permutation(permutation: Sequence[int]) -> Shifts:
+    """
+    This function compiles a sticker permutation (new[i] = old[permutation[i]]) into masked shifts, grouping the
+    stickers that move by the same distance.
+
+    Args:
+        permutation (Sequence[int]): Sticker permutation
+
+    Returns:
+        tuple: Masks & shift amounts of the stickers moving left (to higher indices) & of the stickers moving right
+
+    """
+    masks: dict[int, int] = {}
+    for index, source in enumerate(map(int, permutation)):
+        distance = (index - source) * BITS_PER_STICKER
+        masks[distance] = masks.get(distance, 0) | (STICKER_MASK << STICKER_OFFSETS[source])
+
+    left = tuple((mask, distance) for distance, mask in sorted(masks.items()) if distance >= 0)
+    right = tuple((mask, -distance) for distance, mask in sorted(masks.items()) if distance < 0)
+
+    return left, right
+
+
+def apply_shifts(state: int, shifts: Shifts) -> int:
+    """
+    This function applies compiled masked shifts (see compile_permutation) to a bitboard state.
+
+    Args:
+        state (int): Packed state
+        shifts (tuple): Masked shifts of a permutation
+
+    Returns:
+        int: Permuted state
+
+    """
+    left, right = shifts
+    result = 0
+    for mask, shift in left:
+        result |= (state & mask) << shift
+    for mask, shift in right:
+        result |= (state & mask) >> shift
+
+    return result
+
+
+# Masked shifts of every operation
+OP_SHIFTS = {op: compile_permutation(permutation) for op, permutation in OP_PERMUTATIONS.items()}
+
+SOLVED_STATE = pack(SOLVED_STICKERS)
+
+
+def apply_operations(state: int, operations: Iterable[ops]) -> int:
+    """
+    This function applies a sequence of operations to a bitboard state (see stickers.apply_operations).
+
+    Args:
+        state (int): Packed state
+        operations (Iterable[Operations]): Operations to be applied, in order
+
+    Returns:
+        int: State after the operations
+
+    """
+    for op in operations:
+        state = apply_shifts(state, OP_SHIFTS[op])
+
+    return state
@@ -20,6 +20,9 @@ class Colours(Enum):
     GREEN: str = 'Green'
     YELLOW: str = 'Yellow'
 
+
+COLOUR_CODES = {colour: code for code, colour in enumerate(Colours)}
+
     
 class Orientation(Enum):
     """
@@ -98,3 +101,32 @@ class Operations(Enum):
     SHIFT_TOP_ROW_RIGHT: str = 'Shifting Top Row Right'
     SHIFT_BOTTOM_ROW_LEFT: str = 'Shifting Bottom Row Left'
     SHIFT_BOTTOM_ROW_RIGHT: str = 'Shifting Bottom Row Right'
+
+
+OP_CODES = {op: code for code, op in enumerate(Operations)}
+
+# Order in which a cube's faces are listed, with respect to the cube's current perspective
+FACE_ORDER = ['FRONT', 'LEFT', 'RIGHT', 'TOP', 'OPPOSITE', 'BOTTOM']
+
+# Maps each operation to the operation that undoes it
+INVERSE_OP_MAPPING = {
+    Operations.ROTATE_DOWN: Operations.ROTATE_UP,
+    Operations.ROTATE_UP: Operations.ROTATE_DOWN,
+    Operations.ROTATE_LEFT_VERTICALLY: Operations.ROTATE_RIGHT_VERTICALLY,
+    Operations.ROTATE_RIGHT_VERTICALLY: Operations.ROTATE_LEFT_VERTICALLY,
+    Operations.ROTATE_LEFT_HORIZONTALLY: Operations.ROTATE_RIGHT_HORIZONTALLY,
+    Operations.ROTATE_RIGHT_HORIZONTALLY: Operations.ROTATE_LEFT_HORIZONTALLY,
+    Operations.INVERT_VERTICALLY: Operations.INVERT_VERTICALLY,
+    Operations.INVERT_HORIZONTALLY: Operations.INVERT_HORIZONTALLY,
+    Operations.SHIFT_RIGHT_COL_UP: Operations.SHIFT_RIGHT_COL_DOWN,
+    Operations.SHIFT_LEFT_COL_UP: Operations.SHIFT_LEFT_COL_DOWN,
+    Operations.SHIFT_RIGHT_COL_DOWN: Operations.SHIFT_RIGHT_COL_UP,
+    Operations.SHIFT_LEFT_COL_DOWN: Operations.SHIFT_LEFT_COL_UP,
+    Operations.SHIFT_TOP_ROW_LEFT: Operations.SHIFT_TOP_ROW_RIGHT,
+    Operations.SHIFT_TOP_ROW_RIGHT: Operations.SHIFT_TOP_ROW_LEFT,
+    Operations.SHIFT_BOTTOM_ROW_LEFT: Operations.SHIFT_BOTTOM_ROW_RIGHT,
+    Operations.SHIFT_BOTTOM_ROW_RIGHT: Operations.SHIFT_BOTTOM_ROW_LEFT
+}
+
+# Outputs that can be requested for each session in batch mode (see batch.py)
+BATCH_OUTPUTS = ('state', 'hash', 'time', 'net')
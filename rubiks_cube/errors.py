@@ -116,4 +116,61 @@ class CubeIntegrityError(Exception):
         """
         if not msg:
             msg = 'Cube Integrity has been broken!'
-        super().__init__(msg)
\ No newline at end of file
+        super().__init__(msg)
+
+
+class DeadlineExceededError(Exception):
+
+    """
+    Error class defined to throw excpetions when a search over rubiks cube states runs past its deadline.
+
+    """
+
+    def __init__(self, msg: Optional[str] = None) -> None:
+        """
+        Constructor method for the DeadlineExceededError class.
+
+        Args:
+            msg (str, optional): Optional error message. Defaults to None.
+        """
+        if not msg:
+            msg = 'Search deadline has been exceeded'
+        super().__init__(msg)
+
+
+class BackendError(Exception):
+
+    """
+    Error class defined to throw excpetions when an unknown cube backend is requested, or when a backend doesn't support the requested feature.
+
+    """
+
+    def __init__(self, msg: Optional[str] = None) -> None:
+        """
+        Constructor method for the BackendError class.
+
+        Args:
+            msg (str, optional): Optional error message. Defaults to None.
+        """
+        if not msg:
+            msg = 'Requested cube backend is not available'
+        super().__init__(msg)
+
+
+class PoolError(Exception):
+
+    """
+    Error class defined to throw excpetions when a cube pool has no free rows left, or when a released cube handle is used.
+
+    """
+
+    def __init__(self, msg: Optional[str] = None) -> None:
+        """
+        Constructor method for the PoolError class.
+
+        Args:
+            msg (str, optional): Optional error message. Defaults to None.
+        """
+        if not msg:
+            msg = 'Cube pool has no free rows left'
+        super().__init__(msg)
@@ -0,0 +1,47 @@
+"""
+This module contains the move events of the rubiks cube architecture. Every operation performed on a rubiks cube
+instance notifies the cube's subscribers with a MoveEvent. Cubes without subscribers skip the notification entirely,
+so performing operations stays silent & fast unless something (e.g. the command line app) is listening.
+
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING, Callable, NamedTuple
+from rubiks_cube.constants import Operations as ops
+
+if TYPE_CHECKING:
+    from rubiks_cube.models import RubiksCube
+
+
+class MoveEvent(NamedTuple):
+
+    """
+    This is a class representing the notification sent to a cube's subscribers once an operation has been performed.
+
+    ATTRIBUTES:
+        cube: Rubiks cube instance that the operation was performed on
+        op: Operation that was performed
+        positions: Indices of the stickers whose piece has changed (see stickers.OP_MOVED_STICKERS)
+        unshuffling: Flag indicating if the operation was performed as part of unshuffling the cube
+
+    """
+
+    cube: RubiksCube
+    op: ops
+    positions: tuple[int, ...]
+    unshuffling: bool
+
+
+Subscriber = Callable[[MoveEvent], None]
+
+
+def print_move(event: MoveEvent) -> None:
+    """
+    This function is a subscriber that displays every operation requested on the cube (operations performed while
+    unshuffling aren't displayed).
+
+    Args:
+        event (MoveEvent): Move event sent by the cube
+
+    """
+    if not event.unshuffling:
+        print(event.op.value)
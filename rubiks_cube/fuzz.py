@@ -0,0 +1,293 @@
+"""
+This module contains the differential fuzz harness of the rubiks cube architecture. Random sequences of operations are
+performed on the reference object model (Face/Piece, see models.py) and on each candidate engine (the other backends
+& the cube pool) side by side. After every step, the candidate must match the reference's:
+
+1. State: Colour code of every sticker, read from the reference's pieces (not from its sticker array, which is kept
+   up to date by the same permutation tables as the fast engines)
+2. Net: Rendered net, which follows the orientation conventions of Face.__repr__
+3. Operation stack
+
+Any divergent sequence is minimized to a shortest reproducer: it is cut after its first divergent step, then operations
+are removed for as long as the sequence still diverges. Sequences are drawn in chunks with scrambles.iter_scrambles &
+can be checked across worker processes, with only a few chunks per worker in flight at once (see
+scrambles.imap_bounded):
+
+    python run.py --fuzz 100000
+
+"""
+from __future__ import annotations
+from importlib import import_module
+from typing import Callable, Iterable, NamedTuple, Optional, Sequence
+from rubiks_cube.constants import Operations as ops, COLOUR_CODES
+from rubiks_cube.models import RubiksCube, BACKENDS, BACKENDS_MODULE
+from rubiks_cube.operations import Rotations as rotate, Inversions as invert, Shifts as shift
+from rubiks_cube.pool import CubePool
+from rubiks_cube.scrambles import imap_bounded, iter_scrambles
+
+import numpy as np
+
+REFERENCE_BACKEND = 'object'
+
+# Candidate engine that isn't a backend
+POOL_CANDIDATE = 'pool'
+
+# Shuffle weights giving every operation the same probability of being drawn
+UNIFORM_WEIGHTS = {
+    'inversions': len(invert.inversions),
+    'rotations': len(rotate.rotations),
+    'shifts': len(shift.shifts)
+}
+
+SEQUENCE_LENGTH = 25
+
+CHUNK_SIZE = 256
+
+
+class Divergence(NamedTuple):
+
+    """
+    This is a class representing a sequence of operations after which a candidate engine doesn't match the reference.
+
+    ATTRIBUTES:
+        candidate: Name of the candidate engine
+        operations: Minimized sequence of operations, diverging at its last step
+        expected: Net of the reference after the sequence
+        actual: Net of the candidate after the sequence
+
+    """
+
+    candidate: str
+    operations: list[ops]
+    expected: str
+    actual: str
+
+
+class FuzzResult(NamedTuple):
+
+    """
+    This is a class representing the result of a fuzzing run.
+
+    ATTRIBUTES:
+        sequences: Number of sequences checked
+        steps: Number of steps compared (per candidate)
+        divergences: Minimized divergence of each candidate that diverged (at most one per candidate)
+
+    """
+
+    sequences: int
+    steps: int
+    divergences: list[Divergence]
+
+
+def candidate_names() -> list[str]:
+    """
+    This function returns the names of every candidate engine: every registered backend other than the reference, and
+    the cube pool.
+
+    Returns:
+        list[str]: Names of the candidates
+
+    """
+    import_module(BACKENDS_MODULE)
+    return [name for name in BACKENDS if name != REFERENCE_BACKEND] + [POOL_CANDIDATE]
+
+
+def create_candidate(name: str):
+    """
+    This function creates a solved cube of a candidate engine.
+
+    Args:
+        name (str): Name of the candidate (see candidate_names)
+
+    Raises:
+        BackendError: Raised if the name isn't a registered backend nor the cube pool.
+
+    Returns:
+        RubiksCube | CubeHandle: New cube
+
+    """
+    if name == POOL_CANDIDATE:
+        return CubePool(1).allocate()
+    return RubiksCube(backend=name)
+
+
+def reference_state(cube: RubiksCube) -> bytes:
+    """
+    This function reads the colour code of every sticker from the pieces of a cube of the object model.
+
+    Args:
+        cube (RubiksCube): Cube of the object model
+
+    Returns:
+        bytes: Colour codes, in sticker order
+
+    """
+    return bytes([COLOUR_CODES[piece.colour] for piece in cube.pieces])
+
+
+def run_lockstep(operations: Sequence[ops], candidates: Iterable[str]) -> dict[str, int]:
+    """
+    This function performs a sequence of operations on the reference & on every candidate in lockstep, comparing them
+    after every step. A candidate is dropped as soon as it diverges.
+
+    Args:
+        operations (Sequence[Operations]): Operations to be performed
+        candidates (Iterable[str]): Names of the candidates
+
+    Returns:
+        dict[str, int]: Index of the first step after which each divergent candidate didn't match the reference
+
+    """
+    reference = RubiksCube(backend=REFERENCE_BACKEND)
+    cubes = {candidate: create_candidate(candidate) for candidate in candidates}
+    diverged: dict[str, int] = {}
+    for step, op in enumerate(operations):
+        if not cubes:
+            break
+        reference.perform(op)
+        state, net = reference_state(reference), reference.render()
+        for candidate, cube in list(cubes.items()):
+            cube.perform(op)
+            if state != cube.as_array().tobytes() or reference.op_stack != cube.op_stack or net != cube.render():
+                diverged[candidate] = step
+                del cubes[candidate]
+
+    return diverged
+
+
+def first_divergence(operations: Sequence[ops], candidate: str) -> Optional[int]:
+    """
+    This function performs a sequence of operations on the reference & on a candidate (see run_lockstep).
+
+    Args:
+        operations (Sequence[Operations]): Operations to be performed
+        candidate (str): Name of the candidate
+
+    Returns:
+        int: Index of the first step after which the candidate doesn't match the reference, or None if it always matches
+
+    """
+    return run_lockstep(operations, [candidate]).get(candidate)
+
+
+def minimize(operations: Sequence[ops], candidate: str) -> list[ops]:
+    """
+    This function minimizes a divergent sequence of operations. The sequence is cut after its first divergent step, then
+    chunks of operations (halving in size down to single operations) are removed for as long as it still diverges.
+
+    Args:
+        operations (Sequence[Operations]): Divergent sequence of operations
+        candidate (str): Name of the candidate it diverges on
+
+    Raises:
+        ValueError: Raised if the sequence doesn't diverge.
+
+    Returns:
+        list[Operations]: Minimized sequence, diverging at its last step
+
+    """
+    step = first_divergence(operations, candidate)
+    if step is None:
+        raise ValueError("Sequence doesn't diverge")
+    operations = list(operations[:step + 1])
+
+    chunk = max(len(operations) // 2, 1)
+    while True:
+        start = 0
+        while start < len(operations) and len(operations) > 1:
+            trial = operations[:start] + operations[start + chunk:]
+            step = first_divergence(trial, candidate) if trial else None
+            if step is None:
+                start += chunk
+            else:
+                operations = trial[:step + 1]
+        if chunk == 1:
+            return operations
+        chunk //= 2
+
+
+def fuzz_chunk(scrambles: np.ndarray, candidates: Sequence[str]) -> list[tuple[str, list[int]]]:
+    """
+    This function checks a chunk of sequences of operations on every candidate.
+
+    Args:
+        scrambles (np.ndarray): Operation codes of the sequences, one per row (see scrambles.generate_chunk)
+        candidates (Sequence[str]): Names of the candidates
+
+    Returns:
+        list[tuple[str, list[int]]]: Name of the candidate & operation codes of each divergent sequence (at most one per candidate)
+
+    """
+    all_ops = list(ops)
+    remaining = list(candidates)
+    failures = []
+    for codes in scrambles.tolist():
+        if not remaining:
+            break
+        for candidate in run_lockstep([all_ops[code] for code in codes], remaining):
+            failures.append((candidate, codes))
+            remaining.remove(candidate)
+
+    return failures
+
+
+def _fuzz_chunk(args: tuple) -> list[tuple[str, list[int]]]:
+    return fuzz_chunk(*args)
+
+
+def fuzz(num_sequences: int, seed: Optional[int] = None, workers: int = 1, candidates: Optional[Iterable[str]] = None, length: int = SEQUENCE_LENGTH, progress: Optional[Callable[[int], None]] = None) -> FuzzResult:
+    """
+    This function fuzzes the candidate engines against the reference with random sequences of operations (every
+    operation being equally likely), and minimizes the first divergent sequence found for each candidate.
+
+    Args:
+        num_sequences (int): Number of sequences to be checked
+        seed (int, optional): Seed for the sequences. Defaults to None (unseeded).
+        workers (int, optional): Number of worker processes. Defaults to 1 (checked in the current process).
+        candidates (Iterable[str], optional): Names of the candidates. Defaults to None (see candidate_names).
+        length (int, optional): Number of operations in each sequence. Defaults to SEQUENCE_LENGTH.
+        progress (Callable[[int], None], optional): Callable notified with the number of sequences checked after each chunk. Defaults to None.
+
+    Returns:
+        FuzzResult: Result of the run
+
+    """
+    candidates = candidate_names() if candidates is None else list(candidates)
+    chunks = iter_scrambles(num_sequences, seed, num_ops=length, weights=UNIFORM_WEIGHTS, chunk_size=CHUNK_SIZE)
+    tasks = ((chunk, candidates) for chunk in chunks)
+
+    if workers <= 1:
+        results = map(_fuzz_chunk, tasks)
+        pool = None
+    else:
+        from multiprocessing import Pool
+
+        pool = Pool(workers)
+        results = imap_bounded(pool, _fuzz_chunk, tasks, workers)
+
+    failures: dict[str, list[int]] = {}
+    checked = 0
+    try:
+        for index, chunk_failures in enumerate(results):
+            for candidate, codes in chunk_failures:
+                failures.setdefault(candidate, codes)
+            checked = min((index + 1) * CHUNK_SIZE, num_sequences)
+            if progress is not None:
+                progress(checked)
+    finally:
+        if pool is not None:
+            pool.terminate()
+
+    all_ops = list(ops)
+    divergences = []
+    for candidate, codes in failures.items():
+        operations = minimize([all_ops[code] for code in codes], candidate)
+        reference = RubiksCube(backend=REFERENCE_BACKEND)
+        cube = create_candidate(candidate)
+        for op in operations:
+            reference.perform(op)
+            cube.perform(op)
+        divergences.append(Divergence(candidate, operations, reference.render(), cube.render()))
+
+    return FuzzResult(checked, checked * length, divergences)
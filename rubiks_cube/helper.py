@@ -4,10 +4,11 @@ This module contains helper functions that are used within the rubiks cube archi
 """
 from __future__ import annotations
 from typing import TYPE_CHECKING
+from rubiks_cube.bitboard import STATE_BYTES
 from rubiks_cube.errors import FaceTransferError
 
 if TYPE_CHECKING:
-    from rubiks_cube.models import Face
+    from rubiks_cube.models import RubiksCube, Face
 
 def transfer_faces(orig: Face, new: Face) -> None:
     """
@@ -32,3 +33,26 @@ def transfer_faces(orig: Face, new: Face) -> None:
         orig.grid = new.grid
     except AttributeError:
         raise FaceTransferError()
+
+
+def state_key(cube: RubiksCube) -> bytes:
+    """
+    This function creates a compact, hashable key for the rubiks cube instance's current state. The key holds one colour
+    code (see COLOUR_CODES) per piece, read row by row from each face's grid in the order of FACE_ORDER (i.e. the bytes
+    of RubiksCube.as_array). On the bitboard backend, the key is read straight from the packed state (see
+    BitboardCube.state) instead, without unpacking it. Two cube instances of the same backend have the same key only if
+    every piece shows the same colour from the same perspective; keys of bitboard cubes aren't comparable with keys of
+    cubes of the other backends.
+
+    Args:
+        cube (RubiksCube): Rubiks Cube instance
+
+    Returns:
+        bytes: 54 byte key (or STATE_BYTES byte key on the bitboard backend) representing the cube instance's current state
+
+    """
+    state = getattr(cube, 'state', None)
+    if isinstance(state, int):
+        return state.to_bytes(STATE_BYTES, 'little')
+
+    return cube.as_array().tobytes()
@@ -4,43 +4,244 @@ that allow all possible operations that can be done to a rubiks cube in real lif
 
 """
 from __future__ import annotations
-from typing import Optional
-from rubiks_cube.constants import Colours, Orientation, FacePositions, PieceTypes, Operations as ops
-from rubiks_cube.errors import ImmutableAttributeError, OperationStackContentsError, InvalidOperationError, InvalidOrientationError, CubeIntegrityError
-from rubiks_cube.predicates import is_default_perspective, is_white_face_top
-from rubiks_cube.operations import Rotations as rotate, Inversions as invert, Shifts as shift
+from importlib import import_module
+from time import perf_counter_ns
+from typing import Callable, Optional, Union
+from rubiks_cube.constants import Colours, COLOUR_CODES, Orientation, FacePositions, PieceTypes, Operations as ops, FACE_ORDER, INVERSE_OP_MAPPING, OP_CODES
+from rubiks_cube.errors import ImmutableAttributeError, OperationStackContentsError, InvalidOperationError, CubeIntegrityError, BackendError
+from rubiks_cube.operations import Rotations as rotate, Inversions as invert, Shifts as shift, random_operations
+from rubiks_cube.scrambles import random_state_permutation
+from rubiks_cube.stickers import NUM_STICKERS, CORNER_FACELETS, EDGE_FACELETS, SOLVED_STICKERS, OP_PERMUTATIONS, OP_MOVED_STICKERS, apply_operations
+from rubiks_cube.events import MoveEvent, Subscriber
+from rubiks_cube.render import FACE_ORIENTATIONS, render_face, render_net
+from rubiks_cube.stats import OperationStats
 
-import random
 import numpy as np
 
-FACE_ORDER = ['FRONT', 'LEFT', 'RIGHT', 'TOP', 'OPPOSITE', 'BOTTOM']
-INVERSE_OP_MAPPING = {
-    ops.ROTATE_DOWN: ops.ROTATE_UP,
-    ops.ROTATE_UP: ops.ROTATE_DOWN,
-    ops.ROTATE_LEFT_VERTICALLY: ops.ROTATE_RIGHT_VERTICALLY,
-    ops.ROTATE_RIGHT_VERTICALLY: ops.ROTATE_LEFT_VERTICALLY,
-    ops.ROTATE_LEFT_HORIZONTALLY: ops.ROTATE_RIGHT_HORIZONTALLY,
-    ops.ROTATE_RIGHT_HORIZONTALLY: ops.ROTATE_LEFT_HORIZONTALLY,
-    ops.INVERT_VERTICALLY: ops.INVERT_VERTICALLY,
-    ops.INVERT_HORIZONTALLY: ops.INVERT_HORIZONTALLY,
-    ops.SHIFT_RIGHT_COL_UP: ops.SHIFT_RIGHT_COL_DOWN,
-    ops.SHIFT_LEFT_COL_UP: ops.SHIFT_LEFT_COL_DOWN,
-    ops.SHIFT_RIGHT_COL_DOWN: ops.SHIFT_RIGHT_COL_UP,
-    ops.SHIFT_LEFT_COL_DOWN: ops.SHIFT_LEFT_COL_UP,
-    ops.SHIFT_TOP_ROW_LEFT: ops.SHIFT_TOP_ROW_RIGHT,
-    ops.SHIFT_TOP_ROW_RIGHT: ops.SHIFT_TOP_ROW_LEFT,
-    ops.SHIFT_BOTTOM_ROW_LEFT: ops.SHIFT_BOTTOM_ROW_RIGHT,
-    ops.SHIFT_BOTTOM_ROW_RIGHT: ops.SHIFT_BOTTOM_ROW_LEFT
-}
+# Sticker permutation of every operation (see stickers.OP_PERMUTATIONS), as index arrays
+STICKER_PERMUTATIONS = {op: np.array(permutation, dtype=np.intp) for op, permutation in OP_PERMUTATIONS.items()}
 
+ARRAY_SHAPES = ((NUM_STICKERS,), (6, 3, 3))
 
+
+def _build_perspective_rotations() -> dict[tuple[int, ...], list[ops]]:
+    """
+    This function finds a shortest sequence of rotations turning a cube from the default perspective to each of its 24
+    perspectives, keyed by the colour codes of the center stickers in that perspective.
+
+    Returns:
+        dict: Dictionary mapping the center colour codes of each perspective to the rotations reaching it
+
+    """
+    perspectives: dict[tuple[int, ...], list[ops]] = {tuple(SOLVED_STICKERS[4::9]): []}
+    queue: list[list[ops]] = [[]]
+    for rotations in queue:
+        for op in (ops.ROTATE_UP, ops.ROTATE_LEFT_VERTICALLY, ops.ROTATE_RIGHT_HORIZONTALLY):
+            centers = tuple(apply_operations(SOLVED_STICKERS, rotations + [op])[4::9])
+            if centers not in perspectives:
+                perspectives[centers] = rotations + [op]
+                queue.append(rotations + [op])
+
+    return perspectives
+
+
+PERSPECTIVE_ROTATIONS = _build_perspective_rotations()
+
+DEFAULT_CENTERS = list(SOLVED_STICKERS[4::9])
+
+# Transform of every operation on the object model (see operations.py)
+TRANSFORMS = {**rotate.rotations, **invert.inversions, **shift.shifts}
+
+# Cube classes of every registered backend, keyed by name (see RubiksCube.__new__)
+BACKENDS: dict[str, type[RubiksCube]] = {}
+
+# Module registering the backends other than the object model the first time one of them is requested
+BACKENDS_MODULE = 'rubiks_cube.backends'
+
+
+def register_backend(name: str) -> Callable[[type[RubiksCube]], type[RubiksCube]]:
+    """
+    This function returns a class decorator registering a cube class as the backend with the given name.
+
+    Args:
+        name (str): Name of the backend, as passed to RubiksCube(backend=...)
+
+    Returns:
+        Callable: Class decorator registering the backend
+
+    """
+    def decorator(backend_cls: type[RubiksCube]) -> type[RubiksCube]:
+        backend_cls.backend = name
+        BACKENDS[name] = backend_cls
+        return backend_cls
+
+    return decorator
+
+
+def get_backend(name: str) -> type[RubiksCube]:
+    """
+    This function returns the cube class of the backend with the given name.
+
+    Args:
+        name (str): Name of the backend
+
+    Raises:
+        BackendError: Raised if no backend is registered with the given name.
+
+    Returns:
+        type[RubiksCube]: Cube class of the backend
+
+    """
+    if name not in BACKENDS:
+        import_module(BACKENDS_MODULE)
+    try:
+        return BACKENDS[name]
+    except KeyError:
+        raise BackendError(f"Unknown backend '{name}'. Available backends: {', '.join(BACKENDS)}")
+
+
+def _cubie_permutation(solved: list[int], codes: list[int]) -> list[int]:
+    """
+    This function matches each cubie of a solved cube with the stickers where its colours are found in the given colour
+    codes (see RubiksCube.from_array).
+
+    Args:
+        solved (list[int]): Colour codes of the solved cube, in the same perspective as codes
+        codes (list[int]): Colour code of every sticker
+
+    Raises:
+        CubeIntegrityError: Raised if the colours don't form the cubies of a rubiks cube.
+
+    Returns:
+        list[int]: Sticker permutation turning the solved cube into the given colour codes (new[i] = old[permutation[i]])
+
+    """
+    permutation = list(range(NUM_STICKERS))
+
+    for facelets in (CORNER_FACELETS, EDGE_FACELETS):
+        homes = {tuple(sorted(solved[index] for index in facelet)): facelet for facelet in facelets}
+        for facelet in facelets:
+            colours = [codes[index] for index in facelet]
+            home = homes.pop(tuple(sorted(colours)), None)
+            if home is None:
+                raise CubeIntegrityError(f'Stickers {facelet} have colours {colours}, which no other cubie has')
+
+            size = len(facelet)
+            for twist in range(size):
+                if all(solved[home[(position + twist) % size]] == colours[position] for position in range(size)):
+                    break
+            else:
+                raise CubeIntegrityError(f'Stickers {facelet} have colours {colours} in an impossible order')
+
+            for position, index in enumerate(facelet):
+                permutation[index] = home[(position + twist) % size]
+
+    return permutation
+
+
+def _graph_stickers(face: Face) -> bytes:
+    """
+    This function reads the colour code of every sticker of the cube that a face belongs to, by walking the faces
+    linked to it.
+
+    Args:
+        face (Face): Face of an object model cube
+
+    Returns:
+        bytes: Colour codes, in sticker order
+
+    """
+    faces: dict[Orientation, Face] = {}
+    pending = [face]
+    while pending:
+        current = pending.pop()
+        if current is None or current.side_of_cube in faces:
+            continue
+        faces[current.side_of_cube] = current
+        pending.extend((current.left, current.right, current.top, current.bottom, current.front, current.back, current.opposite))
+
+    return bytes(COLOUR_CODES[piece.colour] for orientation in FACE_ORIENTATIONS for piece in faces[orientation].grid.flat)
+
+
+def _rebuild_cube(backend: str, stickers: bytes, op_codes: bytes, unshuffled: Optional[bytes]) -> RubiksCube:
+    """
+    This function rebuilds a pickled cube (see RubiksCube.__reduce__).
+
+    Args:
+        backend (str): Name of the cube's backend
+        stickers (bytes): Colour code of every sticker
+        op_codes (bytes): Operation codes of the cube's operation stack (see OP_CODES)
+        unshuffled (bytes, optional): Colour code of every sticker before the cube was shuffled into a random state, or None
+
+    Returns:
+        RubiksCube: Rebuilt cube
+
+    """
+    all_ops = list(ops)
+    op_stack = [all_ops[code] for code in op_codes]
+    if unshuffled is None:
+        cube = RubiksCube.from_array(np.frombuffer(stickers, dtype=np.uint8), backend=backend)
+    else:
+        # The cube is rebuilt in its state before the random shuffle, so that it can still be unshuffled
+        cube = RubiksCube.from_array(np.frombuffer(unshuffled, dtype=np.uint8), backend=backend)
+        snapshot = cube._snapshot()
+        shuffled = apply_operations(stickers, [INVERSE_OP_MAPPING[op] for op in reversed(op_stack)])
+        cube._permute(_cubie_permutation(cube.as_array().tolist(), shuffled))
+        for op in op_stack:
+            cube._apply(op, unshuffling=True)
+        cube._unshuffled = snapshot
+
+    cube.op_stack = op_stack
+    return cube
+
+
+def _rebuild_face(stickers: bytes, colour: Colours) -> Face:
+    """
+    This function rebuilds a pickled face (see Face.__reduce__), as part of a new cube. Each face is rebuilt with its
+    own cube, so faces that shared a cube when pickled (or a face & its cube) don't share one once loaded.
+
+    Args:
+        stickers (bytes): Colour code of every sticker of the face's cube
+        colour (Colours): Primary colour of the face
+
+    Returns:
+        Face: Face of the new cube with the given colour
+
+    """
+    cube = RubiksCube.from_array(np.frombuffer(stickers, dtype=np.uint8))
+    return next(face for face in cube.faces if face.colour == colour)
+
+
+def _rebuild_piece(stickers: bytes, colour: Colours, face_position: tuple[int, int]) -> Piece:
+    """
+    This function rebuilds a pickled piece (see Piece.__reduce__), as part of a new cube. Each piece is rebuilt with
+    its own cube, so pieces that shared a cube when pickled (or a piece & its cube) don't share one once loaded.
+
+    Args:
+        stickers (bytes): Colour code of every sticker of the piece's cube
+        colour (Colours): Primary colour of the piece's face
+        face_position (tuple[int, int]): Row & column of the piece in its face's grid
+
+    Returns:
+        Piece: Piece of the new cube at the given position
+
+    """
+    return _rebuild_face(stickers, colour).grid[face_position]
+
+
+@register_backend('object')
 class RubiksCube:
     
     """
     This is a class representing the Rubiks Cube. A cube has 6 faces (type=Face). It is initialized with the blue face
     in front, red face on the left, orange face on the right, green face on the back, white face on top and yellow face on the bottom (referred to as 'default perspective').
+
+    The cube's state can be held by different backends, selected with RubiksCube(backend=...): 'object' (this class,
+    the default) models every face & piece, while the other backends (see backends.py) only keep the stickers' colour
+    codes. Every backend has the same operations API; the faces & pieces are only available on the object model.
     
     ATTRIBUTES:
+        backend: Name of the cube's backend
         current_front: Pointer to the Face instance that is currently set as front face of the cube
         blue_face: Pointer to the Blue Face instance that is part of the cube
         red_face: Pointer to the Red Face instance that is part of the cube
@@ -49,24 +250,62 @@ class RubiksCube:
         white_face: Pointer to the White Face instance that is part of the cube
         yellow_face: Pointer to the Yellow Face instance that is part of the cube
         op_stack: List that contains the stack of operations that have been performed on the cube
+        subscribers: List of callables notified with a MoveEvent after each operation (see events.py)
+        version: Counter incremented every time the cube's state changes, used to invalidate cached renders
         
     PROPERTIES:
         faces: List of faces that are part of the cube
+        pieces: List of the cube's pieces in sticker order (see stickers.py)
+        
+    CLASS METHODS:
+        from_array: Creates a cube from an array of colour codes
         
     METHODS:
         define_cube: Defines the cube structure
         assign_complements: Assigns complement values for all pieces in the cube
-        print_face_ids: Helper method that displays enumerated faces of the cube in the order defined in FACE_ORDER (defined above)
+        place_pieces: Places pieces on the cube's faces in sticker order
+        as_array: Returns a read-only view of the colour code of every sticker
+        sync_stickers: Rebuilds the array of colour codes from the cube's pieces
+        render: Renders the cube's net, optionally coloured with ANSI escape codes (cached until the cube's state changes)
+        print_face_ids: Helper method that displays enumerated faces of the cube in the order defined in FACE_ORDER (see constants.py)
         rotate: Performs the specified rotation operation 
         invert: Performs the specified inversion operation
         shift: Performs the specified shift operation
+        perform: Performs the specified operation of any kind
+        subscribe: Registers a subscriber to be notified of every operation performed
+        unsubscribe: Removes a previously registered subscriber
+        notify: Notifies every subscriber that an operation has been performed
+        enable_stats: Starts counting & timing every operation performed (see stats.py)
+        disable_stats: Stops counting & timing operations
+        stats: Returns the counts & latency histograms of the operations performed
         reset_perspective: Resets the cube's perspective back to default perspective
         shuffle: Shuffles cube by performing random operations on the cube
         unshuffle: Unshuffles cube by performing the inverse of operations in operation stack
 
     """
+
+    # Counts & latency histograms of the operations performed (see enable_stats)
+    _stats: Optional[OperationStats] = None
     
-    def __init__(self, blue_face: Optional[Face] = None, red_face: Optional[Face] = None, orange_face: Optional[Face] = None, white_face: Optional[Face] = None, green_face: Optional[Face] = None, yellow_face: Optional[Face] = None, is_copy: bool = False) -> None:
+    def __new__(cls, *args, backend: str = 'object', **kwargs) -> RubiksCube:
+        """
+        This method creates the cube instance with the class of the requested backend (see BACKENDS).
+
+        Args:
+            backend (str, optional): Name of the backend. Defaults to 'object'.
+
+        Raises:
+            BackendError: Raised if no backend is registered with the given name.
+
+        Returns:
+            RubiksCube: New (uninitialized) cube instance
+
+        """
+        if cls is RubiksCube and backend != cls.backend:
+            cls = get_backend(backend)
+        return super().__new__(cls)
+
+    def __init__(self, blue_face: Optional[Face] = None, red_face: Optional[Face] = None, orange_face: Optional[Face] = None, white_face: Optional[Face] = None, green_face: Optional[Face] = None, yellow_face: Optional[Face] = None, is_copy: bool = False, backend: str = 'object') -> None:
         """
         Constructor method for the Rubiks Cube class.
 
@@ -78,6 +317,7 @@ class RubiksCube:
             green_face (Face, optional): Face instance for the green face of the cube. Defaults to None.
             yellow_face (Face, optional): Face instance for the yellow face of the cube. Defaults to None.
             is_copy (bool, optional): Flag representing if the cube is a copy. Defaults to False.
+            backend (str, optional): Name of the backend (see RubiksCube.__new__). Defaults to 'object'.
 
         """
         self.blue_face = blue_face
@@ -88,11 +328,27 @@ class RubiksCube:
         self.yellow_face = yellow_face
 
         self.op_stack: list[ops] = []
+        self.subscribers: list[Subscriber] = []
+        self.version = 0
+        
+        # Cached renders of the cube's net, keyed by whether they are ANSI-coloured: (version, output)
+        self._renders: dict[bool, tuple[int, str]] = {}
+        
+        # Snapshot of the cube's state (see _snapshot) before it was shuffled into a random state (None if it wasn't)
+        self._unshuffled: Optional[object] = None
+
+        # Colour code of every sticker (see as_array), permuted in place by every operation
+        self._stickers = np.zeros(NUM_STICKERS, dtype=np.uint8)
+        self._stickers_view = self._stickers.view()
+        self._stickers_view.flags.writeable = False
 
         if not is_copy:
             self.define_cube()
+            self.sync_stickers()
         else:
             self.current_front = self.blue_face
+            if all(face is not None for face in (blue_face, red_face, orange_face, white_face, green_face, yellow_face)):
+                self.sync_stickers()
 
     def __repr__(self) -> str:
         """
@@ -130,38 +386,56 @@ Face    |3 6 9|3 6 9|7 4 1|3 6 9| Face
             str: string representation of a rubiks cube instance
 
         """
-        front = self.current_front
-        
-        front_grid = repr(front).split('\n')
-        left_grid = repr(front.left).split('\n')
-        right_grid = repr(front.right).split('\n')
-        top_grid = repr(front.top).split('\n')
-        opposite_grid = repr(front.opposite).split('\n')
-        bottom_grid = repr(front.bottom).split('\n')
+        return self.render()
 
-        try:
-            output = f"     _______\n"
-            output += (
-                f"     !{left_grid[0]}|\n     !{left_grid[1]}|\n     !{left_grid[2]}|\n"
-            )
-            output += "------------------------\n"
-            output += f"{front_grid[0]}|{bottom_grid[0]}|{opposite_grid[0]}|{top_grid[0]}|\n"
-            output += f"{front_grid[1]}|{bottom_grid[1]}|{opposite_grid[1]}|{top_grid[1]}|\n"
-            output += f"{front_grid[2]}|{bottom_grid[2]}|{opposite_grid[2]}|{top_grid[2]}|\n"
-            output += "------------------------\n"
-            output += (
-                f"     !{right_grid[0]}|\n     !{right_grid[1]}|\n     !{right_grid[2]}|\n"
-            )
-            output += f"     -------"
-        except IndexError:
-            raise CubeIntegrityError("Cube's current front face hasn't been transformed correctly. One or more essential attributes are of NoneType")
+    def __reduce__(self) -> tuple:
+        """
+        This method pickles the cube as its backend, the colour code of every sticker & its operation stack, instead of
+        its graph of faces & pieces, which is rebuilt on load (see from_array). Subscribers & stats aren't pickled.
 
+        Returns:
+            tuple: Function rebuilding the cube & its arguments
+
+        """
+        unshuffled = None
+        if self._unshuffled is not None:
+            unshuffled = bytes(self._snapshot_stickers(self._unshuffled))
+
+        return (_rebuild_cube, (self.backend, self.as_array().tobytes(), bytes(OP_CODES[op] for op in self.op_stack), unshuffled))
+
+    def render(self, ansi: bool = False) -> str:
+        """
+        This method renders the cube's net (see RubiksCube.__repr__). Renders are cached and only recomputed once the
+        cube's state has changed (see RubiksCube.version).
+
+        Args:
+            ansi (bool, optional): Flag indicating if the pieces should be coloured with ANSI escape codes. Defaults to False.
+
+        Raises:
+            CubeIntegrityError: Error representing that the cube's integrity was broken by a prior operation
+
+        Returns:
+            str: Rendered net of the cube
+
+        """
+        cached = self._renders.get(ansi)
+        if cached is not None and cached[0] == self.version:
+            return cached[1]
+
+        output = self._render(ansi)
+        self._renders[ansi] = (self.version, output)
         return output
 
+    def _render(self, ansi: bool) -> str:
+        try:
+            return render_net(self.faces, ansi)
+        except AttributeError:
+            raise CubeIntegrityError("Cube's current front face hasn't been transformed correctly. One or more essential attributes are of NoneType")
+
     @property
     def faces(self) -> list[Face]:
         """
-        This property returns a list of all the cube's faces in order of FACE_ORDER (defined above).
+        This property returns a list of all the cube's faces in order of FACE_ORDER (see constants.py).
 
         Returns:
             list: List of the cube's faces
@@ -176,6 +450,105 @@ Face    |3 6 9|3 6 9|7 4 1|3 6 9| Face
             self.current_front.bottom
         ]
 
+    @property
+    def pieces(self) -> list[Piece]:
+        """
+        This property returns a list of all the cube's pieces in sticker order, i.e. face by face in order of FACE_ORDER
+        (see constants.py) and row by row within each face's grid (see stickers.py).
+
+        Returns:
+            list: List of the cube's pieces
+
+        """
+        return [piece for face in self.faces for piece in face.grid.flat]
+
+    def place_pieces(self, pieces: list[Piece]) -> None:
+        """
+        This method places the pieces on the cube's faces in sticker order (see RubiksCube.pieces) and updates the
+        pieces' attributes. The pieces of a cubie must be placed together for the cube to keep its integrity.
+
+        Args:
+            pieces (list[Piece]): List of the 54 pieces in sticker order
+
+        """
+        for face_index, face in enumerate(self.faces):
+            face.grid = np.array(pieces[face_index * 9:(face_index + 1) * 9]).reshape(3, 3)
+            face.update_grid_attrs()
+        self.sync_stickers()
+        self.version += 1
+
+    def as_array(self, shape: tuple[int, ...] = (NUM_STICKERS,)) -> np.ndarray:
+        """
+        This method returns a read-only view of the colour code (see COLOUR_CODES) of every sticker, face by face in
+        order of FACE_ORDER (see constants.py) and row by row within each face's grid (see stickers.py). Nothing is
+        copied: the view is live and reflects every operation performed on the cube afterwards (copy it to keep a
+        snapshot). The bitboard backend is the exception: it returns a read-only snapshot (see BitboardCube.as_array).
+
+        Args:
+            shape (tuple[int, ...], optional): Shape of the view, (54,) or (6, 3, 3). Defaults to (54,).
+
+        Raises:
+            ValueError: Raised if the shape isn't valid.
+
+        Returns:
+            np.ndarray: Read-only uint8 view of the stickers' colour codes
+
+        """
+        if tuple(shape) not in ARRAY_SHAPES:
+            raise ValueError(f'Array shape must be one of {", ".join(map(str, ARRAY_SHAPES))}')
+
+        return self._stickers_view.reshape(shape)
+
+    def sync_stickers(self) -> None:
+        """
+        This method rebuilds the array of colour codes (see as_array) from the cube's pieces. Operations keep the array
+        up to date on their own; this is only needed if the faces' grids were changed directly.
+
+        """
+        self._stickers[:] = [COLOUR_CODES[piece.colour] for piece in self.pieces]
+
+    @classmethod
+    def from_array(cls, array: np.ndarray, backend: Optional[str] = None, validate: bool = False) -> RubiksCube:
+        """
+        This method creates a cube whose stickers have the given colour codes (see as_array). The cube is turned to the
+        perspective given by the array's center stickers, then each cubie of a solved cube is placed where its colours
+        are found in the array. The new cube's operation stack is empty.
+
+        Args:
+            array (np.ndarray): Colour code of every sticker, of shape (54,) or (6, 3, 3)
+            backend (str, optional): Name of the new cube's backend (see RubiksCube.__new__). Defaults to None (the class' backend).
+            validate (bool, optional): Flag indicating if the state must also be reachable (see validation.check_state). Defaults to False.
+
+        Raises:
+            ValueError: Raised if the array's shape or colour codes aren't valid.
+            CubeIntegrityError: Raised if the array's colours don't form the cubies of a rubiks cube (or, when validating, if the state isn't reachable).
+
+        Returns:
+            RubiksCube: New cube instance
+
+        """
+        array = np.asarray(array)
+        if array.shape not in ARRAY_SHAPES:
+            raise ValueError(f'Array shape must be one of {", ".join(map(str, ARRAY_SHAPES))}')
+        codes = array.reshape(NUM_STICKERS).tolist()
+        if not all(code in range(len(Colours)) for code in codes):
+            raise ValueError(f'Colour codes must be between 0 and {len(Colours) - 1}')
+        if validate:
+            from rubiks_cube.validation import check_state
+
+            check_state(array)
+
+        rotations = PERSPECTIVE_ROTATIONS.get(tuple(codes[4::9]))
+        if rotations is None:
+            raise CubeIntegrityError("Array's center stickers don't match any perspective of the cube")
+
+        cube = cls(backend=backend or cls.backend)
+        for op in rotations:
+            cube.perform(op, unshuffling=True)
+
+        cube._permute(_cubie_permutation(cube.as_array().tolist(), codes))
+        return cube
+
     def define_cube(self) -> None:
         """
         This method initializes the Rubiks Cube. The faces (type=Face) are created, edges are joined & opposite faces, positional attributes
@@ -296,7 +669,7 @@ Face    |3 6 9|3 6 9|7 4 1|3 6 9| Face
 
     def print_face_ids(self) -> None:
         """
-        This helper method displays the enumerated face instances part of the cube in the order of FACE_ORDER (defined above).
+        This helper method displays the enumerated face instances part of the cube in the order of FACE_ORDER (see constants.py).
 
         """
         for pos, face in zip(FACE_ORDER, self.faces):
@@ -318,17 +691,7 @@ Face    |3 6 9|3 6 9|7 4 1|3 6 9| Face
         if op not in rotate.rotations:
             raise InvalidOperationError
 
-        if not unshuffling:
-            if len(self.op_stack) > 0:
-                if self.op_stack[-1] == INVERSE_OP_MAPPING[op]:
-                    self.op_stack.pop()
-                else:
-                    self.op_stack.append(op)
-            else:
-                self.op_stack.append(op)
-            print(op.value)
-        
-        rotate.rotations[op](self)
+        self._apply(op, unshuffling)
 
     def invert(self, op: ops, unshuffling: bool = False) -> None:
         """
@@ -345,18 +708,8 @@ Face    |3 6 9|3 6 9|7 4 1|3 6 9| Face
         """ 
         if op not in invert.inversions:
             raise InvalidOperationError
-        
-        if not unshuffling:
-            if len(self.op_stack) > 0:
-                if self.op_stack[-1] == INVERSE_OP_MAPPING[op]:
-                    self.op_stack.pop()
-                else:
-                    self.op_stack.append(op)
-            else:
-                self.op_stack.append(op)
-            print(op.value)
-            
-        invert.inversions[op](self)
+
+        self._apply(op, unshuffling)
 
     def shift(self, op: ops, unshuffling: bool = False) -> None:
         """
@@ -373,18 +726,145 @@ Face    |3 6 9|3 6 9|7 4 1|3 6 9| Face
         """
         if op not in shift.shifts:
             raise InvalidOperationError
-        
+
+        self._apply(op, unshuffling)
+
+    def _apply(self, op: ops, unshuffling: bool) -> None:
+        """
+        This method performs a validated operation: the operation stack is updated (unless unshuffling), the operation
+        is applied to the backend's state (see _transform) and the subscribers are notified.
+
+        """
         if not unshuffling:
-            if len(self.op_stack) > 0:
-                if self.op_stack[-1] == INVERSE_OP_MAPPING[op]:
-                    self.op_stack.pop()
-                else:
-                    self.op_stack.append(op)
+            if self.op_stack and self.op_stack[-1] == INVERSE_OP_MAPPING[op]:
+                self.op_stack.pop()
             else:
                 self.op_stack.append(op)
-            print(op.value)
-            
-        shift.shifts[op](self)
+
+        self._transform(op)
+        self.version += 1
+        if self.subscribers:
+            self.notify(op, unshuffling)
+
+    def _transform(self, op: ops) -> None:
+        TRANSFORMS[op](self)
+        self._stickers[:] = self._stickers[STICKER_PERMUTATIONS[op]]
+
+    def _snapshot(self) -> object:
+        return self.pieces
+
+    def _restore(self, snapshot: object) -> None:
+        self.place_pieces(snapshot)
+
+    def _snapshot_stickers(self, snapshot: object) -> list[int]:
+        return [COLOUR_CODES[piece.colour] for piece in snapshot]
+
+    def _permute(self, permutation: list[int]) -> None:
+        """
+        This method moves the cube's stickers as per a sticker permutation (new[i] = old[permutation[i]]), which must
+        keep every cubie's stickers together.
+
+        """
+        pieces = self.pieces
+        self.place_pieces([pieces[index] for index in permutation])
+
+    def perform(self, op: ops, unshuffling: bool = False) -> None:
+        """
+        This method performs the specified operation, whether it is a rotation, inversion or shift operation.
+
+        Args:
+            op (Operations): Enumerated operation constant indicating which operation is requested.
+            unshuffling (bool, optional): Flag parameter indicating to the method if the operation
+                                        being requested is part of the unshuffling operation. Defaults to False.
+
+        Raises:
+            InvalidOperationError: Raised if the operation requested is not a valid operation.
+
+        """
+        if op in rotate.rotations:
+            self.rotate(op, unshuffling)
+        elif op in invert.inversions:
+            self.invert(op, unshuffling)
+        elif op in shift.shifts:
+            self.shift(op, unshuffling)
+        else:
+            raise InvalidOperationError
+
+    def subscribe(self, subscriber: Subscriber) -> None:
+        """
+        This method registers a subscriber, which is called with a MoveEvent after every operation performed on the cube.
+
+        Args:
+            subscriber (Callable[[MoveEvent], None]): Callable to be notified of every operation
+
+        """
+        self.subscribers.append(subscriber)
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        """
+        This method removes a previously registered subscriber.
+
+        Args:
+            subscriber (Callable[[MoveEvent], None]): Callable to be removed
+
+        """
+        self.subscribers.remove(subscriber)
+
+    def notify(self, op: ops, unshuffling: bool = False) -> None:
+        """
+        This method notifies every subscriber that an operation has been performed.
+
+        Args:
+            op (Operations): Operation that was performed
+            unshuffling (bool, optional): Flag indicating if the operation was performed as part of unshuffling the cube. Defaults to False.
+
+        """
+        event = MoveEvent(self, op, OP_MOVED_STICKERS[op], unshuffling)
+        for subscriber in self.subscribers:
+            subscriber(event)
+
+    def enable_stats(self, registry: Optional[OperationStats] = None) -> None:
+        """
+        This method starts counting & timing every operation performed on the cube (see stats.py). A timed version of the
+        backend's transform is installed on the instance, so cubes without stats enabled don't pay anything for it.
+
+        Args:
+            registry (OperationStats, optional): Shared stats (e.g. stats.REGISTRY) that the operations are also recorded to. Defaults to None.
+
+        """
+        stats = [self.stats()]
+        if registry is not None:
+            stats.append(registry)
+        transform = type(self)._transform
+
+        def timed_transform(op: ops) -> None:
+            start = perf_counter_ns()
+            transform(self, op)
+            elapsed = perf_counter_ns() - start
+            for recorder in stats:
+                recorder.record(op, elapsed)
+
+        self._transform = timed_transform
+
+    def disable_stats(self) -> None:
+        """
+        This method stops counting & timing operations. The stats recorded so far are kept (see stats).
+
+        """
+        self.__dict__.pop('_transform', None)
+
+    def stats(self) -> OperationStats:
+        """
+        This method returns the counts & latency histograms of the operations performed on the cube while its stats were
+        enabled (see enable_stats).
+
+        Returns:
+            OperationStats: Stats of the cube's operations
+
+        """
+        if self._stats is None:
+            self._stats = OperationStats()
+        return self._stats
 
     def reset_perspective(self) -> None:
         """
@@ -394,20 +874,22 @@ Face    |3 6 9|3 6 9|7 4 1|3 6 9| Face
         this process. Therefore, the positions of the pieces aren't changed.
 
         """
+        blue, white = COLOUR_CODES[Colours.BLUE], COLOUR_CODES[Colours.WHITE]
         while True:
-            if is_default_perspective(self):
+            centers = self.as_array()[4::9].tolist()
+            if centers == DEFAULT_CENTERS:
                 break
             else:
-                blue_face_side = self.blue_face.side_of_cube
+                blue_face_side = FACE_ORIENTATIONS[centers.index(blue)]
                 if blue_face_side == Orientation.TOP:
                     self.rotate(ops.ROTATE_DOWN)
                 elif blue_face_side == Orientation.BOTTOM:
                     self.rotate(ops.ROTATE_UP)
                 elif blue_face_side == Orientation.BACK:
-                    if is_white_face_top(self.current_front, self.white_face):
-                        self.invert(ops.INVERT_VERTICALLY)
-                    else:
+                    if centers[FACE_ORIENTATIONS.index(Orientation.BOTTOM)] == white:
                         self.invert(ops.INVERT_HORIZONTALLY)
+                    else:
+                        self.invert(ops.INVERT_VERTICALLY)
                 elif blue_face_side == Orientation.LEFT:
                     self.rotate(ops.ROTATE_RIGHT_VERTICALLY)
                 elif blue_face_side == Orientation.RIGHT:
@@ -415,13 +897,22 @@ Face    |3 6 9|3 6 9|7 4 1|3 6 9| Face
                 else:
                     self.rotate(ops.ROTATE_LEFT_HORIZONTALLY)
                     
-    def shuffle(self, num_ops: Optional[int] = None) -> None:
+    def shuffle(self, num_ops: Optional[int] = None, seed: Optional[Union[int, np.random.Generator]] = None, weights: Optional[dict[str, float]] = None, random_state: bool = False) -> None:
         """
         This method shuffles the cube by performing randomly chosen operations. Number of operations
-        is either randomly chosen (between 100 & 200) or can be supplied by the user.
+        is either randomly chosen (between 100 & 200) or can be supplied by the user. The whole sequence of
+        operations is drawn up front, so shuffles with the same seed are reproducible.
+
+        In random state mode, a uniformly random solvable state is drawn instead and its pieces are placed on the
+        cube in one step. No operations are performed, so the operation stack is left empty; the cube's previous
+        state is kept so that it can still be unshuffled.
 
         Args:
             num_ops (int, optional): Number of operations to be chosen while shuffling the cube. Defaults to None.
+            seed (int | np.random.Generator, optional): Seed or random number generator used to draw the operations. Defaults to None (unseeded).
+            weights (dict[str, float], optional): Relative weight of each category of operations ('inversions', 'rotations' & 'shifts'). 
+                                                Defaults to SHUFFLE_WEIGHTS (see operations.py).
+            random_state (bool, optional): Flag indicating if the cube should be shuffled into a random state directly. Defaults to False.
 
         Raises:
             OperationStackContentsError: Raised if the cube's operation stack's contents aren't compatible with the operation.
@@ -430,46 +921,45 @@ Face    |3 6 9|3 6 9|7 4 1|3 6 9| Face
         if len(self.op_stack) != 0:
             raise OperationStackContentsError
 
+        rng = np.random.default_rng(seed)
+        if random_state:
+            if self._unshuffled is None:
+                self._unshuffled = self._snapshot()
+            self._permute(random_state_permutation(rng))
+            return
+
         if num_ops:
             num_operations = num_ops
         else:
-            num_operations = np.random.randint(100, 200)
-
-        for _ in range(num_operations):
-            p = np.random.random()
-            if p > 0.95:
-                op = random.choice(list(invert.inversions.keys()))
-                self.invert(op)
-            elif 0.7 < p <= 0.95:
-                op = random.choice(list(rotate.rotations.keys()))
-                self.rotate(op)
-            else:
-                op = random.choice(list(shift.shifts.keys()))
-                self.shift(op)
+            num_operations = int(rng.integers(100, 200))
+
+        all_ops = list(ops)
+        for code in random_operations(num_operations, rng, weights):
+            self.perform(all_ops[code])
 
     def unshuffle(self) -> None:
         """
         This method unshuffles the cube by performing the inverse operations of the operations stored in the cube's
-        operation stack. The result of this operation is a fully new (& solved!) rubiks cube.
+        operation stack. If the cube was shuffled into a random state, its pieces are then placed back where they were
+        before the shuffle. The result of this operation is a fully new (& solved!) rubiks cube.
 
         Raises:
-            OperationStackContentsError: Raised if the operation stack is empty.
+            OperationStackContentsError: Raised if the operation stack is empty and the cube wasn't shuffled into a random state.
             InvalidOperationError: Raised when the cube's operation stack contains an invalid operation.
 
         """
-        if len(self.op_stack) == 0:
+        if len(self.op_stack) == 0 and self._unshuffled is None:
             raise OperationStackContentsError('Cannot unshuffle a solved cube. Try to perform some operations before trying to unshuffle.')
         
         for _ in range(len(self.op_stack)):
             inverse_op = INVERSE_OP_MAPPING[self.op_stack.pop()]
-            if inverse_op in rotate.rotations:
-                self.rotate(inverse_op, unshuffling=True)
-            elif inverse_op in invert.inversions:
-                self.invert(inverse_op, unshuffling=True)
-            elif inverse_op in shift.shifts:
-                self.shift(inverse_op, unshuffling=True)
-            else:
+            if inverse_op not in TRANSFORMS:
                 raise InvalidOperationError('Invalid operation requested while unshuffling!')
+            self._apply(inverse_op, unshuffling=True)
+
+        if self._unshuffled is not None:
+            self._restore(self._unshuffled)
+            self._unshuffled = None
 
 
 class Face:
@@ -552,35 +1042,21 @@ class Face:
             str: String representation of the current face's grid with respect to its position in its rubiks cube.
 
         """
-        first_row = ""
-        second_row = ""
-        third_row = ""
-        
-        if self.side_of_cube == Orientation.LEFT:
-            first_row = f"{self.grid[FacePositions.TOP_RIGHT]} {self.grid[FacePositions.TOP_CENTER]} {self.grid[FacePositions.TOP_LEFT]}"
-            second_row = f"{self.grid[FacePositions.MID_RIGHT]} {self.grid[FacePositions.CENTER]} {self.grid[FacePositions.MID_LEFT]}"
-            third_row = f"{self.grid[FacePositions.BOTTOM_RIGHT]} {self.grid[FacePositions.BOTTOM_CENTER]} {self.grid[FacePositions.BOTTOM_LEFT]}"
+        return render_face(self)
 
-        elif self.side_of_cube in [Orientation.FRONT, Orientation.BOTTOM, Orientation.TOP]:
-            first_row = f"{self.grid[FacePositions.TOP_LEFT]} {self.grid[FacePositions.MID_LEFT]} {self.grid[FacePositions.BOTTOM_LEFT]}"
-            second_row = f"{self.grid[FacePositions.TOP_CENTER]} {self.grid[FacePositions.CENTER]} {self.grid[FacePositions.BOTTOM_CENTER]}"
-            third_row = f"{self.grid[FacePositions.TOP_RIGHT]} {self.grid[FacePositions.MID_RIGHT]} {self.grid[FacePositions.BOTTOM_RIGHT]}"
-
-        elif self.side_of_cube == Orientation.BACK:
-            first_row = f"{self.grid[FacePositions.BOTTOM_RIGHT]} {self.grid[FacePositions.MID_RIGHT]} {self.grid[FacePositions.TOP_RIGHT]}"
-            second_row = f"{self.grid[FacePositions.BOTTOM_CENTER]} {self.grid[FacePositions.CENTER]} {self.grid[FacePositions.TOP_CENTER]}"
-            third_row = f"{self.grid[FacePositions.BOTTOM_LEFT]} {self.grid[FacePositions.MID_LEFT]} {self.grid[FacePositions.TOP_LEFT]}"
-
-        elif self.side_of_cube == Orientation.RIGHT:
-            first_row = f"{self.grid[FacePositions.BOTTOM_LEFT]} {self.grid[FacePositions.BOTTOM_CENTER]} {self.grid[FacePositions.BOTTOM_RIGHT]}"
-            second_row = f"{self.grid[FacePositions.MID_LEFT]} {self.grid[FacePositions.CENTER]} {self.grid[FacePositions.MID_RIGHT]}"
-            third_row = f"{self.grid[FacePositions.TOP_LEFT]} {self.grid[FacePositions.TOP_CENTER]} {self.grid[FacePositions.TOP_RIGHT]}" 
-        else:
-            raise InvalidOrientationError
+    def __reduce__(self) -> tuple:
+        """
+        This method pickles the face as the colour code of every sticker of its cube & its colour. The face is loaded as
+        part of a new cube (see RubiksCube.__reduce__), so identity isn't preserved: a face pickled together with its
+        cube, or with other faces & pieces of the same cube, is loaded into a separate cube of its own (e.g.
+        loads(dumps((cube, cube.faces[0])))[1] isn't a face of the loaded cube). Pickle the cube instead to keep them
+        together.
 
-        output = f"{first_row}\n{second_row}\n{third_row}"
+        Returns:
+            tuple: Function rebuilding the face & its arguments
 
-        return output
+        """
+        return (_rebuild_face, (_graph_stickers(self), self.colour))
 
     @property
     def colour(self) -> Colours:
@@ -722,10 +1198,10 @@ class Face:
             self.grid[FacePositions.MID_RIGHT].complement = self.right.grid[FacePositions.MID_LEFT]
             self.grid[FacePositions.BOTTOM_CENTER].complement = self.bottom.grid[FacePositions.BOTTOM_CENTER]
             
-            self.grid[FacePositions.TOP_LEFT].complements = {self.top.grid[FacePositions.TOP_RIGHT], self.right.grid[FacePositions.TOP_RIGHT]}
-            self.grid[FacePositions.TOP_RIGHT].complements = {self.top.grid[FacePositions.TOP_LEFT], self.left.grid[FacePositions.TOP_LEFT]}
-            self.grid[FacePositions.BOTTOM_LEFT].complements = {self.bottom.grid[FacePositions.BOTTOM_RIGHT], self.right.grid[FacePositions.BOTTOM_RIGHT]}
-            self.grid[FacePositions.BOTTOM_RIGHT].complements = {self.bottom.grid[FacePositions.BOTTOM_LEFT], self.left.grid[FacePositions.BOTTOM_LEFT]}
+            self.grid[FacePositions.TOP_LEFT].complements = {self.top.grid[FacePositions.TOP_RIGHT], self.left.grid[FacePositions.TOP_RIGHT]}
+            self.grid[FacePositions.TOP_RIGHT].complements = {self.top.grid[FacePositions.TOP_LEFT], self.right.grid[FacePositions.TOP_LEFT]}
+            self.grid[FacePositions.BOTTOM_LEFT].complements = {self.bottom.grid[FacePositions.BOTTOM_RIGHT], self.left.grid[FacePositions.BOTTOM_RIGHT]}
+            self.grid[FacePositions.BOTTOM_RIGHT].complements = {self.bottom.grid[FacePositions.BOTTOM_LEFT], self.right.grid[FacePositions.BOTTOM_LEFT]}
         elif self.side_of_cube == Orientation.LEFT:
             self.grid[FacePositions.TOP_CENTER].complement = self.top.grid[FacePositions.MID_LEFT]
             self.grid[FacePositions.MID_LEFT].complement = self.left.grid[FacePositions.MID_RIGHT]
@@ -841,6 +1317,19 @@ class Piece:
         """
         return self.colour.value[0]
 
+    def __reduce__(self) -> tuple:
+        """
+        This method pickles the piece as the colour code of every sticker of its cube, the colour of its face & its
+        position on the face. The piece is loaded as part of a new cube (see RubiksCube.__reduce__), so identity isn't
+        preserved: a piece pickled together with its cube, or with other faces & pieces of the same cube, is loaded into a
+        separate cube of its own (see Face.__reduce__). Pickle the cube instead to keep them together.
+
+        Returns:
+            tuple: Function rebuilding the piece & its arguments
+
+        """
+        return (_rebuild_piece, (_graph_stickers(self.face), self.face.colour, self.face_position))
+
     @property
     def colour(self) -> Colours:
         """
@@ -0,0 +1,199 @@
+"""
+This module contains the move-notation parser of the rubiks cube architecture. Algorithms written in standard cube
+notation (e.g. "R U R' U2") and/or as operation names (e.g. "SHIFT_TOP_ROW_LEFT") are compiled to operation codes
+(see OP_CODES), ready to be applied in bulk.
+
+Standard moves that the cube has no native operation for are compiled to equivalent sequences of operations, e.g. F is
+performed by rotating the cube so that the front face is on the right, turning the right column & rotating back:
+
+1. Face turns: R, L, U, D, F, B
+2. Slice turns: M, E, S
+3. Wide turns: r, l, u, d, f, b (or Rw, Lw, Uw, Dw, Fw, Bw)
+4. Cube rotations: x, y, z
+
+Every move can be followed by ' (counter-clockwise) or 2 (half turn). Tokens don't need to be separated by whitespace,
+and brackets, commas & anything after a '#' or '//' are ignored.
+
+"""
+from __future__ import annotations
+import re
+from itertools import chain
+from typing import Iterable
+from rubiks_cube.constants import Operations as ops, OP_CODES, INVERSE_OP_MAPPING
+from rubiks_cube.errors import InvalidOperationError
+import numpy as np
+
+# Clockwise quarter turn of each native move
+_NATIVE_MOVES = {
+    'R': [ops.SHIFT_RIGHT_COL_UP],
+    'L': [ops.SHIFT_LEFT_COL_DOWN],
+    'U': [ops.SHIFT_TOP_ROW_LEFT],
+    'D': [ops.SHIFT_BOTTOM_ROW_RIGHT],
+    'x': [ops.ROTATE_UP],
+    'y': [ops.ROTATE_LEFT_VERTICALLY],
+    'z': [ops.ROTATE_RIGHT_HORIZONTALLY]
+}
+
+# Clockwise quarter turn of each composite move, written in terms of the moves defined before it
+_COMPOSITE_MOVES = {
+    'F': "y' R y",
+    'B': "y R y'",
+    'M': "R L' x'",
+    'E': "U D' y'",
+    'S': "F' B z",
+    'r': "L x",
+    'l': "R x'",
+    'u': "D y",
+    'd': "U y'",
+    'f': "B z",
+    'b': "F z'"
+}
+
+# Half turns that the cube has a native operation for
+_NATIVE_HALF_TURNS = {
+    'y': [ops.INVERT_VERTICALLY],
+    'z': [ops.INVERT_HORIZONTALLY]
+}
+
+_WIDE_ALIASES = {move: f'{move.upper()}w' for move in 'rludfb'}
+
+TOKEN_PATTERN = re.compile(r"[A-Z]+(?:_[A-Z]+)+|[RLUDFBMESrludfbxyz]w?(?:2'|'2|2|')?|[^(),\[\]]")
+COMMENT_PATTERN = re.compile(r"(?:#|//)[^\n]*")
+
+
+def _inverse(sequence: list[ops]) -> list[ops]:
+    return [INVERSE_OP_MAPPING[op] for op in reversed(sequence)]
+
+
+def _simplify(sequence: list[ops]) -> list[ops]:
+    """
+    This function cancels operations followed by their inverse (see search.simplify).
+
+    """
+    simplified: list[ops] = []
+    for op in sequence:
+        if simplified and simplified[-1] == INVERSE_OP_MAPPING[op]:
+            simplified.pop()
+        else:
+            simplified.append(op)
+
+    return simplified
+
+
+def _build_move_table() -> dict[str, tuple[int, ...]]:
+    """
+    This function compiles every token of the notation (moves with all their suffixes & operation names) to its
+    sequence of operation codes.
+
+    Returns:
+        dict: Dictionary mapping each token to the operation codes it compiles to
+
+    """
+    quarter_turns: dict[str, list[ops]] = dict(_NATIVE_MOVES)
+    for move, algorithm in _COMPOSITE_MOVES.items():
+        quarter_turns[move] = _simplify(list(chain.from_iterable(
+            _expand(token, quarter_turns) for token in algorithm.split()
+        )))
+
+    sequences: dict[str, list[ops]] = {}
+    for move, quarter_turn in quarter_turns.items():
+        half_turn = _NATIVE_HALF_TURNS.get(move, _simplify(quarter_turn * 2))
+        for name in (move, _WIDE_ALIASES.get(move)):
+            if name is None:
+                continue
+            sequences[name] = quarter_turn
+            sequences[f"{name}'"] = _inverse(quarter_turn)
+            for suffix in ('2', "2'", "'2"):
+                sequences[f'{name}{suffix}'] = half_turn
+
+    table = {token: tuple(OP_CODES[op] for op in sequence) for token, sequence in sequences.items()}
+    table.update({op.name: (OP_CODES[op],) for op in ops})
+
+    return table
+
+
+def _expand(token: str, quarter_turns: dict[str, list[ops]]) -> list[ops]:
+    if token.endswith("'"):
+        return _inverse(quarter_turns[token[:-1]])
+    return quarter_turns[token]
+
+
+# Operation codes of every token of the notation
+MOVE_TABLE = _build_move_table()
+_MOVE_BYTES = {token: bytes(codes) for token, codes in MOVE_TABLE.items()}
+
+
+def _compile_chunk(chunk: str) -> bytes:
+    """
+    This function compiles a chunk of an algorithm that isn't a single token (e.g. "(RUR'U')") by splitting it into
+    tokens.
+
+    """
+    try:
+        return b''.join([_MOVE_BYTES[token] for token in TOKEN_PATTERN.findall(chunk)])
+    except KeyError as error:
+        raise InvalidOperationError(f"Unknown move '{error.args[0]}'")
+
+
+def parse(algorithm: str) -> np.ndarray:
+    """
+    This function compiles an algorithm to operation codes.
+
+    Args:
+        algorithm (str): Algorithm in standard cube notation and/or as operation names
+
+    Raises:
+        InvalidOperationError: Raised if the algorithm contains an unknown move.
+
+    Returns:
+        np.ndarray: Array of operation codes (see OP_CODES), in the order they should be performed
+
+    """
+    if '#' in algorithm or '//' in algorithm:
+        algorithm = COMMENT_PATTERN.sub('', algorithm)
+
+    # Most chunks between whitespace are single tokens, so they are looked up directly before being tokenized
+    lookup = _MOVE_BYTES.get
+    compiled = b''.join([lookup(chunk) or _compile_chunk(chunk) for chunk in algorithm.split()])
+
+    return np.frombuffer(bytearray(compiled), dtype=np.uint8)
+
+
+def parse_many(algorithms: Iterable[str]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    This function compiles a batch of algorithms (e.g. the lines of an algorithm file) to operation codes, stored
+    back to back in a single array.
+
+    Args:
+        algorithms (Iterable[str]): Algorithms in standard cube notation and/or as operation names
+
+    Raises:
+        InvalidOperationError: Raised if one of the algorithms contains an unknown move.
+
+    Returns:
+        tuple: Array of the operation codes of every algorithm & array of offsets, where the codes of the i-th algorithm
+               are codes[offsets[i]:offsets[i + 1]]
+
+    """
+    compiled = [parse(algorithm) for algorithm in algorithms]
+    offsets = np.zeros(len(compiled) + 1, dtype=np.int64)
+    np.cumsum([len(codes) for codes in compiled], out=offsets[1:])
+
+    if not compiled:
+        return np.zeros(0, dtype=np.uint8), offsets
+    return np.concatenate(compiled), offsets
+
+
+def to_operations(codes: Iterable[int]) -> list[ops]:
+    """
+    This function converts operation codes back to operations, e.g. to be performed on a rubiks cube instance.
+
+    Args:
+        codes (Iterable[int]): Operation codes (see OP_CODES)
+
+    Returns:
+        list[Operations]: Operations, in the same order
+
+    """
+    all_ops = list(ops)
+    return [all_ops[code] for code in codes]
@@ -0,0 +1,476 @@
+"""
+This module contains the NxN cubes of the rubiks cube architecture (2x2x2 up to 7x7x7). Nothing is hand-written per
+size: the sticker layout of stickers.py is generalised to n x n grids, and the sticker permutation of every slice move
+is generated from the stickers' positions & normals, then applied as a single gather on a uint8 array of colour codes
+(as the 'array' backend does). The cost of a move grows with the number of stickers (6 * n * n), not with code.
+
+Stickers are indexed face by face in the order of FACE_ORDER and row by row within each face's grid, i.e.
+index = face * n * n + row * n + col, following the same grid conventions as the 3x3x3 cube (see
+stickers.sticker_position). Positions are given in doubled coordinates, so that every coordinate is an integer for
+even sizes too (coordinates are odd on even cubes, and even on odd cubes).
+
+A move turns some layers about an axis. Layers are numbered from 0 (left, bottom or back) to n - 1 (right, top or
+front), so the familiar operations are the outer layer turns & whole cube turns of the same axes (see OP_TURNS):
+
+    cube = NxNCube(5)
+    cube.shift(Operations.SHIFT_RIGHT_COL_UP)
+    cube.turn(X_AXIS, 3, 3)
+
+"""
+from __future__ import annotations
+from functools import lru_cache
+from typing import NamedTuple, Optional, Union
+from rubiks_cube.constants import COLOUR_CODES, Orientation, Operations as ops
+from rubiks_cube.errors import InvalidOperationError, OperationStackContentsError
+from rubiks_cube.operations import Rotations as rotate, Inversions as invert, Shifts as shift
+from rubiks_cube.render import ANSI_CODE_LABELS, CODE_LABELS, FACE_ORIENTATIONS
+from rubiks_cube.stickers import FRONT, LEFT, RIGHT, TOP, OPPOSITE, BOTTOM, FACE_NORMALS, DEFAULT_FACE_COLOURS, OP_TURNS, ALL_LAYERS, Vector, _turn
+
+import numpy as np
+
+MIN_SIZE = 2
+MAX_SIZE = 7
+
+
+class Move(NamedTuple):
+
+    """
+    This is a class representing a move of an NxN cube: some layers turned about an axis.
+
+    ATTRIBUTES:
+        axis: Axis that the layers are turned about (X_AXIS, Y_AXIS or Z_AXIS, see stickers.py)
+        layers: Indices of the layers being turned, from 0 (negative end of the axis) to n - 1
+        quarter_turns: Number of counter-clockwise quarter turns (1 to 3), seen from the positive end of the axis
+
+    """
+
+    axis: int
+    layers: tuple[int, ...]
+    quarter_turns: int
+
+    def inverse(self) -> Move:
+        """
+        This method returns the move undoing this one.
+
+        Returns:
+            Move: Inverse move
+
+        """
+        return Move(self.axis, self.layers, (4 - self.quarter_turns) % 4)
+
+
+def _check_size(n: int) -> None:
+    if not MIN_SIZE <= n <= MAX_SIZE:
+        raise ValueError(f'Cube size must be between {MIN_SIZE} and {MAX_SIZE}')
+
+
+def sticker_position(n: int, face: int, row: int, col: int) -> Vector:
+    """
+    This function returns the position of the cubie that a sticker of an NxN cube belongs to, in doubled coordinates
+    between -(n - 1) and n - 1 (see stickers.sticker_position for the 3x3x3 cube).
+
+    Args:
+        n (int): Size of the cube
+        face (int): Index of the face in the order of FACE_ORDER
+        row (int): Row of the sticker in the face's grid
+        col (int): Column of the sticker in the face's grid
+
+    Returns:
+        tuple[int, int, int]: Position of the sticker's cubie
+
+    """
+    edge = n - 1
+    x, y = 2 * col - edge, edge - 2 * row
+    if face == FRONT:
+        return (x, y, edge)
+    if face == LEFT:
+        return (-edge, y, x)
+    if face == RIGHT:
+        return (edge, y, -x)
+    if face == OPPOSITE:
+        return (-x, y, -edge)
+    if face == TOP:
+        return (x, edge, -y)
+    return (x, -edge, y)
+
+
+@lru_cache(maxsize=None)
+def sticker_layout(n: int) -> tuple[tuple[Vector, Vector], ...]:
+    """
+    This function returns the position & outward normal of every sticker of an NxN cube, in sticker order.
+
+    Args:
+        n (int): Size of the cube
+
+    Raises:
+        ValueError: Raised if the size isn't supported.
+
+    Returns:
+        tuple: Position & normal of each sticker
+
+    """
+    _check_size(n)
+    return tuple(
+        (sticker_position(n, face, row, col), FACE_NORMALS[face])
+        for face in range(6)
+        for row in range(n)
+        for col in range(n)
+    )
+
+
+@lru_cache(maxsize=None)
+def move_permutation(n: int, move: Move) -> np.ndarray:
+    """
+    This function generates the sticker permutation of a move of an NxN cube, i.e. after the move the sticker at index i
+    holds the colour that was at index permutation[i] before it (see stickers.turn_permutation).
+
+    Args:
+        n (int): Size of the cube
+        move (Move): Move
+
+    Raises:
+        ValueError: Raised if the size isn't supported.
+
+    Returns:
+        np.ndarray: Sticker permutation of the move
+
+    """
+    layout = sticker_layout(n)
+    lookup = {sticker: index for index, sticker in enumerate(layout)}
+    coordinates = {2 * layer - (n - 1) for layer in move.layers}
+
+    permutation = np.arange(len(layout), dtype=np.intp)
+    for index, (position, normal) in enumerate(layout):
+        if position[move.axis] in coordinates:
+            turned = (_turn(position, move.axis, move.quarter_turns), _turn(normal, move.axis, move.quarter_turns))
+            permutation[lookup[turned]] = index
+
+    permutation.flags.writeable = False
+    return permutation
+
+
+def op_move(n: int, op: ops) -> Move:
+    """
+    This function returns the move performed by an operation on an NxN cube: rotations & inversions turn every layer,
+    shifts turn the outer layer (see stickers.OP_TURNS).
+
+    Args:
+        n (int): Size of the cube
+        op (Operations): Operation
+
+    Raises:
+        InvalidOperationError: Raised if the operation isn't valid.
+
+    Returns:
+        Move: Move of the operation
+
+    """
+    if op not in OP_TURNS:
+        raise InvalidOperationError
+
+    axis, layers, quarter_turns = OP_TURNS[op]
+    if layers == ALL_LAYERS:
+        return Move(axis, tuple(range(n)), quarter_turns)
+    return Move(axis, tuple(0 if layer < 0 else n - 1 for layer in layers), quarter_turns)
+
+
+def _display_grid(grid: np.ndarray, orientation: Orientation) -> np.ndarray:
+    """
+    This function lays a face's grid of sticker indices out in display order, as per the face's orientation (see
+    render.ORIENTATION_INDEX_MAPS for the 3x3x3 cube).
+
+    """
+    if orientation == Orientation.LEFT:
+        return grid[:, ::-1]
+    if orientation == Orientation.RIGHT:
+        return grid[::-1]
+    if orientation == Orientation.BACK:
+        return grid[::-1, ::-1].T
+    return grid.T
+
+
+@lru_cache(maxsize=None)
+def net_layout(n: int) -> tuple[str, tuple[int, ...]]:
+    """
+    This function builds the net of an NxN cube, laid out as the 3x3x3 cube's net (see RubiksCube.__repr__).
+
+    Args:
+        n (int): Size of the cube
+
+    Raises:
+        ValueError: Raised if the size isn't supported.
+
+    Returns:
+        tuple: Format string of the net, with one positional field per sticker shown, & the sticker shown at each field
+
+    """
+    _check_size(n)
+    grids = np.arange(6 * n * n).reshape(6, n, n)
+    displayed = [_display_grid(grids[face], orientation) for face, orientation in enumerate(FACE_ORIENTATIONS)]
+
+    # Fields of a row of a face, & the width of the row
+    row = ' '.join(['{}'] * n)
+    width = 2 * n - 1
+
+    template = ' ' * width + '_' * (width + 2) + '\n'
+    template += f'{" " * width}!{row}|\n' * n
+    template += '-' * (8 * n) + '\n'
+    template += f'{row}|{row}|{row}|{row}|\n' * n
+    template += '-' * (8 * n) + '\n'
+    template += f'{" " * width}!{row}|\n' * n
+    template += ' ' * width + '-' * (width + 2)
+
+    stickers = [int(index) for index in displayed[LEFT].flat]
+    for row in range(n):
+        for face in (FRONT, BOTTOM, OPPOSITE, TOP):
+            stickers += displayed[face][row].tolist()
+    stickers += [int(index) for index in displayed[RIGHT].flat]
+
+    return template, tuple(stickers)
+
+
+def solved_stickers(n: int) -> np.ndarray:
+    """
+    This function returns the colour code (see COLOUR_CODES) of every sticker of a solved NxN cube in the default
+    perspective.
+
+    Args:
+        n (int): Size of the cube
+
+    Raises:
+        ValueError: Raised if the size isn't supported.
+
+    Returns:
+        np.ndarray: uint8 colour codes, in sticker order
+
+    """
+    _check_size(n)
+    return np.repeat(np.array([COLOUR_CODES[colour] for colour in DEFAULT_FACE_COLOURS], dtype=np.uint8), n * n)
+
+
+class NxNCube:
+
+    """
+    This is a class representing an NxN cube, held as the colour code of each of its stickers in a single uint8 array.
+    Every move is a single gather with its generated sticker permutation (see move_permutation).
+
+    ATTRIBUTES:
+        n: Size of the cube (number of stickers along an edge)
+        op_stack: List that contains the stack of moves that have been performed on the cube
+        moves: Every single layer quarter, half & three-quarter turn of the cube (drawn from when shuffling)
+
+    METHODS:
+        as_array: Returns a read-only view of the colour code of every sticker
+        render: Renders the cube's net
+        turn: Turns a layer (or layers) of the cube about an axis
+        apply: Performs a move
+        rotate: Performs the specified rotation operation
+        invert: Performs the specified inversion operation
+        shift: Performs the specified shift operation (turning an outer layer)
+        perform: Performs the specified operation of any kind
+        shuffle: Shuffles the cube by performing random single layer moves
+        unshuffle: Unshuffles the cube by performing the inverse of the moves in its operation stack
+
+    """
+
+    def __init__(self, n: int = 3) -> None:
+        """
+        Constructor method for the NxNCube class. The cube is solved & in the default perspective.
+
+        Args:
+            n (int, optional): Size of the cube, between MIN_SIZE & MAX_SIZE. Defaults to 3.
+
+        Raises:
+            ValueError: Raised if the size isn't supported.
+
+        """
+        self.n = n
+        self.op_stack: list[Move] = []
+        self.moves = [Move(axis, (layer,), quarter_turns) for axis in range(3) for layer in range(n) for quarter_turns in (1, 2, 3)]
+
+        self._stickers = solved_stickers(n)
+        self._stickers_view = self._stickers.view()
+        self._stickers_view.flags.writeable = False
+
+    def __repr__(self) -> str:
+        return self.render()
+
+    def as_array(self, shape: Optional[tuple[int, ...]] = None) -> np.ndarray:
+        """
+        This method returns a read-only view of the colour code of every sticker, in sticker order (see
+        RubiksCube.as_array). The view is live and reflects every move performed on the cube afterwards.
+
+        Args:
+            shape (tuple[int, ...], optional): Shape of the view, (6 * n * n,) or (6, n, n). Defaults to None (6 * n * n,).
+
+        Raises:
+            ValueError: Raised if the shape isn't valid.
+
+        Returns:
+            np.ndarray: Read-only uint8 view of the stickers' colour codes
+
+        """
+        shapes = ((6 * self.n * self.n,), (6, self.n, self.n))
+        shape = shapes[0] if shape is None else tuple(shape)
+        if shape not in shapes:
+            raise ValueError(f'Array shape must be one of {", ".join(map(str, shapes))}')
+
+        return self._stickers_view.reshape(shape)
+
+    def render(self, ansi: bool = False) -> str:
+        """
+        This method renders the cube's net, laid out as the 3x3x3 cube's net (see RubiksCube.__repr__).
+
+        Args:
+            ansi (bool, optional): Flag indicating if the pieces should be coloured with ANSI escape codes. Defaults to False.
+
+        Returns:
+            str: Rendered net of the cube
+
+        """
+        template, net_stickers = net_layout(self.n)
+        labels = ANSI_CODE_LABELS if ansi else CODE_LABELS
+        stickers = self._stickers.tolist()
+        return template.format(*[labels[stickers[index]] for index in net_stickers])
+
+    def _apply(self, move: Move, unshuffling: bool) -> None:
+        if not unshuffling:
+            if self.op_stack and self.op_stack[-1] == move.inverse():
+                self.op_stack.pop()
+            else:
+                self.op_stack.append(move)
+
+        self._stickers[:] = self._stickers[move_permutation(self.n, move)]
+
+    def apply(self, move: Move, unshuffling: bool = False) -> None:
+        """
+        This method performs a move.
+
+        Args:
+            move (Move): Move to be performed
+            unshuffling (bool, optional): Flag indicating if the move is part of unshuffling the cube. Defaults to False.
+
+        Raises:
+            InvalidOperationError: Raised if the move's axis, layers or number of quarter turns aren't valid.
+
+        """
+        if move.axis not in range(3) or move.quarter_turns not in (1, 2, 3) or not move.layers or not all(layer in range(self.n) for layer in move.layers):
+            raise InvalidOperationError(f'Invalid move for a {self.n}x{self.n}x{self.n} cube: {move}')
+
+        self._apply(Move(move.axis, tuple(sorted(set(move.layers))), move.quarter_turns), unshuffling)
+
+    def turn(self, axis: int, layer: int, quarter_turns: int = 1) -> None:
+        """
+        This method turns a single layer of the cube about an axis.
+
+        Args:
+            axis (int): Axis that the layer is turned about (X_AXIS, Y_AXIS or Z_AXIS, see stickers.py)
+            layer (int): Index of the layer, from 0 (left, bottom or back) to n - 1 (right, top or front)
+            quarter_turns (int, optional): Number of counter-clockwise quarter turns, seen from the positive end of the axis. Defaults to 1.
+
+        Raises:
+            InvalidOperationError: Raised if the axis, layer or number of quarter turns isn't valid.
+
+        """
+        self.apply(Move(axis, (layer,), quarter_turns % 4))
+
+    def rotate(self, op: ops, unshuffling: bool = False) -> None:
+        """
+        This method performs the specified rotation operation, turning every layer of the cube (see RubiksCube.rotate).
+
+        Args:
+            op (Operations): Enumerated operation constant indicating which operation is requested.
+            unshuffling (bool, optional): Flag indicating if the operation is part of unshuffling the cube. Defaults to False.
+
+        Raises:
+            InvalidOperationError: Raised if the operation requested is not a valid rotation operation.
+
+        """
+        if op not in rotate.rotations:
+            raise InvalidOperationError
+
+        self._apply(op_move(self.n, op), unshuffling)
+
+    def invert(self, op: ops, unshuffling: bool = False) -> None:
+        """
+        This method performs the specified inversion operation, turning every layer of the cube (see RubiksCube.invert).
+
+        Args:
+            op (Operations): Enumerated operation constant indicating which operation is requested.
+            unshuffling (bool, optional): Flag indicating if the operation is part of unshuffling the cube. Defaults to False.
+
+        Raises:
+            InvalidOperationError: Raised if the operation requested is not a valid inversion operation.
+
+        """
+        if op not in invert.inversions:
+            raise InvalidOperationError
+
+        self._apply(op_move(self.n, op), unshuffling)
+
+    def shift(self, op: ops, unshuffling: bool = False) -> None:
+        """
+        This method performs the specified shift operation, turning the outer layer of the cube (see RubiksCube.shift).
+
+        Args:
+            op (Operations): Enumerated operation constant indicating which operation is requested.
+            unshuffling (bool, optional): Flag indicating if the operation is part of unshuffling the cube. Defaults to False.
+
+        Raises:
+            InvalidOperationError: Raised if the operation requested is not a valid shift operation.
+
+        """
+        if op not in shift.shifts:
+            raise InvalidOperationError
+
+        self._apply(op_move(self.n, op), unshuffling)
+
+    def perform(self, op: ops, unshuffling: bool = False) -> None:
+        """
+        This method performs the specified operation, whether it is a rotation, inversion or shift operation.
+
+        Args:
+            op (Operations): Enumerated operation constant indicating which operation is requested.
+            unshuffling (bool, optional): Flag indicating if the operation is part of unshuffling the cube. Defaults to False.
+
+        Raises:
+            InvalidOperationError: Raised if the operation requested is not a valid operation.
+
+        """
+        self._apply(op_move(self.n, op), unshuffling)
+
+    def shuffle(self, num_ops: Optional[int] = None, seed: Optional[Union[int, np.random.Generator]] = None) -> None:
+        """
+        This method shuffles the cube by performing randomly chosen single layer moves (see moves), every move being
+        equally likely.
+
+        Args:
+            num_ops (int, optional): Number of moves to be performed. Defaults to None (between 100 & 200).
+            seed (int | np.random.Generator, optional): Seed or random number generator used to draw the moves. Defaults to None (unseeded).
+
+        Raises:
+            OperationStackContentsError: Raised if the cube's operation stack isn't empty.
+
+        """
+        if len(self.op_stack) != 0:
+            raise OperationStackContentsError
+
+        rng = np.random.default_rng(seed)
+        num_moves = num_ops if num_ops else int(rng.integers(100, 200))
+
+        for index in rng.integers(0, len(self.moves), num_moves).tolist():
+            self._apply(self.moves[index], False)
+
+    def unshuffle(self) -> None:
+        """
+        This method unshuffles the cube by performing the inverse moves of the moves stored in its operation stack.
+
+        Raises:
+            OperationStackContentsError: Raised if the operation stack is empty.
+
+        """
+        if len(self.op_stack) == 0:
+            raise OperationStackContentsError('Cannot unshuffle a solved cube. Try to perform some operations before trying to unshuffle.')
+
+        while self.op_stack:
+            self._apply(self.op_stack.pop().inverse(), True)
@@ -4,8 +4,8 @@ partitioned into rotations, inversions & shifts.
 
 """
 from __future__ import annotations
-from rubiks_cube.constants import Operations as ops
-from typing import TYPE_CHECKING
+from rubiks_cube.constants import Operations as ops, OP_CODES
+from typing import Optional, TYPE_CHECKING
 from rubiks_cube.transformations import (
     RotateUp as ru, 
     RotateLeftVertical as rlv, 
@@ -15,6 +15,7 @@ from rubiks_cube.transformations import (
     BottomRowLeft as brl
     )
 import rubiks_cube.helper as help
+import numpy as np
 
 if TYPE_CHECKING:
     from rubiks_cube.models import RubiksCube
@@ -401,4 +402,56 @@ class Shifts:
         ops.SHIFT_TOP_ROW_RIGHT: top_row_right,
         ops.SHIFT_BOTTOM_ROW_LEFT: bottom_row_left,
         ops.SHIFT_BOTTOM_ROW_RIGHT: bottom_row_right
-    }
\ No newline at end of file
+    }
+
+
+# Default probability of each category of operations being chosen while shuffling
+SHUFFLE_WEIGHTS = {
+    'inversions': 0.05,
+    'rotations': 0.25,
+    'shifts': 0.7
+}
+
+CATEGORY_CODES = {
+    'inversions': np.array([OP_CODES[op] for op in Inversions.inversions], dtype=np.uint8),
+    'rotations': np.array([OP_CODES[op] for op in Rotations.rotations], dtype=np.uint8),
+    'shifts': np.array([OP_CODES[op] for op in Shifts.shifts], dtype=np.uint8)
+}
+
+
+def random_operations(num_ops: int, rng: np.random.Generator, weights: Optional[dict[str, float]] = None) -> np.ndarray:
+    """
+    This function draws a sequence of random operations in one vectorized draw. A category of operations (inversions,
+    rotations or shifts) is chosen for each operation based on the weights, and an operation is then chosen uniformly
+    from the category.
+
+    Args:
+        num_ops (int): Number of operations to be drawn
+        rng (np.random.Generator): Random number generator used for the draw
+        weights (dict[str, float], optional): Relative weight of each category of operations. Defaults to SHUFFLE_WEIGHTS.
+
+    Raises:
+        ValueError: Raised if the weights contain an unknown category or don't add up to a positive value.
+
+    Returns:
+        np.ndarray: Array of operation codes (see OP_CODES)
+
+    """
+    if weights is None:
+        weights = SHUFFLE_WEIGHTS
+    if not set(weights) <= set(CATEGORY_CODES):
+        raise ValueError(f'Shuffle weights can only be given for {", ".join(CATEGORY_CODES)}')
+
+    probabilities = np.array([weights.get(category, 0.0) for category in CATEGORY_CODES], dtype=float)
+    if (probabilities < 0).any() or probabilities.sum() <= 0:
+        raise ValueError('Shuffle weights must be non-negative and add up to a positive value')
+    probabilities /= probabilities.sum()
+
+    codes = np.concatenate(list(CATEGORY_CODES.values()))
+    sizes = np.array([len(category) for category in CATEGORY_CODES.values()])
+    offsets = np.cumsum(sizes) - sizes
+
+    categories = rng.choice(len(sizes), size=num_ops, p=probabilities)
+    picks = offsets[categories] + (rng.random(num_ops) * sizes[categories]).astype(np.intp)
+
+    return codes[picks]
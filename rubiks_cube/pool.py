@@ -0,0 +1,332 @@
+"""
+This module contains the cube pool of the rubiks cube architecture, for running very many cubes at once (e.g. one per
+puzzle session). A CubePool stores the colour code of every sticker of all its cubes in a single preallocated
+(capacity, 54) uint8 array, and hands out CubeHandle objects, each backed by a row of the array. Handles are slotted
+objects holding only their pool, their row & their operation stack, and expose the familiar operations API (rotate,
+invert, shift, perform, shuffle, unshuffle, op_stack...).
+
+Free rows are kept on a preallocated stack, so allocating & releasing a cube are O(1) and never resize anything:
+
+    pool = CubePool(1_000_000)
+    with pool.allocate() as cube:
+        cube.shift(Operations.SHIFT_TOP_ROW_LEFT)
+
+"""
+from __future__ import annotations
+from typing import Optional, Union
+from rubiks_cube.constants import Operations as ops, INVERSE_OP_MAPPING
+from rubiks_cube.errors import InvalidOperationError, OperationStackContentsError, PoolError
+from rubiks_cube.models import STICKER_PERMUTATIONS
+from rubiks_cube.operations import Rotations as rotate, Inversions as invert, Shifts as shift, random_operations
+from rubiks_cube.render import render_stickers
+from rubiks_cube.stickers import NUM_STICKERS, SOLVED_STICKERS
+
+import numpy as np
+
+SOLVED_ROW = np.array(SOLVED_STICKERS, dtype=np.uint8)
+
+# Row of a released handle, which no longer owns a row of its pool
+RELEASED_ROW = -1
+
+
+class CubePool:
+
+    """
+    This is a class representing a pool of cubes stored in a single preallocated array.
+
+    ATTRIBUTES:
+        capacity: Maximum number of cubes allocated at once
+        stickers: (capacity, 54) array of the colour code of every sticker of every row
+
+    METHODS:
+        allocate: Allocates a solved cube & returns its handle
+        release: Releases a cube's row back to the pool
+
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """
+        Constructor method for the CubePool class.
+
+        Args:
+            capacity (int): Maximum number of cubes allocated at once
+
+        Raises:
+            ValueError: Raised if the capacity isn't positive.
+
+        """
+        if capacity <= 0:
+            raise ValueError('Pool capacity must be positive')
+
+        self.capacity = capacity
+        self.stickers = np.empty((capacity, NUM_STICKERS), dtype=np.uint8)
+
+        # Stack of free rows (the first _num_free entries), lowest rows on top
+        self._free_rows = np.arange(capacity - 1, -1, -1, dtype=np.int64)
+        self._num_free = capacity
+
+    def __len__(self) -> int:
+        return self.capacity - self._num_free
+
+    def allocate(self) -> CubeHandle:
+        """
+        This method allocates a row of the pool to a new cube, in the solved state & default perspective.
+
+        Raises:
+            PoolError: Raised if every row of the pool is allocated.
+
+        Returns:
+            CubeHandle: Handle of the new cube
+
+        """
+        if self._num_free == 0:
+            raise PoolError(f'All {self.capacity} rows of the cube pool are allocated')
+
+        self._num_free -= 1
+        row = int(self._free_rows[self._num_free])
+        self.stickers[row] = SOLVED_ROW
+
+        return CubeHandle(self, row)
+
+    def release(self, handle: CubeHandle) -> None:
+        """
+        This method releases a cube's row back to the pool. The handle is invalidated (its row is set to RELEASED_ROW):
+        using it afterwards raises a PoolError, even once the row is allocated to another cube.
+
+        Args:
+            handle (CubeHandle): Handle of the cube
+
+        Raises:
+            PoolError: Raised if the handle was already released or belongs to another pool.
+
+        """
+        if handle.pool is not self:
+            raise PoolError('Cube handle belongs to another pool')
+        if handle.row == RELEASED_ROW:
+            raise PoolError('Cube handle was already released')
+
+        self._free_rows[self._num_free] = handle.row
+        self._num_free += 1
+        handle.row = RELEASED_ROW
+        handle.op_stack.clear()
+
+
+class CubeHandle:
+
+    """
+    This is a class representing a cube of a CubePool. It holds no state besides its operation stack: every operation
+    permutes the stickers in the handle's row of the pool.
+
+    ATTRIBUTES:
+        pool: Pool the cube belongs to
+        row: Row of the pool's array holding the cube's stickers (RELEASED_ROW once released)
+        op_stack: List that contains the stack of operations that have been performed on the cube
+
+    METHODS:
+        as_array: Returns a copy of the cube's row of the pool's array
+        render: Renders the cube's net
+        rotate: Performs the specified rotation operation
+        invert: Performs the specified inversion operation
+        shift: Performs the specified shift operation
+        perform: Performs the specified operation of any kind
+        shuffle: Shuffles the cube by performing random operations
+        unshuffle: Unshuffles the cube by performing the inverse of the operations in its operation stack
+        release: Releases the cube's row back to the pool
+
+    """
+
+    __slots__ = ('pool', 'row', 'op_stack')
+
+    def __init__(self, pool: CubePool, row: int) -> None:
+        """
+        Constructor method for the CubeHandle class (handles are created by CubePool.allocate).
+
+        Args:
+            pool (CubePool): Pool the cube belongs to
+            row (int): Row of the pool's array holding the cube's stickers
+
+        """
+        self.pool = pool
+        self.row = row
+        self.op_stack: list[ops] = []
+
+    def __repr__(self) -> str:
+        return self.render()
+
+    def __enter__(self) -> CubeHandle:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self.row != RELEASED_ROW:
+            self.release()
+
+    def _checked_row(self) -> int:
+        if self.row == RELEASED_ROW:
+            raise PoolError('Cube handle was already released')
+        return self.row
+
+    def as_array(self) -> np.ndarray:
+        """
+        This method returns the colour code of every sticker of the cube (see RubiksCube.as_array). Unlike
+        RubiksCube.as_array, the array is a copy of the cube's row of the pool, not a live view: a view would outlive the
+        handle & show another cube's stickers once the row is released & allocated again.
+
+        Raises:
+            PoolError: Raised if the handle was released.
+
+        Returns:
+            np.ndarray: Read-only uint8 copy of the stickers' colour codes
+
+        """
+        stickers = self.pool.stickers[self._checked_row()].copy()
+        stickers.flags.writeable = False
+        return stickers
+
+    def render(self, ansi: bool = False) -> str:
+        """
+        This method renders the cube's net (see RubiksCube.render).
+
+        Args:
+            ansi (bool, optional): Flag indicating if the pieces should be coloured with ANSI escape codes. Defaults to False.
+
+        Raises:
+            PoolError: Raised if the handle was released.
+
+        Returns:
+            str: Rendered net of the cube
+
+        """
+        return render_stickers(self.as_array().tolist(), ansi)
+
+    def _apply(self, op: ops, unshuffling: bool) -> None:
+        row = self._checked_row()
+        if not unshuffling:
+            if self.op_stack and self.op_stack[-1] == INVERSE_OP_MAPPING[op]:
+                self.op_stack.pop()
+            else:
+                self.op_stack.append(op)
+
+        stickers = self.pool.stickers
+        stickers[row] = stickers[row, STICKER_PERMUTATIONS[op]]
+
+    def rotate(self, op: ops, unshuffling: bool = False) -> None:
+        """
+        This method performs the specified rotation operation (see RubiksCube.rotate).
+
+        Args:
+            op (Operations): Enumerated operation constant indicating which operation is requested.
+            unshuffling (bool, optional): Flag indicating if the operation is part of unshuffling the cube. Defaults to False.
+
+        Raises:
+            InvalidOperationError: Raised if the operation requested is not a valid rotation operation.
+            PoolError: Raised if the handle was released.
+
+        """
+        if op not in rotate.rotations:
+            raise InvalidOperationError
+
+        self._apply(op, unshuffling)
+
+    def invert(self, op: ops, unshuffling: bool = False) -> None:
+        """
+        This method performs the specified inversion operation (see RubiksCube.invert).
+
+        Args:
+            op (Operations): Enumerated operation constant indicating which operation is requested.
+            unshuffling (bool, optional): Flag indicating if the operation is part of unshuffling the cube. Defaults to False.
+
+        Raises:
+            InvalidOperationError: Raised if the operation requested is not a valid inversion operation.
+            PoolError: Raised if the handle was released.
+
+        """
+        if op not in invert.inversions:
+            raise InvalidOperationError
+
+        self._apply(op, unshuffling)
+
+    def shift(self, op: ops, unshuffling: bool = False) -> None:
+        """
+        This method performs the specified shift operation (see RubiksCube.shift).
+
+        Args:
+            op (Operations): Enumerated operation constant indicating which operation is requested.
+            unshuffling (bool, optional): Flag indicating if the operation is part of unshuffling the cube. Defaults to False.
+
+        Raises:
+            InvalidOperationError: Raised if the operation requested is not a valid shift operation.
+            PoolError: Raised if the handle was released.
+
+        """
+        if op not in shift.shifts:
+            raise InvalidOperationError
+
+        self._apply(op, unshuffling)
+
+    def perform(self, op: ops, unshuffling: bool = False) -> None:
+        """
+        This method performs the specified operation, whether it is a rotation, inversion or shift operation.
+
+        Args:
+            op (Operations): Enumerated operation constant indicating which operation is requested.
+            unshuffling (bool, optional): Flag indicating if the operation is part of unshuffling the cube. Defaults to False.
+
+        Raises:
+            InvalidOperationError: Raised if the operation requested is not a valid operation.
+            PoolError: Raised if the handle was released.
+
+        """
+        if op not in STICKER_PERMUTATIONS:
+            raise InvalidOperationError
+
+        self._apply(op, unshuffling)
+
+    def shuffle(self, num_ops: Optional[int] = None, seed: Optional[Union[int, np.random.Generator]] = None, weights: Optional[dict[str, float]] = None) -> None:
+        """
+        This method shuffles the cube by performing randomly chosen operations (see RubiksCube.shuffle).
+
+        Args:
+            num_ops (int, optional): Number of operations to be chosen while shuffling the cube. Defaults to None (between 100 & 200).
+            seed (int | np.random.Generator, optional): Seed or random number generator used to draw the operations. Defaults to None (unseeded).
+            weights (dict[str, float], optional): Relative weight of each category of operations. Defaults to SHUFFLE_WEIGHTS (see operations.py).
+
+        Raises:
+            OperationStackContentsError: Raised if the cube's operation stack isn't empty.
+            PoolError: Raised if the handle was released.
+
+        """
+        if len(self.op_stack) != 0:
+            raise OperationStackContentsError
+
+        rng = np.random.default_rng(seed)
+        num_operations = num_ops if num_ops else int(rng.integers(100, 200))
+
+        all_ops = list(ops)
+        for code in random_operations(num_operations, rng, weights):
+            self._apply(all_ops[code], False)
+
+    def unshuffle(self) -> None:
+        """
+        This method unshuffles the cube by performing the inverse operations of the operations stored in its operation
+        stack (see RubiksCube.unshuffle).
+
+        Raises:
+            OperationStackContentsError: Raised if the operation stack is empty.
+            PoolError: Raised if the handle was released.
+
+        """
+        if len(self.op_stack) == 0:
+            raise OperationStackContentsError('Cannot unshuffle a solved cube. Try to perform some operations before trying to unshuffle.')
+
+        while self.op_stack:
+            self._apply(INVERSE_OP_MAPPING[self.op_stack.pop()], True)
+
+    def release(self) -> None:
+        """
+        This method releases the cube's row back to its pool (see CubePool.release).
+
+        Raises:
+            PoolError: Raised if the handle was already released.
+
+        """
+        self.pool.release(self)
@@ -75,3 +75,20 @@ def is_red_face_left(current_front: Face, red_face: Face) -> bool:
 
     """
     return current_front.left == red_face
+
+
+
+def is_solved(cube: RubiksCube) -> bool:
+    """
+    This function checks if the cube is solved i.e. every piece on every face has the same colour as the face's
+    center piece. The cube's perspective doesn't affect the result.
+
+    Args:
+        cube (RubiksCube): Rubiks Cube instance
+
+    Returns:
+        bool: returns if the cube instance is solved
+
+    """
+    stickers = cube.as_array((6, 3, 3))
+    return bool((stickers == stickers[:, 1:2, 1:2]).all())
@@ -0,0 +1,145 @@
+"""
+This module contains the precomputed move-pruning tables used when searching over rubiks cube states. Successor
+generation is indexed by the last one or two operations performed, and only yields operations that can start a
+canonical (non-redundant) sequence of operations.
+
+Every operation acts on a slot, which is a layer along one of the cube's three axes. Operations on different slots of
+the same axis commute, so they are only generated in increasing layer order. The following sequences are never generated:
+
+1. An operation followed by its inverse (see INVERSE_OP_MAPPING)
+2. The same operation three times in a row (equivalent to its inverse)
+3. Two consecutive inverse-direction operations on the same slot (equivalent to two operations in the other direction)
+4. Two consecutive operations on a slot that has its own half turn operation (the inversions)
+5. Two consecutive operations on the same axis, with the second one on a lower layer
+
+"""
+from __future__ import annotations
+from typing import Optional
+from rubiks_cube.constants import Operations as ops, INVERSE_OP_MAPPING
+
+History = tuple[Optional[ops], Optional[ops]]
+
+X_AXIS = 'x'
+Y_AXIS = 'y'
+Z_AXIS = 'z'
+
+# Maps each operation to the (axis, layer) slot that it acts on
+OP_SLOTS = {
+    ops.SHIFT_LEFT_COL_UP: (X_AXIS, 0),
+    ops.SHIFT_LEFT_COL_DOWN: (X_AXIS, 0),
+    ops.SHIFT_RIGHT_COL_UP: (X_AXIS, 1),
+    ops.SHIFT_RIGHT_COL_DOWN: (X_AXIS, 1),
+    ops.ROTATE_UP: (X_AXIS, 2),
+    ops.ROTATE_DOWN: (X_AXIS, 2),
+    ops.SHIFT_TOP_ROW_LEFT: (Y_AXIS, 0),
+    ops.SHIFT_TOP_ROW_RIGHT: (Y_AXIS, 0),
+    ops.SHIFT_BOTTOM_ROW_LEFT: (Y_AXIS, 1),
+    ops.SHIFT_BOTTOM_ROW_RIGHT: (Y_AXIS, 1),
+    ops.ROTATE_LEFT_VERTICALLY: (Y_AXIS, 2),
+    ops.ROTATE_RIGHT_VERTICALLY: (Y_AXIS, 2),
+    ops.INVERT_VERTICALLY: (Y_AXIS, 2),
+    ops.ROTATE_LEFT_HORIZONTALLY: (Z_AXIS, 0),
+    ops.ROTATE_RIGHT_HORIZONTALLY: (Z_AXIS, 0),
+    ops.INVERT_HORIZONTALLY: (Z_AXIS, 0)
+}
+
+# Slots that have their own half turn operation, so two consecutive operations on them are always redundant
+HALF_TURN_SLOTS = {OP_SLOTS[ops.INVERT_VERTICALLY], OP_SLOTS[ops.INVERT_HORIZONTALLY]}
+
+# Operations whose repetition represents a half turn of their slot (their inverses are never repeated)
+HALF_TURN_OPS = {
+    ops.ROTATE_UP,
+    ops.SHIFT_RIGHT_COL_UP,
+    ops.SHIFT_LEFT_COL_UP,
+    ops.SHIFT_TOP_ROW_LEFT,
+    ops.SHIFT_BOTTOM_ROW_LEFT
+}
+
+
+def is_canonical(history: History, op: ops) -> bool:
+    """
+    This function checks if an operation can follow the last two operations performed without making the sequence of
+    operations redundant.
+
+    Args:
+        history (tuple): Second last & last operations performed (None if fewer operations were performed)
+        op (Operations): Operation to be performed next
+
+    Returns:
+        bool: returns if the operation keeps the sequence canonical
+
+    """
+    second_last, last = history
+    if last is None:
+        return True
+
+    if op == INVERSE_OP_MAPPING[last]:
+        return False
+
+    axis, layer = OP_SLOTS[op]
+    last_axis, last_layer = OP_SLOTS[last]
+    if axis != last_axis:
+        return True
+
+    if layer == last_layer:
+        if OP_SLOTS[op] in HALF_TURN_SLOTS:
+            return False
+        return op == last and op in HALF_TURN_OPS and second_last != op
+
+    return layer > last_layer
+
+
+def build_successor_table(moves: Optional[list[ops]] = None) -> dict[History, tuple[ops, ...]]:
+    """
+    This function precomputes the canonical successor operations for every possible history of the last two operations.
+
+    Args:
+        moves (list[Operations], optional): Operations that can be performed. Defaults to all operations.
+
+    Returns:
+        dict: Dictionary mapping each history (second last, last operation) to the operations that can follow it
+
+    """
+    moves = list(moves) if moves else list(ops)
+    previous = [None, *ops]
+
+    return {
+        (second_last, last): tuple(op for op in moves if is_canonical((second_last, last), op))
+        for second_last in previous
+        for last in previous
+    }
+
+
+SUCCESSORS = build_successor_table()
+
+
+def successors(path: list[ops]) -> tuple[ops, ...]:
+    """
+    This function returns the canonical operations that can follow a sequence of operations.
+
+    Args:
+        path (list[Operations]): Sequence of operations performed so far
+
+    Returns:
+        tuple[Operations, ...]: Operations that can be performed next
+
+    """
+    return SUCCESSORS[history(path)]
+
+
+def history(path: list[ops]) -> History:
+    """
+    This function returns the last two operations of a sequence of operations, which index the successor tables.
+
+    Args:
+        path (list[Operations]): Sequence of operations performed so far
+
+    Returns:
+        tuple: Second last & last operations performed (None if fewer operations were performed)
+
+    """
+    if len(path) >= 2:
+        return path[-2], path[-1]
+    if path:
+        return None, path[-1]
+    return None, None
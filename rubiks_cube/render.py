@@ -0,0 +1,181 @@
+"""
+This module contains the renderer used to display a rubiks cube instance as a net (see RubiksCube.__repr__ for the
+layout). Each face's grid is read through a precomputed index map for the face's orientation, and the whole net is
+produced by formatting a single template, either with plain colour initials or with ANSI-coloured ones.
+
+"""
+from __future__ import annotations
+from string import Formatter
+from typing import TYPE_CHECKING
+from rubiks_cube.constants import Colours, Orientation
+from rubiks_cube.errors import InvalidOrientationError
+
+if TYPE_CHECKING:
+    from rubiks_cube.models import Face
+
+# Flat grid index of the piece shown at each of the 9 display positions (row by row), for each orientation
+ORIENTATION_INDEX_MAPS = {
+    Orientation.LEFT: (2, 1, 0, 5, 4, 3, 8, 7, 6),
+    Orientation.FRONT: (0, 3, 6, 1, 4, 7, 2, 5, 8),
+    Orientation.BOTTOM: (0, 3, 6, 1, 4, 7, 2, 5, 8),
+    Orientation.TOP: (0, 3, 6, 1, 4, 7, 2, 5, 8),
+    Orientation.BACK: (8, 5, 2, 7, 4, 1, 6, 3, 0),
+    Orientation.RIGHT: (6, 7, 8, 3, 4, 5, 0, 1, 2)
+}
+
+LABELS = {colour: colour.value[0] for colour in Colours}
+
+ANSI_RESET = '\033[0m'
+ANSI_CODES = {
+    Colours.BLUE: '\033[1;34m',
+    Colours.RED: '\033[1;31m',
+    Colours.ORANGE: '\033[1;38;5;208m',
+    Colours.WHITE: '\033[1;97m',
+    Colours.GREEN: '\033[1;32m',
+    Colours.YELLOW: '\033[1;33m'
+}
+ANSI_LABELS = {colour: f'{ANSI_CODES[colour]}{label}{ANSI_RESET}' for colour, label in LABELS.items()}
+
+# Labels of each colour code (see COLOUR_CODES)
+CODE_LABELS = [LABELS[colour] for colour in Colours]
+ANSI_CODE_LABELS = [ANSI_LABELS[colour] for colour in Colours]
+
+
+def _rows(face: int) -> list[str]:
+    fields = [f'{{{face * 9 + position}}}' for position in range(9)]
+    return [' '.join(fields[row * 3:row * 3 + 3]) for row in range(3)]
+
+
+def _build_template() -> str:
+    """
+    This function builds the format string of the net. Its fields are numbered in sticker order (see stickers.py), with
+    each face's fields laid out in display order.
+
+    Returns:
+        str: Format string of the net
+
+    """
+    front, left, right, top, opposite, bottom = (_rows(face) for face in range(6))
+
+    template = '     _______\n'
+    template += ''.join(f'     !{row}|\n' for row in left)
+    template += '------------------------\n'
+    template += ''.join(f'{front[row]}|{bottom[row]}|{opposite[row]}|{top[row]}|\n' for row in range(3))
+    template += '------------------------\n'
+    template += ''.join(f'     !{row}|\n' for row in right)
+    template += '     -------'
+
+    return template
+
+
+NET_TEMPLATE = _build_template()
+
+# Orientation of the face at each position of FACE_ORDER (the same for every perspective of the cube)
+FACE_ORIENTATIONS = [Orientation.FRONT, Orientation.LEFT, Orientation.RIGHT, Orientation.TOP, Orientation.BACK, Orientation.BOTTOM]
+
+
+def _build_sticker_cells() -> list[tuple[int, int]]:
+    """
+    This function locates every sticker (see stickers.py) in the plain net, as the line & column of its colour initial.
+
+    Returns:
+        list[tuple[int, int]]: Line & column of each sticker in the net, in sticker order
+
+    """
+    fields: dict[int, tuple[int, int]] = {}
+    line, column = 0, 0
+    for literal, field, _, _ in Formatter().parse(NET_TEMPLATE):
+        line += literal.count('\n')
+        column = len(literal) - literal.rfind('\n') - 1 if '\n' in literal else column + len(literal)
+        if field is not None:
+            fields[int(field)] = (line, column)
+            column += 1
+
+    return [
+        fields[face * 9 + ORIENTATION_INDEX_MAPS[orientation].index(index)]
+        for face, orientation in enumerate(FACE_ORIENTATIONS)
+        for index in range(9)
+    ]
+
+
+STICKER_CELLS = _build_sticker_cells()
+
+# Sticker shown at each field of the net template, in field order
+NET_STICKERS = [
+    face * 9 + ORIENTATION_INDEX_MAPS[orientation][position]
+    for face, orientation in enumerate(FACE_ORIENTATIONS)
+    for position in range(9)
+]
+
+
+def face_colours(face: Face) -> list[Colours]:
+    """
+    This function returns the colours of a face's pieces in display order, as per the face's orientation.
+
+    Args:
+        face (Face): Face instance
+
+    Raises:
+        InvalidOrientationError: Raised if the face has an invalid Orientation with respect to its cube.
+
+    Returns:
+        list[Colours]: Colours of the face's 9 pieces in display order
+
+    """
+    try:
+        index_map = ORIENTATION_INDEX_MAPS[face.side_of_cube]
+    except KeyError:
+        raise InvalidOrientationError
+
+    pieces = face.grid.flat
+    return [pieces[index].colour for index in index_map]
+
+
+def render_face(face: Face, ansi: bool = False) -> str:
+    """
+    This function renders a face's grid as per the face's orientation (see Face.__repr__).
+
+    Args:
+        face (Face): Face instance
+        ansi (bool, optional): Flag indicating if the pieces should be coloured with ANSI escape codes. Defaults to False.
+
+    Returns:
+        str: Rendered grid of the face
+
+    """
+    labels = ANSI_LABELS if ansi else LABELS
+    cells = [labels[colour] for colour in face_colours(face)]
+    return '\n'.join(' '.join(cells[row * 3:row * 3 + 3]) for row in range(3))
+
+
+def render_net(faces: list[Face], ansi: bool = False) -> str:
+    """
+    This function renders the net of a rubiks cube instance in a single pass (see RubiksCube.__repr__).
+
+    Args:
+        faces (list[Face]): The cube's faces in order of FACE_ORDER
+        ansi (bool, optional): Flag indicating if the pieces should be coloured with ANSI escape codes. Defaults to False.
+
+    Returns:
+        str: Rendered net of the cube
+
+    """
+    labels = ANSI_LABELS if ansi else LABELS
+    return NET_TEMPLATE.format(*[labels[colour] for face in faces for colour in face_colours(face)])
+
+
+def render_stickers(stickers: list[int], ansi: bool = False) -> str:
+    """
+    This function renders the net of a cube from the colour code of every sticker (see RubiksCube.as_array), for the
+    backends that don't model faces (see backends.py). The output is the same as render_net's.
+
+    Args:
+        stickers (list[int]): Colour code of every sticker, in sticker order
+        ansi (bool, optional): Flag indicating if the pieces should be coloured with ANSI escape codes. Defaults to False.
+
+    Returns:
+        str: Rendered net of the cube
+
+    """
+    labels = ANSI_CODE_LABELS if ansi else CODE_LABELS
+    return NET_TEMPLATE.format(*[labels[stickers[index]] for index in NET_STICKERS])
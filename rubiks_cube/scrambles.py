@@ -0,0 +1,253 @@
+"""
+This module contains the scramble generators of the rubiks cube architecture. Random-state scrambles are sampled
+uniformly from all reachable states of a cube by drawing the corner & edge permutations and orientations directly,
+with the parity & twist constraints of a real cube enforced.
+
+Bulk scrambles are generated lazily in chunks. Every chunk draws from its own random number stream, spawned from the
+seed's SeedSequence by chunk index, so the generated scrambles are identical whatever the number of worker processes.
+
+"""
+from __future__ import annotations
+import json
+from collections import deque
+from itertools import islice
+from typing import Any, Callable, Iterator, Optional, TextIO, BinaryIO, TypeVar, Union, TYPE_CHECKING
+from rubiks_cube.operations import random_operations
+from rubiks_cube.stickers import NUM_STICKERS, CORNER_FACELETS, EDGE_FACELETS, SOLVED_STICKERS
+import numpy as np
+
+if TYPE_CHECKING:
+    from multiprocessing.pool import Pool
+
+T = TypeVar('T')
+
+SCRAMBLE_KINDS = ('moves', 'state')
+
+# Number of scrambles generated from each random number stream
+CHUNK_SIZE = 4096
+
+# Number of chunks submitted to each worker process ahead of the consumer, bounding the memory held by finished chunks
+CHUNKS_IN_FLIGHT_PER_WORKER = 2
+
+_CORNERS = np.array(CORNER_FACELETS)
+_EDGES = np.array(EDGE_FACELETS)
+_SOLVED = np.array(SOLVED_STICKERS, dtype=np.uint8)
+
+
+def permutation_parities(permutations: np.ndarray) -> np.ndarray:
+    """
+    This function returns the parity of each permutation in a batch (0 if it is even, 1 if it is odd), by counting
+    its inversions.
+
+    Args:
+        permutations (np.ndarray): Array of shape (n, k) holding n permutations of the integers 0 to k - 1
+
+    Returns:
+        np.ndarray: Array of n parities
+
+    """
+    size = permutations.shape[-1]
+    upper = np.triu(np.ones((size, size), dtype=bool), 1)
+    inversions = (permutations[:, :, None] > permutations[:, None, :]) & upper
+    return inversions.sum(axis=(1, 2)) & 1
+
+
+def random_cubie_states(rng: np.random.Generator, size: int) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    This function draws a batch of uniformly random solvable cubie states. Corner & edge permutations have the same
+    parity, corner twists add up to a multiple of 3 and edge flips add up to a multiple of 2.
+
+    Args:
+        rng (np.random.Generator): Random number generator used for the draw
+        size (int): Number of states to be drawn
+
+    Returns:
+        tuple: Corner permutations, corner twists, edge permutations & edge flips (one row per state)
+
+    """
+    corner_perms = rng.permuted(np.tile(np.arange(len(CORNER_FACELETS)), (size, 1)), axis=1)
+    edge_perms = rng.permuted(np.tile(np.arange(len(EDGE_FACELETS)), (size, 1)), axis=1)
+
+    mismatched = permutation_parities(corner_perms) != permutation_parities(edge_perms)
+    edge_perms[mismatched, :2] = edge_perms[mismatched, 1::-1]
+
+    corner_twists = rng.integers(0, 3, (size, len(CORNER_FACELETS)))
+    corner_twists[:, -1] = -corner_twists[:, :-1].sum(axis=1) % 3
+
+    edge_flips = rng.integers(0, 2, (size, len(EDGE_FACELETS)))
+    edge_flips[:, -1] = edge_flips[:, :-1].sum(axis=1) % 2
+
+    return corner_perms, corner_twists, edge_perms, edge_flips
+
+
+def random_state_permutations(rng: np.random.Generator, size: int) -> np.ndarray:
+    """
+    This function draws a batch of uniformly random solvable states as permutations of the stickers (see stickers.py).
+    Applying a permutation to any solvable state, i.e. new_stickers[i] = stickers[permutation[i]], results in a uniformly
+    random solvable state. Center stickers are never moved.
+
+    Args:
+        rng (np.random.Generator): Random number generator used for the draw
+        size (int): Number of states to be drawn
+
+    Returns:
+        np.ndarray: Array of shape (size, 54) holding the sticker permutations
+
+    """
+    corner_perms, corner_twists, edge_perms, edge_flips = random_cubie_states(rng, size)
+    permutations = np.tile(np.arange(NUM_STICKERS), (size, 1))
+
+    orientations = (np.arange(3) + corner_twists[:, :, None]) % 3
+    permutations[:, _CORNERS] = _CORNERS[corner_perms[:, :, None], orientations]
+
+    orientations = (np.arange(2) + edge_flips[:, :, None]) % 2
+    permutations[:, _EDGES] = _EDGES[edge_perms[:, :, None], orientations]
+
+    return permutations
+
+
+def random_state_permutation(rng: np.random.Generator) -> np.ndarray:
+    """
+    This function draws a single uniformly random solvable state as a permutation of the stickers
+    (see random_state_permutations).
+
+    Args:
+        rng (np.random.Generator): Random number generator used for the draw
+
+    Returns:
+        np.ndarray: Permutation of the 54 sticker indices
+
+    """
+    return random_state_permutations(rng, 1)[0]
+
+
+def generate_chunk(seed: np.random.SeedSequence, size: int, kind: str = 'moves', num_ops: int = 25, weights: Optional[dict[str, float]] = None) -> np.ndarray:
+    """
+    This function generates a chunk of scrambles from a single random number stream.
+
+    Args:
+        seed (np.random.SeedSequence): Seed sequence of the chunk's random number stream
+        size (int): Number of scrambles in the chunk
+        kind (str, optional): 'moves' for random sequences of operations, 'state' for random states. Defaults to 'moves'.
+        num_ops (int, optional): Number of operations in each sequence (for 'moves' scrambles). Defaults to 25.
+        weights (dict[str, float], optional): Relative weight of each category of operations (for 'moves' scrambles). Defaults to None.
+
+    Returns:
+        np.ndarray: Array of shape (size, num_ops) holding operation codes (see OP_CODES) for 'moves' scrambles, or of shape
+                    (size, 54) holding the sticker colour codes (see COLOUR_CODES) of states in the default perspective for 'state' scrambles
+
+    """
+    rng = np.random.default_rng(seed)
+    if kind == 'moves':
+        return random_operations(size * num_ops, rng, weights).reshape(size, num_ops)
+    return _SOLVED[random_state_permutations(rng, size)]
+
+
+def _generate_chunk(args: tuple) -> np.ndarray:
+    return generate_chunk(*args)
+
+
+def imap_bounded(pool: Pool, func: Callable[[Any], T], tasks: Iterator[Any], workers: int) -> Iterator[T]:
+    """
+    This function maps a function over tasks in a process pool, yielding the results in order. Unlike Pool.imap, the
+    tasks are drawn lazily: at most CHUNKS_IN_FLIGHT_PER_WORKER tasks per worker are submitted ahead of the consumer, so
+    neither the tasks nor the finished results pile up in memory.
+
+    Args:
+        pool (multiprocessing.pool.Pool): Process pool
+        func (Callable): Picklable function applied to each task
+        tasks (Iterator): Tasks, drawn as results are consumed
+        workers (int): Number of worker processes of the pool
+
+    Yields:
+        Results of the function, in the tasks' order
+
+    """
+    tasks = iter(tasks)
+    pending = deque(pool.apply_async(func, (task,)) for task in islice(tasks, workers * CHUNKS_IN_FLIGHT_PER_WORKER))
+    while pending:
+        result = pending.popleft().get()
+        for task in islice(tasks, 1):
+            pending.append(pool.apply_async(func, (task,)))
+        yield result
+
+
+def iter_scrambles(n: int, seed: Optional[int] = None, workers: int = 1, kind: str = 'moves', num_ops: int = 25, weights: Optional[dict[str, float]] = None, chunk_size: int = CHUNK_SIZE) -> Iterator[np.ndarray]:
+    """
+    This function lazily generates n scrambles in chunks, optionally fanning the work out across worker processes.
+    Chunk i draws from the random number stream spawned from the seed with spawn key i, so the output only depends on
+    the seed & chunk size, not on the number of workers. At most CHUNKS_IN_FLIGHT_PER_WORKER chunks per worker are
+    generated ahead of the consumer, so a slow consumer doesn't make finished chunks pile up in memory.
+
+    Args:
+        n (int): Number of scrambles to be generated
+        seed (int, optional): Seed for the scrambles. Defaults to None (unseeded).
+        workers (int, optional): Number of worker processes. Defaults to 1 (generated in the current process).
+        kind (str, optional): 'moves' for random sequences of operations, 'state' for random states. Defaults to 'moves'.
+        num_ops (int, optional): Number of operations in each sequence (for 'moves' scrambles). Defaults to 25.
+        weights (dict[str, float], optional): Relative weight of each category of operations (for 'moves' scrambles). Defaults to None.
+        chunk_size (int, optional): Number of scrambles in each chunk. Defaults to CHUNK_SIZE.
+
+    Raises:
+        ValueError: Raised if the kind of scramble isn't valid.
+
+    Yields:
+        np.ndarray: Chunks of scrambles (see generate_chunk), in order
+
+    """
+    if kind not in SCRAMBLE_KINDS:
+        raise ValueError(f'Scramble kind must be one of {", ".join(SCRAMBLE_KINDS)}')
+
+    root = np.random.SeedSequence(seed)
+    tasks = (
+        (
+            np.random.SeedSequence(root.entropy, spawn_key=root.spawn_key + (index,)),
+            min(chunk_size, n - start),
+            kind,
+            num_ops,
+            weights
+        )
+        for index, start in enumerate(range(0, n, chunk_size))
+    )
+
+    if workers <= 1:
+        for task in tasks:
+            yield _generate_chunk(task)
+        return
+
+    from multiprocessing import Pool
+
+    with Pool(workers) as pool:
+        yield from imap_bounded(pool, _generate_chunk, tasks, workers)
+
+
+def write_scrambles(sink: Union[TextIO, BinaryIO], chunks: Iterator[np.ndarray], fmt: str = 'jsonl') -> int:
+    """
+    This function writes chunks of scrambles to a sink. In 'jsonl' format, every scramble is written as a JSON list of
+    codes on its own line. In 'binary' format, every scramble is written as a row of unsigned bytes, so the output can be
+    read back with np.fromfile(path, dtype=np.uint8).reshape(-1, row_length).
+
+    Args:
+        sink (TextIO | BinaryIO): Text (for 'jsonl') or binary (for 'binary') file object
+        chunks (Iterator[np.ndarray]): Chunks of scrambles (see iter_scrambles)
+        fmt (str, optional): 'jsonl' or 'binary'. Defaults to 'jsonl'.
+
+    Raises:
+        ValueError: Raised if the format isn't valid.
+
+    Returns:
+        int: Number of scrambles written
+
+    """
+    if fmt not in ('jsonl', 'binary'):
+        raise ValueError("Scramble format must be one of jsonl, binary")
+
+    written = 0
+    for chunk in chunks:
+        if fmt == 'binary':
+            sink.write(chunk.astype(np.uint8).tobytes())
+        else:
+            sink.write(''.join(json.dumps(row) + '\n' for row in chunk.tolist()))
+        written += len(chunk)
+
+    return written
@@ -0,0 +1,466 @@
+"""
+This module contains the search utilities used to explore & solve rubiks cube states within the rubiks cube architecture.
+Searches are performed in place on the rubiks cube instance (operations are applied and then undone), so the cube
+instance is always left in the same state that it was passed in.
+
+"""
+from __future__ import annotations
+import time
+from collections import OrderedDict
+from typing import Callable, Iterator, Optional, TYPE_CHECKING
+from rubiks_cube.constants import Operations as ops, OP_CODES, INVERSE_OP_MAPPING
+from rubiks_cube.errors import DeadlineExceededError
+from rubiks_cube.helper import state_key
+from rubiks_cube.predicates import is_solved
+from rubiks_cube.pruning import build_successor_table, history
+from rubiks_cube.stickers import NUM_STICKERS, apply_operations
+
+if TYPE_CHECKING:
+    from rubiks_cube.models import RubiksCube
+
+
+class TranspositionTable:
+
+    """
+    This is a class representing a transposition table for searches over rubiks cube states. Each entry maps a state key
+    (see helper.state_key) to the deepest search depth that has already been explored from that state without finding a
+    solution. The table has a fixed memory budget; once it is full, the least recently used entry is evicted.
+
+    ATTRIBUTES:
+        capacity: Maximum number of entries the table holds
+        hits: Number of probes that found an entry
+        misses: Number of probes that didn't find an entry
+        evictions: Number of entries evicted to stay within the memory budget
+
+    PROPERTIES:
+        hit_rate: Fraction of probes that found an entry
+
+    METHODS:
+        probe: Returns the depth stored for a state key, if any
+        store: Stores the depth explored from a state key
+        clear: Removes all entries & resets the statistics
+        stats: Returns the table's statistics
+
+    """
+
+    # Approximate size (in bytes) of a single entry: a key of at most 54 bytes (plus the last operations), an int value & the ordered dict's bookkeeping
+    ENTRY_SIZE: int = 256
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024) -> None:
+        """
+        Constructor method for the TranspositionTable class.
+
+        Args:
+            max_bytes (int, optional): Memory budget for the table, in bytes. Defaults to 64 MiB.
+
+        """
+        self.capacity = max(1, max_bytes // TranspositionTable.ENTRY_SIZE)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[bytes, int] = OrderedDict()
+
+    def __len__(self) -> int:
+        """
+        This method returns the number of entries in the table.
+
+        Returns:
+            int: Number of entries in the table
+
+        """
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        This property returns the fraction of probes that found an entry in the table.
+
+        Returns:
+            float: Hit rate between 0 & 1 (0 if the table hasn't been probed yet)
+
+        """
+        probes = self.hits + self.misses
+        return self.hits / probes if probes else 0.0
+
+    def probe(self, key: bytes) -> Optional[int]:
+        """
+        This method looks up a state key in the table. A successful probe marks the entry as most recently used.
+
+        Args:
+            key (bytes): State key of the rubiks cube instance
+
+        Returns:
+            int | None: Depth already explored from the state or None (if the state isn't in the table)
+
+        """
+        depth = self._entries.get(key)
+        if depth is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return depth
+
+    def store(self, key: bytes, depth: int) -> None:
+        """
+        This method stores the depth explored from a state key. An existing entry is only replaced by a deeper one.
+        If the table is full, the least recently used entry is evicted.
+
+        Args:
+            key (bytes): State key of the rubiks cube instance
+            depth (int): Number of moves explored from the state without finding a solution
+
+        """
+        stored = self._entries.get(key)
+        if stored is not None:
+            self._entries[key] = max(stored, depth)
+            self._entries.move_to_end(key)
+            return
+
+        if len(self._entries) >= self.capacity:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        self._entries[key] = depth
+
+    def clear(self) -> None:
+        """
+        This method removes all entries from the table and resets its statistics.
+
+        """
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self) -> dict[str, float]:
+        """
+        This method returns the table's statistics.
+
+        Returns:
+            dict: Dictionary containing the entries, capacity, hits, misses, evictions & hit rate of the table
+
+        """
+        return {
+            'entries': len(self._entries),
+            'capacity': self.capacity,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hit_rate
+        }
+
+
+class Solver:
+
+    """
+    This is a class representing an iterative deepening solver for rubiks cube instances. Solutions are lists of operations
+    that can be replayed on the cube instance (using RubiksCube.perform) to solve it. Only canonical sequences of operations
+    are searched (see pruning.py).
+
+    ATTRIBUTES:
+        table: Transposition table used to skip states that have already been explored (None disables it)
+        moves: Operations that the solver is allowed to perform
+        successors: Successor table mapping the last two operations performed to the operations that can follow them
+        nodes: Number of states expanded by the most recent search
+
+    METHODS:
+        solve: Searches for the shortest solution of a rubiks cube instance
+        iter_solutions: Generates progressively shorter solutions of a rubiks cube instance until a deadline
+        solve_within: Returns the shortest solution of a rubiks cube instance found before a deadline
+
+    """
+
+    # Number of states expanded between two checks of the deadline
+    DEADLINE_CHECK_INTERVAL: int = 16
+
+    # Number of operations of a candidate solution replayed on the stickers between two checks of the deadline
+    REPLAY_CHECK_INTERVAL: int = 256
+
+    # Longest sequence of operations that is replaced by a shorter equivalent when improving a solution
+    MAX_WINDOW: int = 4
+
+    def __init__(self, table: Optional[TranspositionTable] = None, moves: Optional[list[ops]] = None) -> None:
+        """
+        Constructor method for the Solver class.
+
+        Args:
+            table (TranspositionTable, optional): Transposition table plugged into the search. Defaults to None.
+            moves (list[Operations], optional): Operations the solver is allowed to perform. Defaults to all operations.
+
+        """
+        self.table = table
+        self.moves = list(moves) if moves else list(ops)
+        self.successors = build_successor_table(self.moves)
+        self.nodes = 0
+
+    def solve(self, cube: RubiksCube, max_depth: int = 6) -> Optional[list[ops]]:
+        """
+        This method searches for the shortest solution (up to max_depth operations) of the rubiks cube instance.
+        The cube instance is left unchanged.
+
+        Args:
+            cube (RubiksCube): Rubiks Cube instance to be solved
+            max_depth (int, optional): Maximum number of operations in the solution. Defaults to 6.
+
+        Returns:
+            list[Operations] | None: returns the solution or None (if no solution exists within max_depth operations)
+
+        """
+        self.nodes = 0
+        for depth in range(max_depth + 1):
+            solution = self._search(cube, depth)
+            if solution is not None:
+                return solution
+
+        return None
+
+    def iter_solutions(self, cube: RubiksCube, time_limit: float, max_depth: int = 20) -> Iterator[list[ops]]:
+        """
+        This method generates progressively shorter solutions of the rubiks cube instance until the time limit expires.
+        The first solution is the inverse of the cube's operation stack (if any, and only if it does solve the cube: it
+        doesn't once the cube was shuffled into a random state, see RubiksCube.shuffle). It is then improved by replacing short
+        sequences of operations with shorter equivalents, and finally by searching for the shortest solution. The cube
+        instance is left unchanged whenever a solution is generated.
+
+        Args:
+            cube (RubiksCube): Rubiks Cube instance to be solved
+            time_limit (float): Number of seconds the search is allowed to run for
+            max_depth (int, optional): Maximum number of operations searched for if the cube's operation stack is empty. Defaults to 20.
+
+        Yields:
+            list[Operations]: Solutions of the cube instance, each one shorter than the previous one
+
+        """
+        deadline = time.monotonic() + time_limit
+        self.nodes = 0
+
+        if is_solved(cube):
+            yield []
+            return
+
+        best = None
+        try:
+            if cube.op_stack:
+                candidate = simplify([INVERSE_OP_MAPPING[op] for op in reversed(cube.op_stack)])
+                if self._solves(cube, candidate, deadline):
+                    best = candidate
+                    yield list(best)
+
+            improved = best is not None
+            while improved:
+                improved = False
+                for window in range(2, Solver.MAX_WINDOW + 1):
+                    begin = 0
+                    while True:
+                        result = self._improve_window(cube, best, window, begin, deadline)
+                        if result is None:
+                            break
+                        best, begin = result
+                        improved = True
+                        yield list(best)
+
+            limit = len(best) - 1 if best is not None else max_depth
+            for depth in range(limit + 1):
+                solution = self._search(cube, depth, deadline=deadline)
+                if solution is not None:
+                    yield solution
+                    return
+        except DeadlineExceededError:
+            return
+
+    def solve_within(self, cube: RubiksCube, time_limit: float, callback: Optional[Callable[[list[ops]], None]] = None) -> Optional[list[ops]]:
+        """
+        This method returns the shortest solution of the rubiks cube instance found before the time limit expires.
+        The cube instance is left unchanged.
+
+        Args:
+            cube (RubiksCube): Rubiks Cube instance to be solved
+            time_limit (float): Number of seconds the search is allowed to run for
+            callback (Callable, optional): Function called with every improved solution as soon as it is found. Defaults to None.
+
+        Returns:
+            list[Operations] | None: returns the shortest solution found or None (if no solution was found in time)
+
+        """
+        best = None
+        for solution in self.iter_solutions(cube, time_limit):
+            best = solution
+            if callback:
+                callback(solution)
+
+        return best
+
+    @staticmethod
+    def _solves(cube: RubiksCube, solution: list[ops], deadline: float) -> bool:
+        """
+        This method checks if a sequence of operations solves the rubiks cube instance. The operations are replayed on a
+        copy of the cube's stickers with the sticker permutation tables (see stickers.apply_operations), so the cube
+        instance isn't touched.
+
+        Args:
+            cube (RubiksCube): Rubiks Cube instance
+            solution (list[Operations]): Sequence of operations to be checked
+            deadline (float): time.monotonic() value after which the check is stopped
+
+        Raises:
+            DeadlineExceededError: Raised if the deadline expires during the check.
+
+        Returns:
+            bool: returns if the cube instance is solved once the operations are performed
+
+        """
+        stickers = cube.as_array().tolist()
+        for start in range(0, len(solution), Solver.REPLAY_CHECK_INTERVAL):
+            _check_deadline(deadline)
+            stickers = apply_operations(stickers, solution[start:start + Solver.REPLAY_CHECK_INTERVAL])
+
+        # Solved when every sticker of each face has the colour of the face's center sticker
+        return all(stickers[index] == stickers[index - index % 9 + 4] for index in range(NUM_STICKERS))
+
+    def _improve_window(self, cube: RubiksCube, solution: list[ops], window: int, begin: int, deadline: float) -> Optional[tuple[list[ops], int]]:
+        """
+        This method looks for a sequence of window operations in a solution (starting at or after begin) that can be replaced
+        by a shorter equivalent, i.e. a sequence that leaves the cube instance in exactly the same state.
+
+        Args:
+            cube (RubiksCube): Rubiks Cube instance that the solution solves
+            solution (list[Operations]): Solution to be improved
+            window (int): Number of operations in the sequences to be replaced
+            begin (int): Index of the solution's first operation to be considered
+            deadline (float): time.monotonic() value after which the search is stopped
+
+        Raises:
+            DeadlineExceededError: Raised if the deadline expires during the search.
+
+        Returns:
+            tuple | None: returns the improved solution & the index of the replaced sequence, or None (if no sequence can be replaced)
+
+        """
+        applied: list[ops] = []
+        try:
+            for op in solution[:begin]:
+                _check_deadline(deadline)
+                cube.perform(op, unshuffling=True)
+                applied.append(op)
+
+            for start in range(begin, len(solution) - window + 1):
+                _check_deadline(deadline)
+                sequence = solution[start:start + window]
+                for op in sequence:
+                    cube.perform(op, unshuffling=True)
+                target = state_key(cube)
+                for op in reversed(sequence):
+                    cube.perform(INVERSE_OP_MAPPING[op], unshuffling=True)
+
+                for depth in range(window):
+                    replacement = self._search(cube, depth, target, deadline)
+                    if replacement is not None:
+                        return simplify(solution[:start] + replacement + solution[start + window:]), max(0, start - window)
+
+                cube.perform(solution[start], unshuffling=True)
+                applied.append(solution[start])
+        finally:
+            for op in reversed(applied):
+                cube.perform(INVERSE_OP_MAPPING[op], unshuffling=True)
+
+        return None
+
+    def _search(self, cube: RubiksCube, depth: int, target: Optional[bytes] = None, deadline: Optional[float] = None) -> Optional[list[ops]]:
+        """
+        This method performs a depth-limited search for a sequence of operations that solves the rubiks cube instance
+        (or leaves it in the target state). The transposition table is only used when searching for a solution.
+
+        Args:
+            cube (RubiksCube): Rubiks Cube instance to search from
+            depth (int): Maximum number of operations in the sequence
+            target (bytes, optional): State key of the state to reach. Defaults to None (solved state).
+            deadline (float, optional): time.monotonic() value after which the search is stopped. Defaults to None.
+
+        Raises:
+            DeadlineExceededError: Raised if the deadline expires during the search.
+
+        Returns:
+            list[Operations] | None: returns the sequence of operations or None (if none exists within depth operations)
+
+        """
+        table = self.table if target is None else None
+        path: list[ops] = []
+
+        def search(depth: int) -> bool:
+            self.nodes += 1
+            if deadline is not None and self.nodes % Solver.DEADLINE_CHECK_INTERVAL == 0 and time.monotonic() > deadline:
+                raise DeadlineExceededError
+
+            if is_solved(cube) if target is None else state_key(cube) == target:
+                return True
+            if depth == 0:
+                return False
+
+            last_ops = history(path)
+            if table is not None:
+                # The successors depend on the last operations, so they're part of the key
+                key = state_key(cube) + bytes(OP_CODES[op] + 1 if op else 0 for op in last_ops)
+                explored = table.probe(key)
+                if explored is not None and explored >= depth:
+                    return False
+
+            for op in self.successors[last_ops]:
+                cube.perform(op, unshuffling=True)
+                path.append(op)
+                try:
+                    found = search(depth - 1)
+                finally:
+                    cube.perform(INVERSE_OP_MAPPING[op], unshuffling=True)
+                if found:
+                    return True
+                path.pop()
+
+            if table is not None:
+                table.store(key, depth)
+            return False
+
+        return path if search(depth) else None
+
+
+def _check_deadline(deadline: float) -> None:
+    """
+    This function checks if a deadline has expired.
+
+    Args:
+        deadline (float): time.monotonic() value after which the search is stopped
+
+    Raises:
+        DeadlineExceededError: Raised if the deadline has expired.
+
+    """
+    if time.monotonic() > deadline:
+        raise DeadlineExceededError
+
+
+def simplify(sequence: list[ops]) -> list[ops]:
+    """
+    This function simplifies a sequence of operations by cancelling operations followed by their inverse and replacing
+    three consecutive identical operations by their inverse. The simplified sequence leaves the cube in the same state.
+
+    Args:
+        sequence (list[Operations]): Sequence of operations
+
+    Returns:
+        list[Operations]: Simplified sequence of operations
+
+    """
+    simplified: list[ops] = []
+    for op in sequence:
+        while op is not None:
+            if simplified and simplified[-1] == INVERSE_OP_MAPPING[op]:
+                simplified.pop()
+                op = None
+            elif len(simplified) >= 2 and simplified[-1] == simplified[-2] == op:
+                del simplified[-2:]
+                op = INVERSE_OP_MAPPING[op]
+            else:
+                simplified.append(op)
+                op = None
+
+    return simplified
@@ -0,0 +1,262 @@
+"""
+This module contains the shared-memory cube batches of the rubiks cube architecture, for fanning work out across
+multiprocessing workers. A SharedCubeBatch stores the colour code of every sticker of a batch of cubes in a (size, 54)
+uint8 array that lives in a multiprocessing.shared_memory segment. Workers attach to the segment by name through a
+small handle, so the cubes are never pickled: each worker reads & updates its own rows in place.
+
+    def simulate(handle, rows):
+        with SharedCubeBatch.attach(handle) as batch:
+            batch.shuffle(25, rows=rows)
+
+    with SharedCubeBatch(1_000_000) as batch, Pool(8) as pool:
+        pool.starmap(simulate, [(batch.handle, rows) for rows in batch.partition(8)])
+
+Operations are applied to whole blocks of rows at once with the stickers' permutation tables (see
+stickers.OP_PERMUTATIONS), either the same operations on every row or a different sequence of operation codes (see
+OP_CODES) per row. Rows hold no operation stack. Workers must only write to rows that no other worker touches.
+
+"""
+from __future__ import annotations
+import sys
+from multiprocessing.shared_memory import SharedMemory
+from typing import NamedTuple, Optional, Union
+from rubiks_cube.constants import Operations as ops, OP_CODES
+from rubiks_cube.errors import InvalidOperationError
+from rubiks_cube.models import RubiksCube, STICKER_PERMUTATIONS
+from rubiks_cube.operations import random_operations
+from rubiks_cube.stickers import NUM_STICKERS, SOLVED_STICKERS
+
+import numpy as np
+
+# Sticker permutation of every operation, indexed by operation code
+OP_TABLE = np.stack([STICKER_PERMUTATIONS[op] for op in OP_CODES])
+
+SOLVED_ROW = np.array(SOLVED_STICKERS, dtype=np.uint8)
+
+# Rows of a batch: a slice, or an array of row indices
+Rows = Union[slice, np.ndarray]
+
+
+class SharedBatchHandle(NamedTuple):
+
+    """
+    This is a class representing the handle that a worker attaches to a shared cube batch with. It only holds the name
+    & size of the batch, so it is cheap to pickle.
+
+    ATTRIBUTES:
+        name: Name of the shared memory segment
+        size: Number of cubes in the batch
+
+    """
+
+    name: str
+    size: int
+
+
+class SharedCubeBatch:
+
+    """
+    This is a class representing a batch of cubes stored in a shared memory segment.
+
+    ATTRIBUTES:
+        handle: Handle that other processes attach to the batch with
+        size: Number of cubes in the batch
+        stickers: (size, 54) array of the colour code of every sticker of every cube
+        owner: Flag indicating if the batch was created by this process (& is unlinked by it)
+
+    METHODS:
+        attach: Attaches to a batch created by another process
+        partition: Splits the batch's rows into disjoint blocks, e.g. one per worker
+        perform: Performs an operation on a block of rows
+        apply_codes: Performs sequences of operation codes on a block of rows
+        shuffle: Shuffles a block of rows by performing random operations
+        reset: Resets a block of rows to the solved cube
+        to_cube: Creates a cube from a row
+        close: Detaches the batch from this process
+        unlink: Destroys the shared memory segment
+
+    """
+
+    def __init__(self, size: int, name: Optional[str] = None, _memory: Optional[SharedMemory] = None) -> None:
+        """
+        Constructor method for the SharedCubeBatch class. A new segment is created, holding solved cubes in the default
+        perspective (batches created by other processes are attached with SharedCubeBatch.attach).
+
+        Args:
+            size (int): Number of cubes in the batch
+            name (str, optional): Name of the shared memory segment. Defaults to None (a unique name).
+
+        Raises:
+            ValueError: Raised if the size isn't positive.
+            FileExistsError: Raised if a segment with the same name already exists.
+
+        """
+        if size <= 0:
+            raise ValueError('Batch size must be positive')
+
+        self.owner = _memory is None
+        self._memory = SharedMemory(name, create=True, size=size * NUM_STICKERS) if self.owner else _memory
+        self.size = size
+        self.handle = SharedBatchHandle(self._memory.name, size)
+        self.stickers = np.ndarray((size, NUM_STICKERS), dtype=np.uint8, buffer=self._memory.buf)
+        if self.owner:
+            self.stickers[:] = SOLVED_ROW
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __enter__(self) -> SharedCubeBatch:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+        if self.owner:
+            self.unlink()
+
+    def __reduce__(self) -> tuple:
+        # Batches are passed to other processes by handle: the receiving process attaches to the same segment
+        return (SharedCubeBatch.attach, (self.handle,))
+
+    @classmethod
+    def attach(cls, handle: SharedBatchHandle) -> SharedCubeBatch:
+        """
+        This method attaches to a batch created by another process.
+
+        Args:
+            handle (SharedBatchHandle): Handle of the batch
+
+        Raises:
+            FileNotFoundError: Raised if the batch's segment doesn't exist (anymore).
+
+        Returns:
+            SharedCubeBatch: Batch backed by the same segment
+
+        """
+        # Only the creating process tracks the segment, so that attached processes exiting don't destroy it
+        kwargs = {'track': False} if sys.version_info >= (3, 13) else {}
+        return cls(handle.size, _memory=SharedMemory(handle.name, **kwargs))
+
+    def partition(self, num_parts: int) -> list[slice]:
+        """
+        This method splits the batch's rows into disjoint blocks of contiguous rows, as even in size as possible.
+
+        Args:
+            num_parts (int): Number of blocks
+
+        Raises:
+            ValueError: Raised if the number of blocks isn't positive.
+
+        Returns:
+            list[slice]: Rows of each block (empty blocks are left out)
+
+        """
+        if num_parts <= 0:
+            raise ValueError('Number of parts must be positive')
+
+        bounds = np.linspace(0, self.size, num_parts + 1).astype(int).tolist()
+        return [slice(start, stop) for start, stop in zip(bounds, bounds[1:]) if stop > start]
+
+    def perform(self, op: ops, rows: Rows = slice(None)) -> None:
+        """
+        This method performs an operation on every cube of a block of rows.
+
+        Args:
+            op (Operations): Enumerated operation constant indicating which operation is requested.
+            rows (slice | np.ndarray, optional): Rows of the cubes. Defaults to every row.
+
+        Raises:
+            InvalidOperationError: Raised if the operation requested is not a valid operation.
+
+        """
+        if op not in STICKER_PERMUTATIONS:
+            raise InvalidOperationError
+
+        self.stickers[rows] = self.stickers[rows][:, STICKER_PERMUTATIONS[op]]
+
+    def apply_codes(self, codes: np.ndarray, rows: Rows = slice(None)) -> None:
+        """
+        This method performs sequences of operations, given as operation codes (see OP_CODES), on a block of rows.
+
+        Args:
+            codes (np.ndarray): Operation codes, of shape (num_ops,) to perform the same sequence on every row, or of
+                                shape (num_rows, num_ops) to perform a sequence per row (e.g. a chunk of scrambles, see scrambles.generate_chunk)
+            rows (slice | np.ndarray, optional): Rows of the cubes. Defaults to every row.
+
+        Raises:
+            ValueError: Raised if the codes' shape doesn't match the rows.
+
+        """
+        codes = np.asarray(codes, dtype=np.intp)
+        block = self.stickers[rows]
+        if codes.ndim == 1:
+            for code in codes.tolist():
+                block = block[:, OP_TABLE[code]]
+        elif codes.ndim == 2 and len(codes) == len(block):
+            for step in range(codes.shape[1]):
+                block = np.take_along_axis(block, OP_TABLE[codes[:, step]], axis=1)
+        else:
+            raise ValueError('Operation codes must be of shape (num_ops,) or (num_rows, num_ops)')
+
+        self.stickers[rows] = block
+
+    def shuffle(self, num_ops: int, seed: Optional[Union[int, np.random.Generator]] = None, rows: Rows = slice(None), weights: Optional[dict[str, float]] = None) -> None:
+        """
+        This method shuffles every cube of a block of rows by performing its own sequence of randomly chosen operations
+        (see RubiksCube.shuffle).
+
+        Args:
+            num_ops (int): Number of operations performed on each cube
+            seed (int | np.random.Generator, optional): Seed or random number generator used to draw the operations. Defaults to None (unseeded).
+            rows (slice | np.ndarray, optional): Rows of the cubes. Defaults to every row.
+            weights (dict[str, float], optional): Relative weight of each category of operations. Defaults to SHUFFLE_WEIGHTS (see operations.py).
+
+        """
+        num_rows = len(self.stickers[rows])
+        rng = np.random.default_rng(seed)
+        self.apply_codes(random_operations(num_rows * num_ops, rng, weights).reshape(num_rows, num_ops), rows)
+
+    def reset(self, rows: Rows = slice(None)) -> None:
+        """
+        This method resets every cube of a block of rows to the solved cube, in the default perspective.
+
+        Args:
+            rows (slice | np.ndarray, optional): Rows of the cubes. Defaults to every row.
+
+        """
+        self.stickers[rows] = SOLVED_ROW
+
+    def to_cube(self, row: int, backend: str = 'array') -> RubiksCube:
+        """
+        This method creates a cube with the stickers of a row (see RubiksCube.from_array). The cube is a copy: it isn't
+        backed by the shared memory segment.
+
+        Args:
+            row (int): Row of the cube
+            backend (str, optional): Name of the cube's backend (see RubiksCube.__new__). Defaults to 'array'.
+
+        Raises:
+            CubeIntegrityError: Raised if the row's colours don't form the cubies of a rubiks cube.
+
+        Returns:
+            RubiksCube: New cube instance
+
+        """
+        return RubiksCube.from_array(self.stickers[row], backend=backend)
+
+    def close(self) -> None:
+        """
+        This method detaches the batch from this process. The batch can't be used afterwards, and views of its
+        stickers mustn't be kept alive past this call.
+
+        """
+        if self.stickers is not None:
+            self.stickers = None
+            self._memory.close()
+
+    def unlink(self) -> None:
+        """
+        This method destroys the shared memory segment (once every process has closed it). It should only be called by
+        the process that created the batch.
+
+        """
+        self._memory.unlink()
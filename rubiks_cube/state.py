@@ -0,0 +1,288 @@
+"""
+This module contains the immutable cube value type of the rubiks cube architecture. A CubeState is a persistent value:
+performing an operation never changes it, but returns a new state. States can therefore be shared across threads,
+cached or used as dictionary keys without locks or defensive copies, and any number of branches can be explored from
+the same state:
+
+    state = CubeState()
+    left = state.apply(Operations.SHIFT_TOP_ROW_LEFT)
+    right = state.apply(Operations.SHIFT_TOP_ROW_RIGHT)
+
+The stickers are held as a bitboard (see bitboard.py), a single int that is compact, immutable & hashed or compared
+in constant time. The operation stack is a persistent linked list of (operation, previous stack) cells, so a new state
+shares its whole history with the state it was derived from instead of copying it.
+
+"""
+from __future__ import annotations
+from typing import Iterable, Optional
+from rubiks_cube.bitboard import OP_SHIFTS, SOLVED_STATE, apply_shifts, pack, unpack
+from rubiks_cube.constants import Colours, Operations as ops, INVERSE_OP_MAPPING
+from rubiks_cube.errors import InvalidOperationError, OperationStackContentsError
+from rubiks_cube.models import RubiksCube, ARRAY_SHAPES
+from rubiks_cube.render import render_stickers
+from rubiks_cube.stickers import NUM_STICKERS
+
+import numpy as np
+
+# Persistent operation stack: None when empty, else the last operation & the rest of the stack
+History = Optional[tuple[ops, 'History']]
+
+
+class CubeState:
+
+    """
+    This is a class representing an immutable state of a rubiks cube: its stickers & its operation stack. States are
+    equal (& hash the same) when their stickers are, whatever operations led to them.
+
+    ATTRIBUTES:
+        state: Packed colour codes of every sticker (see bitboard.pack)
+        op_stack: Tuple of the operations that led to the state, as RubiksCube.op_stack
+
+    METHODS:
+        apply: Returns the state after an operation
+        apply_all: Returns the state after a sequence of operations
+        undo: Returns the state before the last operation of the operation stack
+        unshuffle: Returns the state after undoing every operation of the operation stack
+        as_array: Returns the colour code of every sticker
+        render: Renders the state's net
+        from_array: Creates a state from the colour code of every sticker
+        from_cube: Creates a state from a cube's stickers & operation stack
+        to_cube: Creates a mutable cube in the state
+
+    """
+
+    __slots__ = ('_state', '_history')
+
+    def __init__(self, state: int = SOLVED_STATE, history: History = None) -> None:
+        """
+        Constructor method for the CubeState class. Defaults to the solved cube, in the default perspective.
+
+        Args:
+            state (int, optional): Packed colour codes of every sticker. Defaults to SOLVED_STATE.
+            history (History, optional): Persistent operation stack. Defaults to None (empty).
+
+        """
+        object.__setattr__(self, '_state', state)
+        object.__setattr__(self, '_history', history)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError('CubeState is immutable')
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError('CubeState is immutable')
+
+    def __reduce__(self) -> tuple:
+        return (CubeState.from_array, (self.as_array(), self.op_stack))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CubeState):
+            return NotImplemented
+        return self._state == other._state
+
+    def __hash__(self) -> int:
+        return hash(self._state)
+
+    def __repr__(self) -> str:
+        return self.render()
+
+    @property
+    def state(self) -> int:
+        """
+        This property returns the state's packed colour codes (see bitboard.pack).
+
+        Returns:
+            int: Packed state
+
+        """
+        return self._state
+
+    @property
+    def op_stack(self) -> tuple[ops, ...]:
+        """
+        This property returns the operations that led to the state, oldest first (see RubiksCube.op_stack).
+
+        Returns:
+            tuple[Operations, ...]: Operation stack
+
+        """
+        operations = []
+        history = self._history
+        while history is not None:
+            op, history = history
+            operations.append(op)
+
+        return tuple(reversed(operations))
+
+    def apply(self, op: ops, unshuffling: bool = False) -> CubeState:
+        """
+        This method returns the state after performing an operation. The operation stack is updated as by
+        RubiksCube.perform: the operation is pushed, or the last operation is popped if it is the inverse one.
+
+        Args:
+            op (Operations): Enumerated operation constant indicating which operation is requested.
+            unshuffling (bool, optional): Flag indicating if the operation stack should be left as is. Defaults to False.
+
+        Raises:
+            InvalidOperationError: Raised if the operation requested is not a valid operation.
+
+        Returns:
+            CubeState: New state
+
+        """
+        shifts = OP_SHIFTS.get(op)
+        if shifts is None:
+            raise InvalidOperationError
+
+        history = self._history
+        if not unshuffling:
+            if history is not None and history[0] == INVERSE_OP_MAPPING[op]:
+                history = history[1]
+            else:
+                history = (op, history)
+
+        return CubeState(apply_shifts(self._state, shifts), history)
+
+    def apply_all(self, operations: Iterable[ops]) -> CubeState:
+        """
+        This method returns the state after performing a sequence of operations (see apply).
+
+        Args:
+            operations (Iterable[Operations]): Operations to be performed, in order
+
+        Raises:
+            InvalidOperationError: Raised if any of the operations is not a valid operation.
+
+        Returns:
+            CubeState: New state
+
+        """
+        state = self
+        for op in operations:
+            state = state.apply(op)
+
+        return state
+
+    def undo(self) -> CubeState:
+        """
+        This method returns the state before the last operation of the operation stack.
+
+        Raises:
+            OperationStackContentsError: Raised if the operation stack is empty.
+
+        Returns:
+            CubeState: New state
+
+        """
+        if self._history is None:
+            raise OperationStackContentsError('Cannot undo an operation of a cube with an empty operation stack.')
+
+        op, history = self._history
+        return CubeState(apply_shifts(self._state, OP_SHIFTS[INVERSE_OP_MAPPING[op]]), history)
+
+    def unshuffle(self) -> CubeState:
+        """
+        This method returns the state after undoing every operation of the operation stack (see RubiksCube.unshuffle).
+
+        Raises:
+            OperationStackContentsError: Raised if the operation stack is empty.
+
+        Returns:
+            CubeState: New state, with an empty operation stack
+
+        """
+        if self._history is None:
+            raise OperationStackContentsError('Cannot unshuffle a solved cube. Try to perform some operations before trying to unshuffle.')
+
+        state, history = self._state, self._history
+        while history is not None:
+            op, history = history
+            state = apply_shifts(state, OP_SHIFTS[INVERSE_OP_MAPPING[op]])
+
+        return CubeState(state)
+
+    def as_array(self) -> np.ndarray:
+        """
+        This method returns the colour code of every sticker (see RubiksCube.as_array).
+
+        Returns:
+            np.ndarray: New read-only uint8 array of the stickers' colour codes, of shape (54,)
+
+        """
+        stickers = np.array(unpack(self._state), dtype=np.uint8)
+        stickers.flags.writeable = False
+        return stickers
+
+    def render(self, ansi: bool = False) -> str:
+        """
+        This method renders the state's net (see RubiksCube.render).
+
+        Args:
+            ansi (bool, optional): Flag indicating if the pieces should be coloured with ANSI escape codes. Defaults to False.
+
+        Returns:
+            str: Rendered net of the state
+
+        """
+        return render_stickers(unpack(self._state), ansi)
+
+    @classmethod
+    def from_array(cls, array: np.ndarray, op_stack: Iterable[ops] = ()) -> CubeState:
+        """
+        This method creates a state from the colour code of every sticker (see RubiksCube.as_array).
+
+        Args:
+            array (np.ndarray): Colour code of every sticker, of shape (54,) or (6, 3, 3)
+            op_stack (Iterable[Operations], optional): Operation stack of the state. Defaults to () (empty).
+
+        Raises:
+            ValueError: Raised if the array's shape or colour codes aren't valid (see RubiksCube.from_array).
+
+        Returns:
+            CubeState: New state
+
+        """
+        array = np.asarray(array)
+        if array.shape not in ARRAY_SHAPES:
+            raise ValueError(f'Array shape must be one of {", ".join(map(str, ARRAY_SHAPES))}')
+        stickers = array.reshape(NUM_STICKERS).tolist()
+        if not all(code in range(len(Colours)) for code in stickers):
+            raise ValueError(f'Colour codes must be between 0 and {len(Colours) - 1}')
+
+        history: History = None
+        for op in op_stack:
+            history = (op, history)
+
+        return cls(pack(stickers), history)
+
+    @classmethod
+    def from_cube(cls, cube: RubiksCube) -> CubeState:
+        """
+        This method creates a state from a cube's stickers & operation stack. The cube can be changed afterwards without
+        affecting the state.
+
+        Args:
+            cube (RubiksCube): Cube instance of any backend
+
+        Returns:
+            CubeState: New state
+
+        """
+        return cls.from_array(cube.as_array(), cube.op_stack)
+
+    def to_cube(self, backend: str = 'object') -> RubiksCube:
+        """
+        This method creates a mutable cube in the state, with the same operation stack (see RubiksCube.from_array).
+
+        Args:
+            backend (str, optional): Name of the cube's backend (see RubiksCube.__new__). Defaults to 'object'.
+
+        Raises:
+            CubeIntegrityError: Raised if the state's colours don't form the cubies of a rubiks cube.
+
+        Returns:
+            RubiksCube: New cube instance
+
+        """
+        cube = RubiksCube.from_array(self.as_array(), backend=backend)
+        cube.op_stack = list(self.op_stack)
+        return cube
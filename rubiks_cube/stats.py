@@ -0,0 +1,148 @@
+"""
+This module contains the per-operation instrumentation of the rubiks cube architecture. Once enabled on a cube (see
+RubiksCube.enable_stats), every operation performed on it is counted and timed, and its latency is recorded in a
+histogram with one bucket per power of two nanoseconds. Stats can also be shared by several cubes, e.g. through the
+process-wide REGISTRY:
+
+    cube.enable_stats(registry=REGISTRY)
+    print(cube.stats())
+    print(REGISTRY)
+
+Instrumentation is off by default and costs nothing when disabled: the timed transform is only installed on the cubes
+that enable it, and is removed again by RubiksCube.disable_stats.
+
+"""
+from __future__ import annotations
+from typing import Optional
+from rubiks_cube.constants import Operations as ops
+
+# Number of latency buckets: bucket i counts latencies in [2 ** (i - 1), 2 ** i) nanoseconds (the last one is open)
+NUM_BUCKETS = 40
+
+
+class OperationStats:
+
+    """
+    This is a class representing the call counts & latency histograms of the operations performed on one or more cubes.
+
+    ATTRIBUTES:
+        counts: Number of times each operation was performed
+        total_ns: Total time spent performing each operation (nanoseconds)
+        histograms: Latency histogram of each operation (see NUM_BUCKETS)
+
+    METHODS:
+        record: Records that an operation was performed
+        reset: Clears every count & histogram
+        percentile: Estimates a latency percentile of an operation from its histogram
+        summary: Returns the stats of every operation performed, as a dictionary
+        format: Formats the stats of every operation performed as a table
+
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor method for the OperationStats class.
+
+        """
+        self.counts: dict[ops, int] = {}
+        self.total_ns: dict[ops, int] = {}
+        self.histograms: dict[ops, list[int]] = {}
+
+    def __repr__(self) -> str:
+        return self.format()
+
+    def record(self, op: ops, elapsed_ns: int) -> None:
+        """
+        This method records that an operation was performed.
+
+        Args:
+            op (Operations): Operation performed
+            elapsed_ns (int): Time taken (nanoseconds)
+
+        """
+        histogram = self.histograms.get(op)
+        if histogram is None:
+            histogram = self.histograms[op] = [0] * NUM_BUCKETS
+            self.counts[op] = 0
+            self.total_ns[op] = 0
+
+        self.counts[op] += 1
+        self.total_ns[op] += elapsed_ns
+        histogram[min(elapsed_ns.bit_length(), NUM_BUCKETS - 1)] += 1
+
+    def reset(self) -> None:
+        """
+        This method clears every count & histogram.
+
+        """
+        self.counts.clear()
+        self.total_ns.clear()
+        self.histograms.clear()
+
+    def percentile(self, op: ops, fraction: float) -> Optional[float]:
+        """
+        This method estimates a latency percentile of an operation, as the upper bound of the histogram bucket that it
+        falls in (so within a factor of two of the actual latency).
+
+        Args:
+            op (Operations): Operation
+            fraction (float): Percentile, between 0 and 1 (e.g. 0.99)
+
+        Returns:
+            float: Estimated latency (seconds), or None if the operation wasn't performed
+
+        """
+        histogram = self.histograms.get(op)
+        if histogram is None:
+            return None
+
+        target = fraction * self.counts[op]
+        seen = 0
+        for bucket, count in enumerate(histogram):
+            seen += count
+            if count and seen >= target:
+                return (1 << bucket) / 1e9
+
+        return (1 << (NUM_BUCKETS - 1)) / 1e9
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """
+        This method returns the stats of every operation performed.
+
+        Returns:
+            dict: Count, total & mean latency, estimated median & 99th percentile latency (seconds) of every operation
+                  performed, keyed by operation name
+
+        """
+        return {
+            op.name: {
+                'count': self.counts[op],
+                'total': self.total_ns[op] / 1e9,
+                'mean': self.total_ns[op] / self.counts[op] / 1e9,
+                'p50': self.percentile(op, 0.5),
+                'p99': self.percentile(op, 0.99)
+            }
+            for op in ops if op in self.counts
+        }
+
+    def format(self) -> str:
+        """
+        This method formats the stats of every operation performed as a table, slowest operations (in total) first.
+
+        Returns:
+            str: Formatted table
+
+        """
+        summary = self.summary()
+        lines = [f'{"Operation":<26} {"Count":>9} {"Total (s)":>11} {"Mean (us)":>10} {"p50 (us)":>9} {"p99 (us)":>9}']
+        for name, row in sorted(summary.items(), key=lambda item: item[1]['total'], reverse=True):
+            lines.append(
+                f'{name:<26} {row["count"]:>9} {row["total"]:>11.6f} {row["mean"] * 1e6:>10.2f} '
+                f'{row["p50"] * 1e6:>9.2f} {row["p99"] * 1e6:>9.2f}'
+            )
+
+        return '\n'.join(lines)
+
+
+# Process-wide registry that cubes can record their operations to (see RubiksCube.enable_stats)
+REGISTRY = OperationStats()
@@ -0,0 +1,218 @@
+"""
+This module defines the sticker layout of a rubiks cube within the rubiks cube architecture. The 54 stickers (pieces)
+of a cube are indexed face by face in the order of FACE_ORDER (front, left, right, top, opposite, bottom), and row by
+row within each face's grid, i.e. index = face * 9 + row * 3 + col. Indices always refer to the cube's current
+perspective.
+
+Every sticker is also given a position & outward normal in 3D space (x to the right, y to the top and z to the front
+of the cube), following the grid conventions of each face (see RubiksCube.define_cube). The corner & edge facelet
+tables are derived from these, grouping the stickers that belong to the same cubie, and so are the sticker
+permutations of every operation (each operation turns some layers of the cube about one of its axes).
+
+"""
+from __future__ import annotations
+from typing import Iterable, Sequence
+from rubiks_cube.constants import Colours, COLOUR_CODES, Operations as ops
+
+FRONT, LEFT, RIGHT, TOP, OPPOSITE, BOTTOM = range(6)
+
+NUM_STICKERS = 54
+
+FACE_NORMALS = {
+    FRONT: (0, 0, 1),
+    LEFT: (-1, 0, 0),
+    RIGHT: (1, 0, 0),
+    TOP: (0, 1, 0),
+    OPPOSITE: (0, 0, -1),
+    BOTTOM: (0, -1, 0)
+}
+
+X_AXIS, Y_AXIS, Z_AXIS = range(3)
+
+Vector = tuple[int, int, int]
+
+
+def sticker_index(face: int, row: int, col: int) -> int:
+    """
+    This function returns the index of the sticker at the given row & column of a face's grid.
+
+    Args:
+        face (int): Index of the face in the order of FACE_ORDER
+        row (int): Row of the sticker in the face's grid
+        col (int): Column of the sticker in the face's grid
+
+    Returns:
+        int: Index of the sticker
+
+    """
+    return face * 9 + row * 3 + col
+
+
+def sticker_position(face: int, row: int, col: int) -> Vector:
+    """
+    This function returns the position of the cubie that a sticker belongs to. Each coordinate is -1, 0 or 1.
+
+    Side faces have their top row towards the top face & are seen from the outside, the top face has its top row
+    towards the opposite face and the bottom face has its top row towards the front face.
+
+    Args:
+        face (int): Index of the face in the order of FACE_ORDER
+        row (int): Row of the sticker in the face's grid
+        col (int): Column of the sticker in the face's grid
+
+    Returns:
+        tuple[int, int, int]: Position of the sticker's cubie
+
+    """
+    if face == FRONT:
+        return (col - 1, 1 - row, 1)
+    if face == LEFT:
+        return (-1, 1 - row, col - 1)
+    if face == RIGHT:
+        return (1, 1 - row, 1 - col)
+    if face == OPPOSITE:
+        return (1 - col, 1 - row, -1)
+    if face == TOP:
+        return (col - 1, 1, row - 1)
+    return (col - 1, -1, 1 - row)
+
+
+def _cross(a: Vector, b: Vector) -> Vector:
+    return (a[1] * b[2] - a[2] * b[1], a[2] * b[0] - a[0] * b[2], a[0] * b[1] - a[1] * b[0])
+
+
+def _dot(a: Vector, b: Vector) -> int:
+    return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+
+
+STICKERS: list[tuple[Vector, Vector]] = [
+    (sticker_position(face, row, col), FACE_NORMALS[face])
+    for face in range(6)
+    for row in range(3)
+    for col in range(3)
+]
+
+
+def _build_facelets() -> tuple[list[tuple[int, int, int]], list[tuple[int, int]]]:
+    """
+    This function groups the stickers by cubie. Each corner's stickers are listed clockwise (seen from outside the cube),
+    starting with the sticker on the top or bottom face. Each edge's stickers start with the sticker on the top or bottom
+    face, or the sticker on the front or opposite face for edges in the middle layer.
+
+    Returns:
+        tuple: List of corner facelets & list of edge facelets
+
+    """
+    cubies: dict[Vector, list[int]] = {}
+    for index, (position, _) in enumerate(STICKERS):
+        cubies.setdefault(position, []).append(index)
+
+    corners = []
+    edges = []
+    for position, indices in cubies.items():
+        # Reference sticker is on the top/bottom face, or on the front/opposite face for middle layer edges
+        indices.sort(key=lambda index: (STICKERS[index][1][1] == 0, STICKERS[index][1][2] == 0))
+        if len(indices) == 3:
+            first, second, third = indices
+            if _dot(_cross(STICKERS[first][1], STICKERS[second][1]), position) > 0:
+                second, third = third, second
+            corners.append((first, second, third))
+        elif len(indices) == 2:
+            edges.append((indices[0], indices[1]))
+
+    return sorted(corners), sorted(edges)
+
+
+# Corner facelets: 8 triples of sticker indices, clockwise starting with the top/bottom sticker
+# Edge facelets: 12 pairs of sticker indices, starting with the reference sticker
+CORNER_FACELETS, EDGE_FACELETS = _build_facelets()
+
+CENTER_STICKERS = [sticker_index(face, 1, 1) for face in range(6)]
+
+# Colour of each face in the default perspective, in the order of FACE_ORDER
+DEFAULT_FACE_COLOURS = [Colours.BLUE, Colours.RED, Colours.ORANGE, Colours.WHITE, Colours.GREEN, Colours.YELLOW]
+
+# Colour codes (see COLOUR_CODES) of every sticker of a solved cube in the default perspective
+SOLVED_STICKERS = tuple(COLOUR_CODES[colour] for colour in DEFAULT_FACE_COLOURS for _ in range(9))
+
+# Maps each operation to the turn it performs: (axis, layers turned, number of counter-clockwise quarter turns)
+ALL_LAYERS = (-1, 0, 1)
+OP_TURNS = {
+    ops.ROTATE_UP: (X_AXIS, ALL_LAYERS, 3),
+    ops.ROTATE_DOWN: (X_AXIS, ALL_LAYERS, 1),
+    ops.ROTATE_LEFT_VERTICALLY: (Y_AXIS, ALL_LAYERS, 3),
+    ops.ROTATE_RIGHT_VERTICALLY: (Y_AXIS, ALL_LAYERS, 1),
+    ops.ROTATE_LEFT_HORIZONTALLY: (Z_AXIS, ALL_LAYERS, 1),
+    ops.ROTATE_RIGHT_HORIZONTALLY: (Z_AXIS, ALL_LAYERS, 3),
+    ops.INVERT_VERTICALLY: (Y_AXIS, ALL_LAYERS, 2),
+    ops.INVERT_HORIZONTALLY: (Z_AXIS, ALL_LAYERS, 2),
+    ops.SHIFT_RIGHT_COL_UP: (X_AXIS, (1,), 3),
+    ops.SHIFT_RIGHT_COL_DOWN: (X_AXIS, (1,), 1),
+    ops.SHIFT_LEFT_COL_UP: (X_AXIS, (-1,), 3),
+    ops.SHIFT_LEFT_COL_DOWN: (X_AXIS, (-1,), 1),
+    ops.SHIFT_TOP_ROW_LEFT: (Y_AXIS, (1,), 3),
+    ops.SHIFT_TOP_ROW_RIGHT: (Y_AXIS, (1,), 1),
+    ops.SHIFT_BOTTOM_ROW_LEFT: (Y_AXIS, (-1,), 3),
+    ops.SHIFT_BOTTOM_ROW_RIGHT: (Y_AXIS, (-1,), 1)
+}
+
+
+def _turn(vector: Vector, axis: int, quarter_turns: int) -> Vector:
+    turned = list(vector)
+    first, second = [(1, 2), (2, 0), (0, 1)][axis]
+    for _ in range(quarter_turns % 4):
+        turned[first], turned[second] = -turned[second], turned[first]
+    return tuple(turned)
+
+
+def turn_permutation(axis: int, layers: tuple[int, ...], quarter_turns: int) -> tuple[int, ...]:
+    """
+    This function computes the sticker permutation of a turn, i.e. after the turn the sticker at index i holds the piece
+    that was at index permutation[i] before it.
+
+    Args:
+        axis (int): Axis that the layers are turned about (X_AXIS, Y_AXIS or Z_AXIS)
+        layers (tuple[int, ...]): Coordinates (along the axis) of the layers being turned
+        quarter_turns (int): Number of counter-clockwise quarter turns, seen from the positive end of the axis
+
+    Returns:
+        tuple[int, ...]: Sticker permutation of the turn
+
+    """
+    lookup = {sticker: index for index, sticker in enumerate(STICKERS)}
+    permutation = list(range(NUM_STICKERS))
+    for index, (position, normal) in enumerate(STICKERS):
+        if position[axis] in layers:
+            permutation[lookup[(_turn(position, axis, quarter_turns), _turn(normal, axis, quarter_turns))]] = index
+
+    return tuple(permutation)
+
+
+# Sticker permutation of every operation (see turn_permutation)
+OP_PERMUTATIONS = {op: turn_permutation(*turn) for op, turn in OP_TURNS.items()}
+
+# Indices of the stickers whose piece changes with every operation
+OP_MOVED_STICKERS = {
+    op: tuple(index for index, source in enumerate(permutation) if index != source)
+    for op, permutation in OP_PERMUTATIONS.items()
+}
+
+
+def apply_operations(stickers: Sequence[int], operations: Iterable[ops]) -> list[int]:
+    """
+    This function applies a sequence of operations to the stickers of a cube, using the operations' sticker permutations
+    instead of a rubiks cube instance.
+
+    Args:
+        stickers (Sequence[int]): Value of every sticker in sticker order (e.g. SOLVED_STICKERS)
+        operations (Iterable[Operations]): Operations to be performed, in order
+
+    Returns:
+        list[int]: Values of the stickers once the operations have been performed
+
+    """
+    stickers = list(stickers)
+    for op in operations:
+        stickers = [stickers[source] for source in OP_PERMUTATIONS[op]]
+
+    return stickers
@@ -0,0 +1,277 @@
+"""
+This module contains the curses front end of the command line app. The cube's net stays on screen and, after every
+operation, only the stickers that the operation moved (see events.py) & that changed colour are repainted.
+
+Moves are performed with single keys, in standard cube notation (see notation.py): r, l, u, d, f, b, m, e, s, x, y & z
+turn clockwise and their upper case (shifted) keys turn counter-clockwise. The operation stack can also be replayed from
+the state it was started from, at thousands of moves per second, on the stickers' permutation tables instead of the cube.
+
+"""
+from __future__ import annotations
+import curses
+import time
+from typing import Optional
+from rubiks_cube.constants import Colours, COLOUR_CODES, Operations as ops, INVERSE_OP_MAPPING
+from rubiks_cube.errors import OperationStackContentsError
+from rubiks_cube.events import MoveEvent
+from rubiks_cube.models import RubiksCube
+from rubiks_cube.notation import MOVE_TABLE, to_operations
+from rubiks_cube.render import NET_TEMPLATE, STICKER_CELLS
+from rubiks_cube.stickers import NUM_STICKERS, OP_PERMUTATIONS, OP_MOVED_STICKERS, apply_operations
+
+# Maps each key to the move it performs
+KEY_MOVES = {
+    **{ord(key): key.upper() for key in 'rludfbmes'},
+    **{ord(key.upper()): f"{key.upper()}'" for key in 'rludfbmes'},
+    **{ord(key): key for key in 'xyz'},
+    **{ord(key.upper()): f"{key}'" for key in 'xyz'}
+}
+
+HELP = "Moves: r l u d f b m e s x y z (shift: inverse) | 1: shuffle  2: unshuffle  0: reset perspective  p: replay  q: quit"
+
+REPLAY_MOVES_PER_SECOND = 5000
+
+# Minimum time between two screen refreshes while replaying (seconds)
+FRAME_INTERVAL = 1 / 60
+
+COLOUR_INITIALS = [colour.value[0] for colour in Colours]
+
+
+class TerminalUI:
+
+    """
+    This is a class representing the curses front end of a rubiks cube instance. It subscribes to the cube's move events
+    and keeps a copy of the colour code of every sticker on screen, so that it only repaints the stickers whose colour
+    has changed.
+
+    ATTRIBUTES:
+        screen: Curses window the net is drawn in
+        cube: Rubiks cube instance being displayed
+        stickers: Colour code (see COLOUR_CODES) of every sticker on screen, in sticker order
+        attributes: Curses attributes used to paint each colour code
+        moves: Number of moves performed since the front end was started
+
+    METHODS:
+        draw: Draws the whole net & status lines
+        paint: Repaints the given stickers that have changed colour
+        on_move: Subscriber repainting the stickers moved by each operation
+        perform: Performs a move in standard notation
+        replay: Animates a sequence of operations
+        run: Runs the front end's key loop
+
+    """
+
+    def __init__(self, screen: curses.window, cube: Optional[RubiksCube] = None) -> None:
+        """
+        Constructor method for the TerminalUI class.
+
+        Args:
+            screen (curses.window): Curses window the net is drawn in
+            cube (RubiksCube, optional): Rubiks cube instance to be displayed. Defaults to None (a new cube).
+
+        """
+        self.screen = screen
+        self.cube = cube if cube is not None else RubiksCube()
+        self.stickers = self.cube_stickers()
+        self.attributes = self.init_colours()
+        self.moves = 0
+
+        self.cube.subscribe(self.on_move)
+
+    def init_colours(self) -> list[int]:
+        """
+        This method sets up a curses colour pair for each colour of the cube (orange falls back to magenta on terminals
+        with fewer than 256 colours).
+
+        Returns:
+            list[int]: Curses attributes used to paint each colour code
+
+        """
+        if not curses.has_colors():
+            return [curses.A_BOLD] * len(Colours)
+
+        curses.start_color()
+        orange = 208 if curses.COLORS >= 256 else curses.COLOR_MAGENTA
+        foregrounds = {
+            Colours.BLUE: curses.COLOR_BLUE,
+            Colours.RED: curses.COLOR_RED,
+            Colours.ORANGE: orange,
+            Colours.WHITE: curses.COLOR_WHITE,
+            Colours.GREEN: curses.COLOR_GREEN,
+            Colours.YELLOW: curses.COLOR_YELLOW
+        }
+
+        attributes = []
+        for colour in Colours:
+            pair = COLOUR_CODES[colour] + 1
+            curses.init_pair(pair, foregrounds[colour], curses.COLOR_BLACK)
+            attributes.append(curses.color_pair(pair) | curses.A_BOLD)
+
+        return attributes
+
+    def cube_stickers(self) -> list[int]:
+        """
+        This method reads the colour code of every sticker of the cube.
+
+        Returns:
+            list[int]: Colour code of every sticker, in sticker order
+
+        """
+        return self.cube.as_array().tolist()
+
+    def draw(self, status: str = '') -> None:
+        """
+        This method draws the whole net & status lines.
+
+        Args:
+            status (str, optional): Message displayed below the net. Defaults to ''.
+
+        """
+        self.screen.erase()
+        for line, text in enumerate(NET_TEMPLATE.format(*([' '] * NUM_STICKERS)).split('\n')):
+            self.screen.addstr(line, 0, text)
+        for index, code in enumerate(self.stickers):
+            line, column = STICKER_CELLS[index]
+            self.screen.addstr(line, column, COLOUR_INITIALS[code], self.attributes[code])
+        self.status(status)
+
+    def status(self, message: str = '') -> None:
+        """
+        This method updates the status lines below the net.
+
+        Args:
+            message (str, optional): Message displayed below the net. Defaults to ''.
+
+        """
+        line = STICKER_CELLS[-1][0] + 3
+        for offset, text in enumerate((f'Moves: {self.moves}  Stack: {len(self.cube.op_stack)}  {message}', HELP)):
+            self.screen.move(line + offset, 0)
+            self.screen.clrtoeol()
+            self.screen.addnstr(line + offset, 0, text, max(curses.COLS - 1, 0))
+
+    def paint(self, positions: tuple[int, ...], stickers: list[int]) -> None:
+        """
+        This method repaints the given stickers, skipping the ones whose colour hasn't changed.
+
+        Args:
+            positions (tuple[int, ...]): Indices of the stickers that may have changed
+            stickers (list[int]): New colour code of every sticker, in sticker order (see RubiksCube.as_array)
+
+        """
+        for index in positions:
+            code = stickers[index]
+            if code != self.stickers[index]:
+                self.stickers[index] = code
+                line, column = STICKER_CELLS[index]
+                self.screen.addstr(line, column, COLOUR_INITIALS[code], self.attributes[code])
+
+    def on_move(self, event: MoveEvent) -> None:
+        """
+        This method is a subscriber that repaints the stickers moved by each operation performed on the cube.
+
+        Args:
+            event (MoveEvent): Move event sent by the cube
+
+        """
+        self.paint(event.positions, event.cube.as_array().tolist())
+
+    def perform(self, move: str) -> None:
+        """
+        This method performs a move in standard notation on the cube.
+
+        Args:
+            move (str): Move in standard notation (see notation.py)
+
+        """
+        for op in to_operations(MOVE_TABLE[move]):
+            self.cube.perform(op)
+        self.moves += 1
+        self.status(move)
+
+    def replay(self, operations: list[ops], moves_per_second: int = REPLAY_MOVES_PER_SECOND) -> None:
+        """
+        This method animates a sequence of operations, starting from the state that the cube was in before they were
+        performed. The stickers are permuted with the operations' permutation tables and the screen is refreshed once per
+        frame. Any key stops the replay.
+
+        Args:
+            operations (list[Operations]): Operations that have been performed on the cube, in order
+            moves_per_second (int, optional): Speed of the replay. Defaults to REPLAY_MOVES_PER_SECOND.
+
+        """
+        final = self.stickers
+        stickers = apply_operations(final, [INVERSE_OP_MAPPING[op] for op in reversed(operations)])
+        self.stickers = list(stickers)
+        self.draw('Replaying...')
+        self.screen.refresh()
+
+        self.screen.nodelay(True)
+        start = last_frame = time.perf_counter()
+        try:
+            for count, op in enumerate(operations, start=1):
+                stickers = [stickers[source] for source in OP_PERMUTATIONS[op]]
+                self.paint(OP_MOVED_STICKERS[op], stickers)
+
+                now = time.perf_counter()
+                ahead = start + count / moves_per_second - now
+                if ahead > 0 or now - last_frame >= FRAME_INTERVAL:
+                    self.status(f'Replaying... {count}/{len(operations)}')
+                    self.screen.refresh()
+                    last_frame = now
+                    if self.screen.getch() != -1:
+                        break
+                    if ahead > 0:
+                        time.sleep(ahead)
+        finally:
+            self.screen.nodelay(False)
+
+        self.stickers = final
+        self.draw(f'Replayed {len(operations)} moves in {time.perf_counter() - start:.3f}s')
+
+    def run(self) -> None:
+        """
+        This method runs the front end's key loop until 'q' is pressed.
+
+        """
+        curses.curs_set(0)
+        self.draw()
+        while True:
+            self.screen.refresh()
+            key = self.screen.getch()
+            if key == ord('q'):
+                break
+
+            if key in KEY_MOVES:
+                self.perform(KEY_MOVES[key])
+            elif key == ord('1'):
+                try:
+                    self.cube.shuffle()
+                    self.status('Shuffled')
+                except OperationStackContentsError:
+                    self.status('Unshuffle the cube before shuffling it again')
+            elif key == ord('2'):
+                try:
+                    self.cube.unshuffle()
+                    self.stickers = self.cube_stickers()
+                    self.draw('Unshuffled')
+                except OperationStackContentsError:
+                    self.status('Cannot unshuffle a solved cube')
+            elif key == ord('0'):
+                self.cube.reset_perspective()
+                self.status('Perspective reset')
+            elif key == ord('p'):
+                self.replay(list(self.cube.op_stack))
+            elif key == curses.KEY_RESIZE:
+                self.draw()
+
+
+def main(screen: curses.window, cube: Optional[RubiksCube] = None) -> None:
+    """
+    This function runs the curses front end (to be called through curses.wrapper).
+
+    Args:
+        screen (curses.window): Curses window provided by curses.wrapper
+        cube (RubiksCube, optional): Rubiks cube instance to be displayed. Defaults to None (a new cube).
+
+    """
+    TerminalUI(screen, cube).run()
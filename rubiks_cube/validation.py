@@ -0,0 +1,188 @@
+"""
+This module contains the state validator of the rubiks cube architecture. States are arrays of the colour code of
+every sticker (see RubiksCube.as_array), and whole batches of them are checked at once with array operations on the
+facelet tables (see stickers.py). Each state is given a set of flags, one for every check it fails:
+
+1. COLOUR_COUNTS: Every colour is on exactly 9 stickers
+2. CENTERS: The center stickers match one of the cube's 24 perspectives
+3. CUBIES: Every corner & edge has the colours of a distinct cubie of the cube
+4. PARITY: Corner & edge permutations have the same parity
+5. TWIST: Corner twists add up to a multiple of 3
+6. FLIP: Edge flips add up to a multiple of 2
+
+States passing the first three checks can be built (see RubiksCube.from_array), and states passing all six can also be
+reached (and solved) with the cube's operations. Checks 4 to 6 are only made on states passing the first three.
+
+Validation is cheap enough to run on every imported state, or after every operation in debug mode:
+
+    cube.subscribe(validate_move)
+
+"""
+from __future__ import annotations
+from rubiks_cube.constants import Colours
+from rubiks_cube.errors import CubeIntegrityError
+from rubiks_cube.events import MoveEvent
+from rubiks_cube.models import PERSPECTIVE_ROTATIONS
+from rubiks_cube.stickers import NUM_STICKERS, TOP, BOTTOM, CORNER_FACELETS, EDGE_FACELETS, CENTER_STICKERS
+
+import numpy as np
+
+COLOUR_COUNTS, CENTERS, CUBIES, PARITY, TWIST, FLIP = (1 << check for check in range(6))
+
+CHECK_MESSAGES = {
+    COLOUR_COUNTS: 'Every colour must be on exactly 9 stickers',
+    CENTERS: "Center stickers don't match any perspective of the cube",
+    CUBIES: "Corners & edges don't have the colours of distinct cubies",
+    PARITY: 'Corner & edge permutations must have the same parity',
+    TWIST: 'Corner twists must add up to a multiple of 3',
+    FLIP: 'Edge flips must add up to a multiple of 2'
+}
+
+NUM_COLOURS = len(Colours)
+
+CORNERS = np.array(CORNER_FACELETS, dtype=np.intp)
+EDGES = np.array(EDGE_FACELETS, dtype=np.intp)
+CENTER_INDICES = np.array(CENTER_STICKERS, dtype=np.intp)
+
+# Edges are flipped if their reference sticker (see stickers.EDGE_FACELETS) doesn't have the edge's colour of the
+# lowest rank, ranking the faces top/bottom first, then front/opposite, then left/right
+FACE_RANKS = np.array([1, 2, 2, 0, 1, 0], dtype=np.int64)
+
+# Colour codes are clipped to INVALID_CODE, so that out of range codes fail the checks without breaking the lookups
+INVALID_CODE = NUM_COLOURS
+
+# Flag of every combination of center colour codes (encoded in base 7) indicating if it matches a perspective
+_CENTER_WEIGHTS = (INVALID_CODE + 1) ** np.arange(6, dtype=np.int64)
+PERSPECTIVE_CENTERS = np.zeros((INVALID_CODE + 1) ** 6, dtype=bool)
+PERSPECTIVE_CENTERS[[int(np.dot(centers, _CENTER_WEIGHTS)) for centers in PERSPECTIVE_ROTATIONS]] = True
+
+# Pairs of positions (i < j) compared to count the inversions of corner & edge permutations
+_CORNER_PAIRS = np.triu_indices(len(CORNERS), 1)
+_EDGE_PAIRS = np.triu_indices(len(EDGES), 1)
+
+
+def _parities(permutations: np.ndarray, pairs: tuple[np.ndarray, np.ndarray]) -> np.ndarray:
+    """
+    This function returns the parity of each permutation in a batch (see scrambles.permutation_parities).
+
+    """
+    return (permutations[:, pairs[0]] > permutations[:, pairs[1]]).sum(axis=1) & 1
+
+
+def _cubie_permutations(bits: np.ndarray, center_bits: np.ndarray, facelets: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    This function identifies the cubie in each slot by its set of colours (as bitmasks), matching it with the slot
+    whose centers have the same colours.
+
+    Returns:
+        tuple: Flag of each state indicating if its cubies are distinct & valid, and the home slot of the cubie in each slot
+
+    """
+    # Colours are distinct powers of two, so sums are the same as unions (and repeated colours never give a valid mask)
+    masks = bits[:, facelets].sum(axis=2)
+    homes = center_bits[:, facelets // 9].sum(axis=2)
+    matches = masks[:, :, None] == homes[:, None, :]
+    valid = (matches.sum(axis=2) == 1).all(axis=1) & (matches.sum(axis=1) == 1).all(axis=1)
+    return valid, matches.argmax(axis=2)
+
+
+def validate_states(states: np.ndarray) -> np.ndarray:
+    """
+    This function checks a batch of states.
+
+    Args:
+        states (np.ndarray): Colour codes of every sticker of each state, of shape (n, 54), (n, 6, 3, 3), (54,) or (6, 3, 3)
+
+    Raises:
+        ValueError: Raised if the array's shape isn't valid.
+
+    Returns:
+        np.ndarray: uint8 flags of the checks failed by each state (0 if it is valid), of shape (n,) (or () for a single state)
+
+    """
+    states = np.asarray(states)
+    single = states.shape in ((NUM_STICKERS,), (6, 3, 3))
+    if not single and states.shape[1:] not in ((NUM_STICKERS,), (6, 3, 3)):
+        raise ValueError('States must be of shape (n, 54) or (n, 6, 3, 3)')
+    states = np.minimum(states.reshape(-1, NUM_STICKERS), INVALID_CODE).astype(np.int64)
+    flags = np.zeros(len(states), dtype=np.uint8)
+
+    counts = (states[:, :, None] == np.arange(NUM_COLOURS)).sum(axis=1)
+    flags[~(counts == 9).all(axis=1)] |= COLOUR_COUNTS
+
+    centers = states[:, CENTER_INDICES]
+    centers_valid = PERSPECTIVE_CENTERS[centers @ _CENTER_WEIGHTS]
+    flags[~centers_valid] |= CENTERS
+
+    # Cubies are identified relative to the centers, so they are only checked on states with valid centers
+    bits = np.left_shift(1, states)
+    center_bits = bits[:, CENTER_INDICES]
+    corners_valid, corner_homes = _cubie_permutations(bits, center_bits, CORNERS)
+    edges_valid, edge_homes = _cubie_permutations(bits, center_bits, EDGES)
+    cubies_valid = corners_valid & edges_valid
+    flags[centers_valid & ~cubies_valid] |= CUBIES
+
+    checked = centers_valid & cubies_valid
+    flags[checked & (_parities(corner_homes, _CORNER_PAIRS) != _parities(edge_homes, _EDGE_PAIRS))] |= PARITY
+
+    corner_colours = states[:, CORNERS]
+    on_top_or_bottom = (corner_colours == centers[:, TOP, None, None]) | (corner_colours == centers[:, BOTTOM, None, None])
+    flags[checked & (on_top_or_bottom.argmax(axis=2).sum(axis=1) % 3 != 0)] |= TWIST
+
+    rows = np.arange(len(states))[:, None]
+    colour_ranks = np.zeros((len(states), INVALID_CODE + 1), dtype=np.int64)
+    colour_ranks[rows, centers] = FACE_RANKS
+    edge_ranks = colour_ranks[rows[:, :, None], states[:, EDGES]]
+    flags[checked & ((edge_ranks[:, :, 0] > edge_ranks[:, :, 1]).sum(axis=1) % 2 != 0)] |= FLIP
+
+    return flags[0] if single else flags
+
+
+def describe(flags: int) -> list[str]:
+    """
+    This function describes the checks failed by a state.
+
+    Args:
+        flags (int): Flags of the checks failed by the state (see validate_states)
+
+    Returns:
+        list[str]: Message of every check failed
+
+    """
+    return [message for check, message in CHECK_MESSAGES.items() if flags & check]
+
+
+def check_state(state: np.ndarray, checks: int = COLOUR_COUNTS | CENTERS | CUBIES | PARITY | TWIST | FLIP) -> None:
+    """
+    This function checks a single state.
+
+    Args:
+        state (np.ndarray): Colour code of every sticker, of shape (54,) or (6, 3, 3)
+        checks (int, optional): Flags of the checks to be made. Defaults to every check.
+
+    Raises:
+        ValueError: Raised if the array's shape isn't valid.
+        CubeIntegrityError: Raised if the state fails any of the checks.
+
+    """
+    if np.shape(state) not in ((NUM_STICKERS,), (6, 3, 3)):
+        raise ValueError('State must be of shape (54,) or (6, 3, 3)')
+
+    failed = int(validate_states(state)) & checks
+    if failed:
+        raise CubeIntegrityError('. '.join(describe(failed)))
+
+
+def validate_move(event: MoveEvent) -> None:
+    """
+    This function is a subscriber that checks the cube's state after every operation (see RubiksCube.subscribe), to be
+    used in debug mode.
+
+    Args:
+        event (MoveEvent): Move event sent by the cube
+
+    Raises:
+        CubeIntegrityError: Raised if the cube's state isn't valid after the operation.
+
+    """
+    check_state(event.cube.as_array())
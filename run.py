@@ -2,16 +2,19 @@
 This module launches the command line app for generating, manipulating & visualizing a rubiks cube built on the architecture defined in this project.
 
 """
+import argparse
+import os
+import sys
 from typing import Union
+import rubiks_cube
+from rubiks_cube.constants import BATCH_OUTPUTS
 from rubiks_cube.errors import InvalidOperationError
 from rubiks_cube import (
-    cube, 
     menu_options, 
     rotate_options, 
     invert_options, 
     shift_options, 
     shuffle_options,
-    menu_options_funcs,
     rotate_options_params,
     invert_options_params,
     shift_options_params
@@ -22,10 +25,13 @@ def main():
     print('Command Line App Starting Up')
     print('########################################')
     print('BUILDING RUBIKS CUBE...\n')
+
+    cube = rubiks_cube.cube
+    menu_options_funcs = rubiks_cube.menu_options_funcs
     
     while True:
         
-        print(f'{cube}\n')
+        print(f'{cube.render(ansi=sys.stdout.isatty())}\n')
         
         main_response = run_menu('Main Menu', menu_options, True)
         if main_response is None:
@@ -107,6 +113,9 @@ def main():
                             continue
                         menu_options_funcs[main_response](num_ops)
                         break
+                elif shuffle_response == 2:
+                    menu_options_funcs[main_response](random_state=True)
+                    break
                 else:
                     print('\nInvalid input. Please input a valid choice.\n')
                     continue
@@ -154,5 +163,99 @@ def run_menu(title: str, options: list[str], is_main=False) -> Union[int, str, N
     return idx_chosen
 
 
+def batch(script_path: str, outputs: list[str]) -> None:
+    """
+    This function runs the app in batch mode, reading move scripts from a file or stdin (see batch.py).
+
+    Args:
+        script_path (str): Path of the move script ('-' for stdin)
+        outputs (list[str]): Outputs to be printed for each session
+
+    """
+    from rubiks_cube.batch import run_batch
+
+    try:
+        if script_path == '-':
+            run_batch(sys.stdin, outputs, sys.stdout)
+        else:
+            with open(script_path) as script:
+                run_batch(script, outputs, sys.stdout)
+    except BrokenPipeError:
+        # Output was closed early (e.g. piped into head), so the rest of the output is discarded
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    except (OSError, InvalidOperationError) as error:
+        sys.exit(f'Batch mode error: {error}')
+
+
+def profile(backend: str) -> None:
+    """
+    This function prints the allocation report of every operation (see allocations.py).
+
+    Args:
+        backend (str): Name of the profiled cube's backend
+
+    """
+    from rubiks_cube.allocations import profile_allocations, format_report
+    from rubiks_cube.errors import BackendError
+
+    try:
+        print(format_report(profile_allocations(backend)))
+    except BrokenPipeError:
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    except BackendError as error:
+        sys.exit(f'Profiler error: {error}')
+
+
+def fuzz(num_sequences: int) -> None:
+    """
+    This function fuzzes every fast engine against the object model across all CPUs (see fuzz.py), printing the
+    minimized reproducer of every divergence found. The app exits with status 1 if any engine diverged.
+
+    Args:
+        num_sequences (int): Number of random sequences of operations to be checked
+
+    """
+    from rubiks_cube.fuzz import fuzz as run_fuzz
+
+    result = run_fuzz(num_sequences, workers=os.cpu_count() or 1, progress=lambda checked: print(f'\rChecked {checked}/{num_sequences} sequences', end='', file=sys.stderr))
+    print(file=sys.stderr)
+    print(f'{result.sequences} sequences ({result.steps} steps) checked, {len(result.divergences)} divergent engines')
+    for divergence in result.divergences:
+        print(f"\n{divergence.candidate} diverges after: {' '.join(op.name for op in divergence.operations)}")
+        print(f'Expected:\n{divergence.expected}\nActual:\n{divergence.actual}')
+    if result.divergences:
+        sys.exit(1)
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    This function parses the app's command line arguments. Only light modules are imported before the arguments are
+    parsed, so that short-lived runs (e.g. --help) don't load numpy or build a cube.
+
+    Returns:
+        argparse.Namespace: Parsed arguments
+
+    """
+    parser = argparse.ArgumentParser(description='Command line app for generating, manipulating & visualizing a rubiks cube.')
+    parser.add_argument('--tui', action='store_true', help='run the curses front end instead of the menus')
+    parser.add_argument('--batch', metavar='SCRIPT', help="run the move script non-interactively ('-' for stdin), one session per line")
+    parser.add_argument('--output', action='append', choices=BATCH_OUTPUTS, help='output printed for each session in batch mode (repeatable, defaults to state)')
+    parser.add_argument('--profile-allocations', nargs='?', const='object', metavar='BACKEND', help='print the memory allocated by each operation & the functions allocating it (backend defaults to object)')
+    parser.add_argument('--fuzz', type=int, metavar='SEQUENCES', help='check the fast engines against the object model with random sequences of operations')
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
-    main()
+    args = parse_args()
+    if args.fuzz:
+        fuzz(args.fuzz)
+    elif args.profile_allocations:
+        profile(args.profile_allocations)
+    elif args.batch:
+        batch(args.batch, args.output or ['state'])
+    elif args.tui:
+        import curses
+        from rubiks_cube.tui import main as tui_main
+        curses.wrapper(tui_main)
+    else:
+        main()
@@ -0,0 +1,153 @@
+"""
+Conformance tests of the cube backends (see backends.py): every backend must behave exactly as the object model does.
+
+"""
+import pickle
+
+import numpy as np
+import pytest
+
+from rubiks_cube.constants import Operations as ops
+from rubiks_cube.errors import InvalidOperationError
+from rubiks_cube.helper import state_key
+from rubiks_cube.models import RubiksCube, DEFAULT_CENTERS
+from rubiks_cube.operations import Rotations as rotate, Inversions as invert, Shifts as shift
+from rubiks_cube.predicates import is_solved
+
+REFERENCE = 'object'
+BACKENDS = ['array', 'bitboard']
+
+SCRAMBLE = [ops.SHIFT_RIGHT_COL_UP, ops.SHIFT_TOP_ROW_LEFT, ops.ROTATE_UP, ops.SHIFT_BOTTOM_ROW_RIGHT, ops.INVERT_VERTICALLY, ops.SHIFT_LEFT_COL_DOWN]
+
+
+def assert_same(cube: RubiksCube, reference: RubiksCube) -> None:
+    assert cube.as_array().tolist() == reference.as_array().tolist()
+    assert cube.render() == reference.render()
+    assert cube.op_stack == reference.op_stack
+
+
+def scrambled(backend: str) -> RubiksCube:
+    cube = RubiksCube(backend=backend)
+    for op in SCRAMBLE:
+        cube.perform(op)
+    return cube
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request) -> str:
+    return request.param
+
+
+def test_backend_class(backend):
+    cube = RubiksCube(backend=backend)
+    assert cube.backend == backend
+    assert is_solved(cube)
+    assert_same(cube, RubiksCube(backend=REFERENCE))
+
+
+@pytest.mark.parametrize('method, op', [('rotate', op) for op in rotate.rotations] + [('invert', op) for op in invert.inversions] + [('shift', op) for op in shift.shifts])
+def test_operations(backend, method, op):
+    cube, reference = scrambled(backend), scrambled(REFERENCE)
+    getattr(cube, method)(op)
+    getattr(reference, method)(op)
+    assert_same(cube, reference)
+
+
+@pytest.mark.parametrize('method, op', [('rotate', ops.SHIFT_TOP_ROW_LEFT), ('invert', ops.ROTATE_UP), ('shift', ops.INVERT_VERTICALLY)])
+def test_invalid_operations(backend, method, op):
+    with pytest.raises(InvalidOperationError):
+        getattr(RubiksCube(backend=backend), method)(op)
+
+
+def test_seeded_shuffle(backend):
+    cube, reference = RubiksCube(backend=backend), RubiksCube(backend=REFERENCE)
+    cube.shuffle(num_ops=60, seed=7)
+    reference.shuffle(num_ops=60, seed=7)
+    assert_same(cube, reference)
+
+    cube.unshuffle()
+    reference.unshuffle()
+    assert_same(cube, reference)
+    assert is_solved(cube) and cube.as_array()[4::9].tolist() == DEFAULT_CENTERS
+
+
+def test_random_state_shuffle(backend):
+    cube, reference = RubiksCube(backend=backend), RubiksCube(backend=REFERENCE)
+    cube.shuffle(seed=3, random_state=True)
+    reference.shuffle(seed=3, random_state=True)
+    assert_same(cube, reference)
+    assert not cube.op_stack
+
+    cube.shift(ops.SHIFT_TOP_ROW_LEFT)
+    reference.shift(ops.SHIFT_TOP_ROW_LEFT)
+    cube.unshuffle()
+    reference.unshuffle()
+    assert_same(cube, reference)
+    assert is_solved(cube)
+
+
+def test_reset_perspective(backend):
+    cube, reference = scrambled(backend), scrambled(REFERENCE)
+    cube.reset_perspective()
+    reference.reset_perspective()
+    assert_same(cube, reference)
+    assert cube.as_array()[4::9].tolist() == DEFAULT_CENTERS
+
+
+def test_as_array(backend):
+    cube = scrambled(backend)
+    view = cube.as_array()
+    assert view.dtype == np.uint8 and not view.flags.writeable
+    assert cube.as_array((6, 3, 3)).reshape(-1).tolist() == view.tolist()
+    with pytest.raises(ValueError):
+        cube.as_array((9, 6))
+
+
+def test_bitboard_as_array_snapshot():
+    cube = RubiksCube(backend='bitboard')
+    snapshot = cube.as_array()
+    solved = snapshot.tolist()
+    cube.perform(ops.SHIFT_TOP_ROW_LEFT)
+    assert snapshot.tolist() == solved
+    assert cube.as_array().tolist() != solved
+
+
+def test_state_key(backend):
+    cube, reference = scrambled(backend), scrambled(REFERENCE)
+    assert (state_key(cube) == state_key(reference)) == (backend != 'bitboard')
+    key = state_key(cube)
+    cube.perform(ops.SHIFT_TOP_ROW_LEFT)
+    assert state_key(cube) != key
+    cube.perform(ops.SHIFT_TOP_ROW_RIGHT)
+    assert state_key(cube) == key
+
+
+def test_from_array(backend):
+    reference = scrambled(REFERENCE)
+    cube = RubiksCube.from_array(reference.as_array(), backend=backend)
+    assert cube.backend == backend
+    assert cube.as_array().tolist() == reference.as_array().tolist()
+    assert cube.render() == reference.render()
+    assert not cube.op_stack
+
+
+def test_pickle(backend):
+    cube = scrambled(backend)
+    loaded = pickle.loads(pickle.dumps(cube))
+    assert type(loaded) is type(cube)
+    assert_same(loaded, cube)
+
+    loaded.unshuffle()
+    assert is_solved(loaded)
+
+
+def test_pickle_random_state(backend):
+    cube = RubiksCube(backend=backend)
+    cube.shuffle(seed=11, random_state=True)
+    cube.rotate(ops.ROTATE_LEFT_VERTICALLY)
+    loaded = pickle.loads(pickle.dumps(cube))
+    assert_same(loaded, cube)
+
+    cube.unshuffle()
+    loaded.unshuffle()
+    assert_same(loaded, cube)
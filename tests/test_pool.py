@@ -0,0 +1,55 @@
+"""
+Tests of the cube pool (see pool.py): handles must behave as the object model does, and released handles must not
+reach the rows they used to own.
+
+"""
+import pytest
+
+from rubiks_cube.constants import Operations as ops
+from rubiks_cube.errors import PoolError
+from rubiks_cube.models import RubiksCube
+from rubiks_cube.pool import CubePool, RELEASED_ROW
+
+
+def test_operations():
+    pool = CubePool(2)
+    cube, reference = pool.allocate(), RubiksCube()
+    for op in [ops.SHIFT_RIGHT_COL_UP, ops.ROTATE_UP, ops.INVERT_VERTICALLY]:
+        cube.perform(op)
+        reference.perform(op)
+    assert cube.as_array().tolist() == reference.as_array().tolist()
+    assert cube.op_stack == reference.op_stack
+
+
+def test_as_array_is_a_copy():
+    pool = CubePool(1)
+    cube = pool.allocate()
+    stickers = cube.as_array()
+    solved = stickers.tolist()
+    cube.perform(ops.SHIFT_TOP_ROW_LEFT)
+    assert stickers.tolist() == solved
+    assert not stickers.flags.writeable
+
+
+def test_released_handle():
+    pool = CubePool(1)
+    cube = pool.allocate()
+    cube.release()
+    assert cube.row == RELEASED_ROW
+    other = pool.allocate()
+    with pytest.raises(PoolError):
+        cube.as_array()
+    with pytest.raises(PoolError):
+        cube.perform(ops.SHIFT_TOP_ROW_LEFT)
+    with pytest.raises(PoolError):
+        cube.release()
+    assert other.as_array().tolist() == RubiksCube().as_array().tolist()
+
+
+def test_context_manager():
+    pool = CubePool(1)
+    with pool.allocate() as cube:
+        cube.release()
+    with pool.allocate() as cube:
+        cube.perform(ops.ROTATE_UP)
+    assert len(pool) == 0
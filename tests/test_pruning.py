@@ -0,0 +1,63 @@
+"""
+Tests of the move-pruning tables (see pruning.py): pruning redundant sequences must keep every state reachable at its
+optimal depth.
+
+"""
+import pytest
+
+from rubiks_cube.constants import Operations as ops, INVERSE_OP_MAPPING
+from rubiks_cube.operations import Shifts as shift
+from rubiks_cube.pruning import build_successor_table, successors
+from rubiks_cube.stickers import OP_PERMUTATIONS, SOLVED_STICKERS
+
+DEPTH = 4
+
+
+def turn(stickers: tuple, op: ops) -> tuple:
+    return tuple(stickers[source] for source in OP_PERMUTATIONS[op])
+
+
+def optimal_depths(moves: list, depth: int) -> dict:
+    depths = {SOLVED_STICKERS: 0}
+    frontier = [SOLVED_STICKERS]
+    for level in range(1, depth + 1):
+        next_frontier = []
+        for stickers in frontier:
+            for op in moves:
+                state = turn(stickers, op)
+                if state not in depths:
+                    depths[state] = level
+                    next_frontier.append(state)
+        frontier = next_frontier
+    return depths
+
+
+def canonical_depths(moves: list, depth: int) -> dict:
+    table = build_successor_table(moves)
+    depths = {SOLVED_STICKERS: 0}
+    frontier = {(SOLVED_STICKERS, (None, None))}
+    for level in range(1, depth + 1):
+        next_frontier = set()
+        for stickers, history in frontier:
+            for op in table[history]:
+                state = turn(stickers, op)
+                depths.setdefault(state, level)
+                next_frontier.add((state, (history[1], op)))
+        frontier = next_frontier
+    return depths
+
+
+@pytest.mark.parametrize('moves', [list(ops), list(shift.shifts)], ids=['all', 'shifts'])
+def test_every_state_reachable_at_optimal_depth(moves):
+    assert canonical_depths(moves, DEPTH) == optimal_depths(moves, DEPTH)
+
+
+def test_no_operation_followed_by_its_inverse():
+    for (_, last), following in build_successor_table().items():
+        if last is not None:
+            assert INVERSE_OP_MAPPING[last] not in following
+
+
+def test_successors():
+    assert successors([]) == tuple(ops)
+    assert ops.SHIFT_TOP_ROW_RIGHT not in successors([ops.SHIFT_TOP_ROW_LEFT])
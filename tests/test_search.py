@@ -0,0 +1,49 @@
+"""
+Tests of the solver (see search.py): solutions must solve the cube, deadlines must be kept and the cube must be left
+unchanged.
+
+"""
+import time
+
+from rubiks_cube.constants import Operations as ops, INVERSE_OP_MAPPING
+from rubiks_cube.models import RubiksCube
+from rubiks_cube.predicates import is_solved
+from rubiks_cube.search import Solver
+
+
+def test_solve_within_keeps_deadline():
+    cube = RubiksCube(backend='array')
+    cube.shuffle(20000, seed=1)
+    stickers, op_stack = cube.as_array().tolist(), list(cube.op_stack)
+
+    start = time.perf_counter()
+    Solver().solve_within(cube, 0.2)
+    assert time.perf_counter() - start < 1.0
+    assert cube.as_array().tolist() == stickers
+    assert cube.op_stack == op_stack
+
+
+def test_solutions_solve_the_cube():
+    cube = RubiksCube()
+    for op in [ops.SHIFT_RIGHT_COL_UP, ops.SHIFT_TOP_ROW_LEFT, ops.SHIFT_BOTTOM_ROW_RIGHT]:
+        cube.perform(op)
+
+    solution = Solver().solve_within(cube, 1.0)
+    assert len(solution) == 3
+    for op in solution:
+        cube.perform(op)
+    assert cube.as_array().tolist() == RubiksCube().as_array().tolist()
+
+
+
+def test_random_state_shuffle_has_no_false_solution():
+    cube = RubiksCube()
+    cube.shuffle(random_state=True, seed=3)
+    cube.perform(ops.SHIFT_TOP_ROW_LEFT)
+
+    for solution in Solver().iter_solutions(cube, 0.2):
+        for op in solution:
+            cube.perform(op, unshuffling=True)
+        assert is_solved(cube)
+        for op in reversed(solution):
+            cube.perform(INVERSE_OP_MAPPING[op], unshuffling=True)
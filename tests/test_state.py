@@ -0,0 +1,38 @@
+"""
+Tests of the immutable cube states (see state.py).
+
+"""
+import pickle
+
+import numpy as np
+import pytest
+
+from rubiks_cube.constants import Operations as ops
+from rubiks_cube.models import RubiksCube
+from rubiks_cube.state import CubeState
+
+
+def test_matches_cube():
+    cube = RubiksCube()
+    state = CubeState()
+    for op in [ops.SHIFT_RIGHT_COL_UP, ops.ROTATE_UP, ops.INVERT_VERTICALLY]:
+        cube.perform(op)
+        state = state.apply(op)
+    assert state.as_array().tolist() == cube.as_array().tolist()
+    assert list(state.op_stack) == cube.op_stack
+    assert CubeState.from_cube(cube) == state
+    assert pickle.loads(pickle.dumps(state)) == state
+
+
+def test_from_array_shapes():
+    stickers = RubiksCube().as_array()
+    assert CubeState.from_array(stickers.reshape(6, 3, 3)) == CubeState.from_array(stickers) == CubeState()
+    for shape in [(53,), (9, 6), (1, 54)]:
+        with pytest.raises(ValueError):
+            CubeState.from_array(np.zeros(shape, dtype=np.uint8))
+
+
+@pytest.mark.parametrize('code', [-1, 6, 7, 9])
+def test_from_array_colour_codes(code):
+    with pytest.raises(ValueError):
+        CubeState.from_array([code] + [0] * 53)
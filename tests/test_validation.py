@@ -0,0 +1,91 @@
+"""
+Tests of the state validator (see validation.py): reachable states must pass every check, and a single corner twist,
+edge flip or swap must be flagged by exactly the matching check.
+
+"""
+import numpy as np
+import pytest
+
+from rubiks_cube.constants import Operations as ops
+from rubiks_cube.errors import CubeIntegrityError
+from rubiks_cube.models import RubiksCube
+from rubiks_cube.scrambles import iter_scrambles
+from rubiks_cube.stickers import CORNER_FACELETS, EDGE_FACELETS, SOLVED_STICKERS, apply_operations
+from rubiks_cube.validation import COLOUR_COUNTS, CENTERS, PARITY, TWIST, FLIP, check_state, validate_states
+
+SOLVED = np.array(SOLVED_STICKERS, dtype=np.uint8)
+ALL_OPS = list(ops)
+
+
+def solved() -> np.ndarray:
+    return SOLVED.copy()
+
+
+def test_solved():
+    assert validate_states(SOLVED) == 0
+    assert validate_states(SOLVED.reshape(6, 3, 3)) == 0
+    check_state(SOLVED)
+
+
+def test_random_walks():
+    walks = next(iter_scrambles(200, seed=7, num_ops=30))
+    states = np.array([apply_operations(SOLVED_STICKERS, [ALL_OPS[code] for code in walk]) for walk in walks])
+    assert not validate_states(states).any()
+
+
+def test_random_states():
+    states = next(iter_scrambles(200, seed=7, kind='state'))
+    assert not validate_states(states).any()
+
+
+@pytest.mark.parametrize('backend', ['object', 'array', 'bitboard'])
+def test_shuffled_cube(backend):
+    cube = RubiksCube(backend=backend)
+    cube.shuffle(50, seed=1)
+    assert validate_states(cube.as_array()) == 0
+
+
+def test_corner_twist():
+    state = solved()
+    corner = list(CORNER_FACELETS[0])
+    state[corner] = state[corner[1:] + corner[:1]]
+    assert validate_states(state) == TWIST
+
+
+def test_edge_flip():
+    state = solved()
+    edge = list(EDGE_FACELETS[0])
+    state[edge] = state[edge[::-1]]
+    assert validate_states(state) == FLIP
+
+
+def test_corner_swap():
+    state = solved()
+    first, second = list(CORNER_FACELETS[0]), list(CORNER_FACELETS[1])
+    state[first], state[second] = SOLVED[second], SOLVED[first]
+    assert validate_states(state) == PARITY
+
+
+def test_edge_swap():
+    state = solved()
+    first, second = list(EDGE_FACELETS[0]), list(EDGE_FACELETS[1])
+    state[first], state[second] = SOLVED[second], SOLVED[first]
+    assert validate_states(state) == PARITY
+
+
+def test_broken_stickers():
+    state = solved()
+    state[0] = state[9 + 4]
+    assert validate_states(state) & COLOUR_COUNTS
+    state = solved()
+    state[[4, 13]] = state[[13, 4]]
+    assert validate_states(state) & CENTERS
+    with pytest.raises(CubeIntegrityError):
+        check_state(state)
+
+
+def test_batch():
+    state = solved()
+    edge = list(EDGE_FACELETS[0])
+    state[edge] = state[edge[::-1]]
+    assert validate_states(np.stack([SOLVED, state, SOLVED])).tolist() == [0, FLIP, 0]